@@ -3,7 +3,10 @@ import json
 import os
 import subprocess
 import tempfile
+import threading
 import time
+import math
+from collections import deque
 from datetime import datetime, date
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QLabel, QDialog, QVBoxLayout, QListWidget,
@@ -12,10 +15,11 @@ from PySide6.QtWidgets import (
     QListWidgetItem, QScrollArea, QSplitter, QFrame, QGroupBox, QFormLayout,
     QInputDialog, QFileDialog, QSpinBox, QDoubleSpinBox
 )
-from PySide6.QtGui import QImage, QPixmap, QPainter, QColor, QFont, QFontMetrics, QIcon, QFontDatabase, QBrush
+from PySide6.QtGui import QImage, QPixmap, QPainter, QColor, QFont, QFontMetrics, QIcon, QFontDatabase, QBrush, QRegion
 from PySide6.QtCore import Qt, QTimer, QPoint, QPointF, QRect, QBuffer, QIODevice, QMutex, QMutexLocker, Signal, QUrl
 from PySide6.QtOpenGLWidgets import QOpenGLWidget
 import cv2
+import numpy as np
 import pytz
 import certifi
 try:
@@ -28,7 +32,7 @@ try:
     import psutil
 except ImportError:
     psutil = None
-from widget_manager import WidgetManager, WIDGET_CLASSES
+from widget_manager import WidgetManager, WIDGET_CLASSES, FETCH_CACHE
 import web_server
 import calendar
 
@@ -37,6 +41,15 @@ os.environ.setdefault("SSL_CERT_FILE", certifi.where())
 os.environ.setdefault("REQUESTS_CA_BUNDLE", certifi.where())
 
 CONFIG_FILE = "config.json"
+# Preview frames keep being captured this long after the last snapshot request.
+PREVIEW_DEMAND_SECONDS = 15
+PREVIEW_FRAME_MAX_AGE_SECONDS = 1.0
+PREVIEW_FIRST_FRAME_WAIT_SECONDS = 1.5
+PREVIEW_DEFAULT_WIDTH = 1280
+PREVIEW_MIN_WIDTH = 160
+PREVIEW_DEFAULT_QUALITY = 70
+# How long the settings dialog waits for the startup camera probe before listing what it has.
+CAMERA_PROBE_WAIT_SECONDS = 10
 
 THEME_PRESETS = {
     "Default": {
@@ -205,6 +218,385 @@ class OpenCvMediaBackend(BaseMediaBackend):
         return self.fps
 
 
+class FrameTransformPipeline:
+    """Precomputed mirror/rotation/brightness/blur chain for background frames.
+
+    Built once per combination of the relevant config values and reused for
+    every frame. Intermediate arrays are preallocated and only reallocated when
+    the source frame size changes; the final BGR->RGB conversion writes straight
+    into the returned QImage.
+
+    When a render target is given, the frame is first shrunk to the size it will
+    be shown at (and cropped for "fill"), so brightness, blur and colour
+    conversion run on display-sized pixels instead of the full source.
+    """
+
+    # (mirror, rotation) -> fused ops equivalent to a horizontal flip followed by the rotation.
+    ORIENTATION_OPS = {
+        (False, 0): (),
+        (False, 1): (("rotate", cv2.ROTATE_90_CLOCKWISE),),
+        (False, 2): (("flip", -1),),
+        (False, 3): (("rotate", cv2.ROTATE_90_COUNTERCLOCKWISE),),
+        (True, 0): (("flip", 1),),
+        (True, 1): (("transpose", None), ("flip", -1)),
+        (True, 2): (("flip", 0),),
+        (True, 3): (("transpose", None),),
+    }
+    # Kernels at least this large are blurred on a pyramid level and scaled back up.
+    PYRAMID_BLUR_KERNEL = 15
+
+    def __init__(self, mirror=False, rotation=0, brightness=1.0, blur=0, render_target=None):
+        self.signature = (bool(mirror), int(rotation) % 4, float(brightness), int(blur), render_target)
+        self.orientation_ops = self.ORIENTATION_OPS[(self.signature[0], self.signature[1])]
+        self.render_target = render_target
+        self.brightness_lut = None
+        if abs(brightness - 1.0) > 0.01:
+            # Same rounding as cv2.convertScaleAbs, which computes in float32.
+            alpha = np.float32(max(0.1, brightness))
+            self.brightness_lut = np.clip(np.rint(np.arange(256, dtype=np.float32) * alpha), 0, 255).astype(np.uint8)
+        self.blur = max(0, int(blur))
+        self._buffers = {}
+
+    @staticmethod
+    def signature_from_config(config):
+        return (
+            bool(config.get("mirror_video", False)),
+            int(config.get("video_rotation", 0) or 0) % 4,
+            float(config.get("background_brightness", 1.0) or 1.0),
+            int(config.get("background_blur", 0) or 0),
+        )
+
+    @classmethod
+    def from_config(cls, config, render_target=None):
+        return cls(*cls.signature_from_config(config), render_target=render_target)
+
+    @staticmethod
+    def odd_kernel(size):
+        size = int(size)
+        return size if size % 2 else size + 1
+
+    def _buffer(self, name, shape):
+        buf = self._buffers.get(name)
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, np.uint8)
+            self._buffers[name] = buf
+        return buf
+
+    def _downscale(self, frame):
+        """Resize to the render target before orientation; returns (frame, scale, crop)."""
+        target_w, target_h, fit_mode, crop_x, crop_y = self.render_target
+        src_h, src_w = frame.shape[:2]
+        swapped = self.signature[1] % 2 == 1
+        oriented_w, oriented_h = (src_h, src_w) if swapped else (src_w, src_h)
+        if fit_mode == "fit":
+            scale = min(target_w / oriented_w, target_h / oriented_h)
+        else:
+            scale = max(target_w / oriented_w, target_h / oriented_h)
+        if scale >= 0.999:
+            # Never upscale here; Qt scales small sources at paint time as before.
+            return frame, 1.0, None
+        scaled_w = max(1, int(round(oriented_w * scale)))
+        scaled_h = max(1, int(round(oriented_h * scale)))
+        crop = None
+        if fit_mode != "fit":
+            scaled_w, scaled_h = max(scaled_w, target_w), max(scaled_h, target_h)
+            src_x = int((scaled_w - target_w) * max(0.0, min(1.0, crop_x)))
+            src_y = int((scaled_h - target_h) * max(0.0, min(1.0, crop_y)))
+            crop = (src_x, src_y, target_w, target_h)
+        dsize = (scaled_h, scaled_w) if swapped else (scaled_w, scaled_h)
+        dst = self._buffer("resize", (dsize[1], dsize[0]) + frame.shape[2:])
+        cv2.resize(frame, dsize, dst=dst, interpolation=cv2.INTER_AREA)
+        return dst, scale, crop
+
+    def _blur(self, frame, kernel):
+        if kernel < self.PYRAMID_BLUR_KERNEL:
+            dst = self._buffer("blur", frame.shape)
+            cv2.GaussianBlur(frame, (kernel, kernel), 0, dst=dst)
+            return dst
+        # Each pyramid level halves the image, so the kernel halves with it.
+        level_frame = frame
+        levels = 0
+        while kernel >= self.PYRAMID_BLUR_KERNEL and min(level_frame.shape[:2]) >= 32:
+            h, w = level_frame.shape[:2]
+            dst = self._buffer(f"pyramid{levels}", ((h + 1) // 2, (w + 1) // 2) + frame.shape[2:])
+            cv2.pyrDown(level_frame, dst=dst)
+            level_frame = dst
+            kernel = self.odd_kernel(kernel // 2)
+            levels += 1
+        blurred = self._buffer("pyramid_blur", level_frame.shape)
+        cv2.GaussianBlur(level_frame, (kernel, kernel), 0, dst=blurred)
+        dst = self._buffer("blur", frame.shape)
+        cv2.resize(blurred, (frame.shape[1], frame.shape[0]), dst=dst, interpolation=cv2.INTER_LINEAR)
+        return dst
+
+    def process(self, frame):
+        scale, crop = 1.0, None
+        if self.render_target is not None:
+            frame, scale, crop = self._downscale(frame)
+        for idx, (op, arg) in enumerate(self.orientation_ops):
+            if op == "flip":
+                dst = self._buffer(f"orient{idx}", frame.shape)
+                cv2.flip(frame, arg, dst=dst)
+            else:
+                dst = self._buffer(f"orient{idx}", (frame.shape[1], frame.shape[0]) + frame.shape[2:])
+                if op == "rotate":
+                    cv2.rotate(frame, arg, dst=dst)
+                else:
+                    cv2.transpose(frame, dst=dst)
+            frame = dst
+        if crop is not None:
+            x, y, w, h = crop
+            frame = frame[y:y + h, x:x + w]
+        if self.brightness_lut is not None:
+            dst = self._buffer("brightness", frame.shape)
+            cv2.LUT(frame, self.brightness_lut, dst=dst)
+            frame = dst
+        if self.blur:
+            # Blur strength is defined in source pixels, so shrink it along with the frame.
+            kernel = self.odd_kernel(max(1, round(self.blur * scale)))
+            if self.render_target is None:
+                dst = self._buffer("blur", frame.shape)
+                cv2.GaussianBlur(frame, (kernel, kernel), 0, dst=dst)
+                frame = dst
+            elif kernel > 1:
+                frame = self._blur(frame, kernel)
+
+        h, w = frame.shape[:2]
+        # A fresh QImage per frame: the GUI thread may still hold the previous one.
+        image = QImage(w, h, QImage.Format.Format_RGB888)
+        stride = image.bytesPerLine()
+        target = np.frombuffer(image.bits(), np.uint8, count=stride * h).reshape(h, stride)[:, :w * 3].reshape(h, w, 3)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=target)
+        return image
+
+
+class TimingRing:
+    """Fixed-size ring of recent timings in milliseconds.
+
+    Each ring has a single writer thread, which stores a slot and bumps the
+    counter without locking. Readers copy the slots and may catch one sample
+    mid-update, which is harmless for p50/p95/max.
+    """
+
+    def __init__(self, size=240):
+        self.size = size
+        self.samples = [0.0] * size
+        self.count = 0
+
+    def record(self, ms):
+        self.samples[self.count % self.size] = ms
+        self.count += 1
+
+    def summary(self):
+        n = min(self.count, self.size)
+        if n == 0:
+            return None
+        values = sorted(self.samples[:n])
+        return {
+            "p50": round(values[n // 2], 3),
+            "p95": round(values[min(n - 1, int(n * 0.95))], 3),
+            "max": round(values[-1], 3),
+            "count": self.count,
+        }
+
+
+class RenderProfiler:
+    """Named TimingRings for the render hot path (capture, transform, upload, paint, widgets)."""
+
+    def __init__(self):
+        self.rings = {}
+
+    def record(self, name, seconds):
+        ring = self.rings.get(name)
+        if ring is None:
+            ring = self.rings.setdefault(name, TimingRing())
+        ring.record(seconds * 1000.0)
+
+    def summary(self):
+        result = {}
+        for name, ring in sorted(list(self.rings.items())):
+            stats = ring.summary()
+            if stats is not None:
+                result[name] = stats
+        return result
+
+
+class FramePacer:
+    """Source-clock pacing for the capture worker.
+
+    File and stream sources play against a wall clock anchored to the first
+    decoded frame's CAP_PROP_POS_MSEC. When decoding falls behind, whole frames
+    are grabbed without being processed; when the render rate outruns the
+    source, the tick keeps the frame already on screen instead of decoding.
+    Live cameras always take the newest frame.
+    """
+
+    # Further behind than this (a stall, a slow stream start) the clock is re-anchored instead.
+    MAX_CATCH_UP_MS = 2000.0
+    EMA_WEIGHT = 0.1
+
+    def __init__(self, source_fps, live=False):
+        self.live = live
+        self.frame_ms = 1000.0 / source_fps if source_fps > 0 else 0.0
+        self.clock_start = None
+        self.media_start_ms = 0.0
+        self.last_position_ms = None
+        self.pending_skip = 0
+        self.decode_ms = 0.0
+        self.process_ms = 0.0
+        self.frames_skipped = 0
+        self.frames_repeated = 0
+
+    def reset_clock(self):
+        self.clock_start = None
+        self.last_position_ms = None
+        self.pending_skip = 0
+
+    def record_decode(self, seconds):
+        self.decode_ms += (seconds * 1000.0 - self.decode_ms) * self.EMA_WEIGHT
+
+    def record_process(self, seconds):
+        self.process_ms += (seconds * 1000.0 - self.process_ms) * self.EMA_WEIGHT
+
+    def plan(self, now):
+        """Returns -1 to repeat the frame on screen, otherwise how many frames to skip before decoding."""
+        if self.live or self.frame_ms <= 0 or self.clock_start is None or self.last_position_ms is None:
+            return 0
+        media_now = self.media_start_ms + (now - self.clock_start) * 1000.0
+        next_ms = self.last_position_ms + self.frame_ms
+        if next_ms > media_now + self.frame_ms / 2:
+            self.frames_repeated += 1
+            return -1
+        behind = media_now - next_ms
+        if behind > self.MAX_CATCH_UP_MS:
+            self.reset_clock()
+            return 0
+        skip = max(0, int(behind // self.frame_ms))
+        self.frames_skipped += skip
+        self.pending_skip = skip
+        return skip
+
+    def frame_decoded(self, position_ms, now):
+        if self.live or self.frame_ms <= 0:
+            return
+        expected_ms = None if self.last_position_ms is None else self.last_position_ms + self.frame_ms * (1 + self.pending_skip)
+        self.pending_skip = 0
+        if expected_ms is not None and not (position_ms or 0.0) > self.last_position_ms:
+            # Some streams report no usable timestamps; assume a steady frame rate.
+            position_ms = expected_ms
+        if self.clock_start is None:
+            self.clock_start = now
+            self.media_start_ms = float(position_ms or 0.0)
+        self.last_position_ms = float(position_ms or 0.0)
+
+
+class OpenCvCaptureWorker:
+    """Reads and post-processes OpenCV frames off the GUI thread.
+
+    Only the newest processed QImage is kept; a frame the GUI has not taken yet
+    is dropped when a newer one arrives.
+    """
+
+    # Upper bound on frames grabbed in one tick to catch up with the source clock.
+    MAX_SKIP_PER_TICK = 8
+
+    def __init__(self, main_app, backend):
+        self.main_app = main_app
+        self.backend = backend
+        self._lock = threading.Lock()
+        self._latest_image = None
+        self._stop_event = threading.Event()
+        self._thread = None
+        self.frames_captured = 0
+        self.frames_dropped = 0
+        self.stream_ended = False
+        self.pacer = FramePacer(backend.get_fps(), live=backend.source_kind == "camera")
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="capture-worker")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=2.0):
+        self._stop_event.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def is_alive(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def take_latest_image(self):
+        with self._lock:
+            image = self._latest_image
+            self._latest_image = None
+        return image
+
+    def _publish(self, image):
+        with self._lock:
+            if self._latest_image is not None:
+                self.frames_dropped += 1
+            self._latest_image = image
+            self.frames_captured += 1
+
+    def _decode(self):
+        started = time.perf_counter()
+        frame = self.backend.get_frame()
+        if frame is not None:
+            elapsed = time.perf_counter() - started
+            self.pacer.record_decode(elapsed)
+            self.main_app.render_profiler.record("capture", elapsed)
+        return frame
+
+    def _read_frame(self, skip):
+        cap = self.backend.cap
+        source_kind = self.backend.source_kind
+        for _ in range(min(skip, self.MAX_SKIP_PER_TICK)):
+            if not cap or not cap.grab():
+                break
+        frame = self._decode()
+        if frame is None and source_kind in ("video", "youtube") and cap is not None:
+            # Loop video
+            cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            self.pacer.reset_clock()
+            frame = self._decode()
+            if frame is None and source_kind == "youtube":
+                # The GUI thread re-opens the stream once it sees this flag.
+                self.stream_ended = True
+        if frame is not None and cap is not None:
+            self.pacer.frame_decoded(cap.get(cv2.CAP_PROP_POS_MSEC), time.perf_counter())
+        return frame
+
+    def _tick(self):
+        skip = self.pacer.plan(time.perf_counter())
+        if skip < 0:
+            return
+        frame = self._read_frame(skip)
+        if frame is None:
+            return
+        started = time.perf_counter()
+        image = self.main_app.process_background_frame(frame)
+        elapsed = time.perf_counter() - started
+        self.pacer.record_process(elapsed)
+        self.main_app.render_profiler.record("transform", elapsed)
+        self._publish(image)
+
+    def _run(self):
+        try:
+            while not self._stop_event.is_set() and not self.stream_ended:
+                started = time.perf_counter()
+                # Never produce frames faster than the GUI manages to paint them.
+                interval = max(1.0 / self.main_app.get_paced_render_fps(), self.main_app.paint_time_ms / 1000.0)
+                try:
+                    self._tick()
+                except Exception as e:
+                    print(f"Capture worker error: {e}")
+                remaining = interval - (time.perf_counter() - started)
+                self._stop_event.wait(max(0.001, remaining))
+        finally:
+            # The capture is released here so it is never closed mid-read.
+            self.backend.stop()
+
+
 class QtVideoMediaBackend(BaseMediaBackend):
     backend_name = "qt"
 
@@ -214,7 +606,12 @@ class QtVideoMediaBackend(BaseMediaBackend):
         self.player = None
         self.audio = None
         self.video_sink = None
+        self.latest_frame = None
         self.latest_pixmap = QPixmap()
+        self.frame_serial = 0
+        self.shown_serial = 0
+        self.frames_received = 0
+        self.frames_converted = 0
 
     def start(self):
         if not (QMediaPlayer and QVideoSink):
@@ -235,10 +632,10 @@ class QtVideoMediaBackend(BaseMediaBackend):
     def _on_frame(self, frame):
         if not frame.isValid():
             return
-        image = frame.toImage()
-        if image.isNull():
-            return
-        self.latest_pixmap = QPixmap.fromImage(image)
+        # Keep only the (shared, ref-counted) frame handle; it is converted when the render tick shows it.
+        self.latest_frame = frame
+        self.frame_serial += 1
+        self.frames_received += 1
 
     def stop(self):
         if self.player is not None:
@@ -246,14 +643,28 @@ class QtVideoMediaBackend(BaseMediaBackend):
         self.player = None
         self.video_sink = None
         self.audio = None
+        self.latest_frame = None
         self.latest_pixmap = QPixmap()
 
     def is_open(self):
         return self.player is not None
 
+    def has_new_frame(self):
+        return self.frame_serial != self.shown_serial
+
     def get_pixmap(self):
+        if self.has_new_frame() and self.latest_frame is not None:
+            self.shown_serial = self.frame_serial
+            # toImage() goes through Qt's hardware-assisted conversion where the platform provides one.
+            image = self.latest_frame.toImage()
+            if not image.isNull():
+                self.latest_pixmap = QPixmap.fromImage(image)
+                self.frames_converted += 1
         return self.latest_pixmap
 
+    def get_frames_skipped(self):
+        return max(0, self.frames_received - self.frames_converted)
+
     def get_volume(self):
         return self.volume
 
@@ -273,7 +684,12 @@ class VideoLabel(QOpenGLWidget):
         self._pixmap = pixmap
         self.update()
 
+    def update_region(self, region):
+        # QOpenGLWidget always re-renders its whole framebuffer.
+        self.update()
+
     def paintGL(self):
+        started = time.perf_counter()
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
@@ -292,6 +708,7 @@ class VideoLabel(QOpenGLWidget):
 
         self.main_app.draw_widget_layer(painter)
         painter.end()
+        self.main_app.record_paint_time(time.perf_counter() - started)
 
 class GpuBackgroundWidget(QOpenGLWidget):
     def __init__(self, main_app, parent=None):
@@ -304,8 +721,18 @@ class GpuBackgroundWidget(QOpenGLWidget):
         self._pixmap = pixmap
         self.update()
 
+    def initializeGL(self):
+        context = self.context()
+        if context is None or not context.isValid():
+            QTimer.singleShot(0, lambda: self.main_app.fall_back_to_cpu_surface("OpenGL context unavailable"))
+
     def paintGL(self):
+        # The GL paint engine uploads each new frame pixmap as a texture and scales it on the GPU.
+        started = time.perf_counter()
         painter = QPainter(self)
+        if not painter.isActive():
+            QTimer.singleShot(0, lambda: self.main_app.fall_back_to_cpu_surface("OpenGL painter could not start"))
+            return
         painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
         bg = self.main_app.config.get("background_color", [0, 0, 0])
         background_color = QColor(bg[0], bg[1], bg[2])
@@ -317,6 +744,7 @@ class GpuBackgroundWidget(QOpenGLWidget):
             if opacity > 0:
                 painter.fillRect(self.rect(), QColor(0, 0, 0, int(opacity * 255)))
         painter.end()
+        self.main_app.record_paint_time(time.perf_counter() - started)
 
 class CpuVideoLabel(QLabel):
     def __init__(self, main_app, parent=None):
@@ -328,7 +756,11 @@ class CpuVideoLabel(QLabel):
         self._pixmap = pixmap
         self.update()
 
+    def update_region(self, region):
+        self.update(region)
+
     def paintEvent(self, event):
+        started = time.perf_counter()
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
@@ -342,7 +774,10 @@ class CpuVideoLabel(QLabel):
             opacity = self.main_app.config.get("background_opacity", 0.0)
             if opacity > 0:
                 painter.fillRect(self.rect(), QColor(0, 0, 0, int(opacity * 255)))
-        self.main_app.draw_widget_layer(painter)
+        # Partial updates (a single widget's damage) only need the widgets under the dirty rect.
+        self.main_app.draw_widget_layer(painter, event.rect() if event.rect() != self.rect() else None)
+        painter.end()
+        self.main_app.record_paint_time(time.perf_counter() - started)
 
 class OverlayWidget(QWidget):
     def __init__(self, main_app, parent=None):
@@ -357,6 +792,23 @@ class OverlayWidget(QWidget):
         self._cache_dirty = True
         self.update()
 
+    def invalidate_region(self, region):
+        if self._cache_dirty or self._overlay_cache.isNull():
+            self.invalidate_cache()
+            return
+        # Redraw only the damaged part of the cached overlay.
+        painter = QPainter(self._overlay_cache)
+        painter.setClipRegion(region)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        painter.fillRect(self.rect(), Qt.GlobalColor.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+        self.main_app.draw_widget_layer(painter, region.boundingRect())
+        painter.end()
+        self.update(region)
+
     def resizeEvent(self, event):
         self._cache_dirty = True
         super().resizeEvent(event)
@@ -393,6 +845,15 @@ class OverlayWidget(QWidget):
             painter.drawPixmap(0, 0, self._overlay_cache)
 
 class HybridRenderSurface(QWidget):
+    """GL background layer with a cached raster overlay for the widgets on top.
+
+    Video frames only repaint the background layer; the overlay cache is
+    rebuilt when widget text, layout or edit state changes.
+    """
+
+    # Background and widgets are composited separately, so widget damage never needs a frame repaint.
+    layered = True
+
     def __init__(self, main_app, parent=None):
         super().__init__(parent)
         self.main_app = main_app
@@ -402,6 +863,15 @@ class HybridRenderSurface(QWidget):
         self._pixmap = QPixmap()
         self.setAutoFillBackground(False)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        # QOpenGLWidget initializes on first show; give it a moment before judging the context.
+        QTimer.singleShot(1000, self.check_gl_context)
+
+    def check_gl_context(self):
+        if self.isVisible() and not self.background_widget.isValid():
+            self.main_app.fall_back_to_cpu_surface("OpenGL context could not be created")
+
     def resizeEvent(self, event):
         rect = self.rect()
         self.background_widget.setGeometry(rect)
@@ -412,13 +882,16 @@ class HybridRenderSurface(QWidget):
     def set_pixmap(self, pixmap):
         self._pixmap = pixmap
         self.background_widget.set_pixmap(pixmap)
-        self.overlay_widget.invalidate_cache()
 
     def update(self):
         self.overlay_widget.invalidate_cache()
         self.background_widget.update()
         super().update()
 
+    def update_region(self, region):
+        # Only the overlay changed; the background layer keeps its last frame.
+        self.overlay_widget.invalidate_region(region)
+
 class OnboardingDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -554,7 +1027,7 @@ class SettingsDialog(QDialog):
         self.background_mode_combo.addItem("YouTube")
         
         # Add available cameras
-        self.available_cameras = self.parent.detect_available_cameras()
+        self.available_cameras = self.parent.get_available_cameras(timeout=CAMERA_PROBE_WAIT_SECONDS)
         for i in self.available_cameras:
             self.background_mode_combo.addItem(f"Camera {i}")
 
@@ -637,6 +1110,11 @@ class SettingsDialog(QDialog):
         self.brightness_spin.valueChanged.connect(self.live_update_brightness)
         cam_layout.addRow("Brightness:", self.brightness_spin)
 
+        self.downscale_check = QCheckBox("Process at Display Resolution")
+        self.downscale_check.setChecked(self.config.get("background_downscale", True))
+        self.downscale_check.stateChanged.connect(self.live_update_downscale)
+        cam_layout.addRow("", self.downscale_check)
+
         self.volume_spin = QSpinBox()
         self.volume_spin.setRange(0, 100)
         self.volume_spin.setValue(int(self.config.get("background_volume", 0)))
@@ -676,6 +1154,11 @@ class SettingsDialog(QDialog):
         self.fps_combo.currentTextChanged.connect(self.live_update_fps)
         sys_layout.addRow("Render FPS:", self.fps_combo)
 
+        self.gpu_check = QCheckBox("GPU Compositor (OpenGL)")
+        self.gpu_check.setChecked(self.config.get("prefer_gpu_acceleration", False))
+        self.gpu_check.stateChanged.connect(self.live_update_gpu)
+        sys_layout.addRow("", self.gpu_check)
+
         self.low_power_check = QCheckBox("Low Power Mode")
         self.low_power_check.setChecked(self.config.get("low_power_mode", False))
         self.low_power_check.stateChanged.connect(self.live_update_low_power)
@@ -917,6 +1400,9 @@ class SettingsDialog(QDialog):
     def live_update_brightness(self, value):
         self.config["background_brightness"] = float(value)
 
+    def live_update_downscale(self, state):
+        self.config["background_downscale"] = self.downscale_check.isChecked()
+
     def live_update_background_volume(self, value):
         self.config["background_volume"] = int(value)
         if self.parent.media_backend is not None:
@@ -1003,6 +1489,10 @@ class SettingsDialog(QDialog):
         self.config["low_power_mode"] = self.low_power_check.isChecked()
         self.parent.apply_performance_settings()
 
+    def live_update_gpu(self, state):
+        self.config["prefer_gpu_acceleration"] = self.gpu_check.isChecked()
+        self.parent.ensure_render_surface()
+
     def live_update_auto_relaunch(self, state):
         self.config["auto_relaunch_on_crash"] = self.auto_relaunch_check.isChecked()
 
@@ -1071,6 +1561,9 @@ class SettingsDialog(QDialog):
         low = self.config.get("low_power_mode", False)
         mode = self.config.get("background_mode", "Camera")
         source_fps = getattr(self.parent, "source_fps", 0.0)
+        pacing = self.parent.get_frame_pacing_stats()
+        refresh = self.parent.widget_manager.scheduler.get_stats()
+        fetches = FETCH_CACHE.get_stats()
         cpu_line = f"CPU: {psutil.cpu_percent()}%" if psutil else "CPU: unavailable"
         mem_line = f"Memory: {psutil.virtual_memory().percent}%" if psutil else "Memory: unavailable"
         widget_lines = []
@@ -1095,6 +1588,17 @@ class SettingsDialog(QDialog):
             mem_line,
             f"Low Power Mode: {'ON' if low else 'OFF'}",
             f"Render Path: {self.parent.media_backend_name.upper()}",
+            f"Render Surface: {self.parent.render_surface_name.upper()}",
+            f"Frame Pacing: {pacing['achieved_fps']:.1f} / {pacing['target_fps']:.1f} fps (display {pacing['display_refresh_hz']:.0f} Hz)",
+            f"Dropped Frames: {pacing['frames_dropped']} (repeated {pacing['frames_repeated']})",
+            f"Frame Cost: decode {pacing['decode_ms']:.1f} ms, process {pacing['process_ms']:.1f} ms, paint {pacing['paint_ms']:.1f} ms",
+            f"Widget Refresh: {refresh['in_flight']} in flight, {refresh['queued']} queued, {refresh['workers']} workers",
+            f"HTTP Fetches: {fetches['requests_sent']} sent, {fetches['cache_hits'] + fetches['disk_hits']} cached, {fetches['coalesced']} shared, {fetches['not_modified']} not modified, {fetches['stale_served']} stale",
+            *self.parent.get_circuit_breaker_lines(),
+            *self.parent.get_web_server_lines(),
+            "",
+            "Render timings (p50 / p95 / max):",
+            *self.parent.get_render_timing_lines(),
             f"Active Page: {self.config.get('active_page', 'default')}",
             f"Web Management: {'ON' if self.config.get('web_server_enabled') else 'OFF'}",
             "",
@@ -2104,6 +2608,7 @@ class SettingsDialog(QDialog):
     def accept(self):
         self.save_current_widget_ui_to_config()
         self.parent.save_config()
+        self.parent.widget_manager.invalidate_render_caches()
         self.parent.widget_manager.restart_updates() # Restart updates only on save
         self.parent.restart_camera() # Ensure camera/background changes are applied
         super().accept()
@@ -2132,6 +2637,7 @@ class SettingsDialog(QDialog):
 
 class MagicMirrorApp(QMainWindow):
     remote_config_update_requested = Signal()
+    widget_repaint_requested = Signal(str, bool)
 
     def __init__(self):
         super().__init__()
@@ -2146,12 +2652,37 @@ class MagicMirrorApp(QMainWindow):
         self.error_message = ""
         self.config_mutex = QMutex()
         self.web_server = None
-        self.preview_image_data = None
-        self.preview_image_mutex = QMutex()
+        self.preview_frame_image = None
+        self.preview_frame_time = 0.0
+        # Encoded JPEGs of the current frame keyed by (width, quality); cleared on every capture.
+        self.preview_jpeg_cache = {}
+        self.preview_encode_lock = threading.Lock()
+        # Guards the preview frame and wakes /api/preview/stream clients when a new one is encoded.
+        self.preview_frame_ready = threading.Condition()
+        self.preview_frame_serial = 0
+        self.preview_viewers = 0
+        self.preview_last_requested = 0.0
         self.source_fps = 0.0
         self.media_backend = None
         self.media_backend_name = "none"
+        self.capture_worker = None
+        # Visibility rules have minute resolution, so flips are looked for once per minute.
+        self.visibility_checked_minute = None
+        self.visible_widget_names = None
+        self.frame_pipeline = None
+        self.background_render_target = None
+        self.background_scale_cache = None
+        self.static_background_key = None
+        self.render_surface_name = "cpu"
+        self.gpu_surface_failed = False
+        self.display_refresh_rate = 0.0
+        self.paint_time_ms = 0.0
+        # Wall-clock times of the last frames handed to the render surface (about two seconds at 60 fps).
+        self.displayed_frame_times = deque(maxlen=120)
+        self.render_profiler = RenderProfiler()
+        self.show_render_hud = False
         self.remote_config_update_requested.connect(self.apply_remote_config, Qt.ConnectionType.QueuedConnection)
+        self.widget_repaint_requested.connect(self.repaint_widget, Qt.ConnectionType.QueuedConnection)
         self.load_config()
 
         self.setWindowTitle("Magic Mirror")
@@ -2163,6 +2694,9 @@ class MagicMirrorApp(QMainWindow):
         self.setup_overlay()
         self.set_fullscreen(self.config.get("fullscreen", True))
         self.apply_performance_settings()
+        if self.windowHandle() is not None:
+            # Re-align frame pacing when the window moves to a display with another refresh rate.
+            self.windowHandle().screenChanged.connect(lambda _screen: self.apply_performance_settings())
         
         # Ticker timer
         self.ticker_timer = QTimer(self)
@@ -2170,10 +2704,19 @@ class MagicMirrorApp(QMainWindow):
         self.ticker_timer.timeout.connect(self.update_tickers)
         self.ticker_timer.start(30)
 
-        # Preview capture timer for thread-safe streaming
+        # Refreshes the frame-timing HUD while it is shown (F3)
+        self.render_hud_timer = QTimer(self)
+        self.render_hud_timer.timeout.connect(lambda: self.central_widget.update())
+
+        # Preview capture timer; runs with the web server and only grabs while a client is watching
         self.preview_capture_timer = QTimer(self)
         self.preview_capture_timer.timeout.connect(self.update_preview_image)
-        self.preview_capture_timer.start(100) # Capture at 10 FPS
+        self.preview_capture_timer.setInterval(200 if self.config.get("low_power_mode", False) else 100)
+
+        # Opening every camera index is slow, so it happens once off the UI thread.
+        self.available_cameras = []
+        self.cameras_probed = threading.Event()
+        threading.Thread(target=self.probe_available_cameras, daemon=True).start()
 
         # Start Web Server if enabled
         if self.config.get("web_server_enabled", False):
@@ -2190,6 +2733,23 @@ class MagicMirrorApp(QMainWindow):
                 cap.release()
         return available
 
+    def probe_available_cameras(self):
+        try:
+            cameras = self.detect_available_cameras()
+        except Exception as e:
+            print(f"Camera probe failed: {e}")
+            cameras = []
+        self.available_cameras = cameras
+        self.cameras_probed.set()
+        server = self.web_server
+        if server is not None:
+            server.invalidate_meta()
+
+    def get_available_cameras(self, timeout=0):
+        if timeout:
+            self.cameras_probed.wait(timeout)
+        return list(self.available_cameras)
+
     def is_camera_active(self):
         # Renaming might be too much refactoring, let's just update logic
         mode = self.config.get("background_mode", "Camera")
@@ -2199,6 +2759,73 @@ class MagicMirrorApp(QMainWindow):
             return self.media_backend is not None and self.media_backend.is_open()
         return False
 
+    def is_background_static(self):
+        mode = self.config.get("background_mode", "Camera")
+        if mode in ("None", "Image"):
+            return True
+        return not self.is_camera_active()
+
+    def repaint_widget(self, widget_name, content_changed=True):
+        """Repaint only the area a widget covered and now covers, when the background allows it."""
+        surface = self.central_widget
+        if surface is None:
+            return
+        widget = self.widget_manager.widgets.get(widget_name)
+        if widget is None:
+            surface.update()
+            return
+        if content_changed:
+            if not widget.repaint_pending:
+                return
+            widget.repaint_pending = False
+            previous = widget.stale_rect
+            widget.stale_rect = None
+        else:
+            previous = widget.painted_rect
+        layered = getattr(surface, "layered", False)
+        if self.edit_mode or not hasattr(surface, "update_region") or not (layered or self.is_background_static()):
+            # A live background repaints the whole surface every frame anyway.
+            surface.update()
+            return
+        if previous is None:
+            # Nothing of this widget was on screen; only a newly visible widget needs a (full) repaint.
+            if content_changed and self.widget_is_visible(widget_name):
+                surface.update()
+            return
+        region = QRegion(previous.adjusted(-2, -2, 2, 2))
+        if content_changed:
+            current = self.get_widget_bbox(widget_name)
+            if current is None:
+                surface.update()
+                return
+            # get_widget_bbox measures plain text; leave room for the panel padding, shadow and bold header.
+            margin_x = 14 + current.width() // 6
+            region = region.united(current.adjusted(-margin_x, -8, margin_x, 8))
+        surface.update_region(region)
+
+    def refresh_widget_visibility(self):
+        """Repaints widgets whose time-of-day or day-of-week rules shown or hid them since the last check."""
+        now = datetime.now().replace(second=0, microsecond=0)
+        if now == self.visibility_checked_minute:
+            return
+        self.visibility_checked_minute = now
+        visible = {name for name in self.widget_manager.widgets if self.widget_is_visible(name, now)}
+        previous = self.visible_widget_names
+        self.visible_widget_names = visible
+        if previous is None or visible == previous:
+            return
+        if visible - previous:
+            # A newly shown widget has no painted rect to invalidate yet.
+            self.central_widget.update()
+            return
+        for widget_name in previous - visible:
+            self.repaint_widget(widget_name, content_changed=False)
+
+    def repaint_pending_widgets(self):
+        for widget_name, widget in list(self.widget_manager.widgets.items()):
+            if widget.repaint_pending:
+                self.repaint_widget(widget_name)
+
     def invalidate_text_overlay(self):
         overlay = getattr(getattr(self, "central_widget", None), "overlay_widget", None)
         if overlay is not None and hasattr(overlay, "invalidate_cache"):
@@ -2206,23 +2833,54 @@ class MagicMirrorApp(QMainWindow):
 
     def draw_background_pixmap(self, painter, target_rect, pixmap):
         fit_mode = self.config.get("background_fit_mode", "fill")
+        dpr = painter.device().devicePixelRatioF()
+        device_w = int(round(target_rect.width() * dpr))
+        device_h = int(round(target_rect.height() * dpr))
+        if fit_mode != "fit" and pixmap.width() == device_w and pixmap.height() == device_h:
+            # Already scaled and cropped to the surface by the frame pipeline.
+            painter.drawPixmap(target_rect, pixmap)
+            return
+        if fit_mode == "fit" and (
+            (pixmap.width() == device_w and pixmap.height() <= device_h)
+            or (pixmap.height() == device_h and pixmap.width() <= device_w)
+        ):
+            w = int(round(pixmap.width() / dpr))
+            h = int(round(pixmap.height() / dpr))
+            x = target_rect.x() + (target_rect.width() - w) // 2
+            y = target_rect.y() + (target_rect.height() - h) // 2
+            painter.drawPixmap(QRect(x, y, w, h), pixmap)
+            return
+        crop_x = float(self.config.get("background_crop_x", 0.5) or 0.5)
+        crop_y = float(self.config.get("background_crop_y", 0.5) or 0.5)
+        cache_key = (
+            pixmap.cacheKey(),
+            (target_rect.x(), target_rect.y(), target_rect.width(), target_rect.height()),
+            fit_mode,
+            crop_x,
+            crop_y,
+        )
+        cached = self.background_scale_cache
+        if cached is None or cached[0] != cache_key:
+            cached = (cache_key,) + self.scale_background_pixmap(target_rect, pixmap, fit_mode, crop_x, crop_y)
+            self.background_scale_cache = cached
+        painter.drawPixmap(cached[1], cached[2])
+
+    def scale_background_pixmap(self, target_rect, pixmap, fit_mode, crop_x, crop_y):
+        """Returns (dest_rect, pixmap) with the background scaled and cropped for target_rect."""
         if fit_mode == "fit":
             scaled = pixmap.scaled(target_rect.size(), Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
             x = target_rect.x() + (target_rect.width() - scaled.width()) // 2
             y = target_rect.y() + (target_rect.height() - scaled.height()) // 2
-            painter.drawPixmap(x, y, scaled)
-            return
+            return QRect(x, y, scaled.width(), scaled.height()), scaled
         scaled = pixmap.scaled(target_rect.size(), Qt.AspectRatioMode.KeepAspectRatioByExpanding, Qt.TransformationMode.SmoothTransformation)
-        crop_x = float(self.config.get("background_crop_x", 0.5) or 0.5)
-        crop_y = float(self.config.get("background_crop_y", 0.5) or 0.5)
         max_x = max(0, scaled.width() - target_rect.width())
         max_y = max(0, scaled.height() - target_rect.height())
         src_x = int(max_x * max(0.0, min(1.0, crop_x)))
         src_y = int(max_y * max(0.0, min(1.0, crop_y)))
-        painter.drawPixmap(target_rect, scaled, QRect(src_x, src_y, target_rect.width(), target_rect.height()))
+        return QRect(target_rect), scaled.copy(QRect(src_x, src_y, target_rect.width(), target_rect.height()))
 
-    def draw_widget_layer(self, painter):
-        self.draw_all_widgets(painter)
+    def draw_widget_layer(self, painter, clip_rect=None):
+        self.draw_all_widgets(painter, clip_rect)
         if self.error_message:
             painter.setPen(QColor(255, 80, 80))
             font = QFont(self.config.get("font_family", "Helvetica"))
@@ -2240,9 +2898,44 @@ class MagicMirrorApp(QMainWindow):
             for i, line in enumerate(lines):
                 baseline = y + 20 + i * (metrics.height() + 5) + metrics.ascent()
                 painter.drawText(QPoint(x + 10, baseline), line)
+        if self.show_render_hud:
+            self.draw_render_hud(painter)
+
+    def draw_render_hud(self, painter):
+        pacing = self.get_frame_pacing_stats()
+        lines = [
+            f"{pacing['achieved_fps']:.1f} / {pacing['target_fps']:.1f} fps  dropped {pacing['frames_dropped']}",
+            "ms p50 / p95 / max",
+        ] + self.get_render_timing_lines(limit=12)
+        font = QFont("Monospace")
+        font.setStyleHint(QFont.StyleHint.TypeWriter)
+        font.setPointSizeF(10)
+        painter.setFont(font)
+        metrics = painter.fontMetrics()
+        w = max(metrics.horizontalAdvance(l) for l in lines) + 20
+        h = len(lines) * metrics.height() + 16
+        x = self.central_widget.width() - w - 20
+        y = 20
+        painter.fillRect(QRect(x, y, w, h), QColor(0, 0, 0, 190))
+        painter.setPen(QColor(120, 255, 120))
+        for i, line in enumerate(lines):
+            painter.drawText(QPoint(x + 10, y + 8 + i * metrics.height() + metrics.ascent()), line)
+
+    def toggle_render_hud(self):
+        self.show_render_hud = not self.show_render_hud
+        if self.show_render_hud:
+            self.render_hud_timer.start(500)
+        else:
+            self.render_hud_timer.stop()
+        self.central_widget.update()
+
+    def wants_gpu_surface(self):
+        return bool(self.config.get("prefer_gpu_acceleration", False)) and not self.gpu_surface_failed
 
     def create_render_surface(self):
-        widget_cls = CpuVideoLabel
+        use_gpu = self.wants_gpu_surface()
+        widget_cls = HybridRenderSurface if use_gpu else CpuVideoLabel
+        self.render_surface_name = "gpu" if use_gpu else "cpu"
         new_widget = widget_cls(self)
         new_widget.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         interaction_target = getattr(new_widget, "interaction_widget", new_widget)
@@ -2256,6 +2949,18 @@ class MagicMirrorApp(QMainWindow):
         self.setCentralWidget(self.central_widget)
         self.refresh_overlay_buttons()
 
+    def ensure_render_surface(self):
+        desired = "gpu" if self.wants_gpu_surface() else "cpu"
+        if desired != self.render_surface_name:
+            self.recreate_render_surface()
+
+    def fall_back_to_cpu_surface(self, reason):
+        if self.render_surface_name != "gpu":
+            return
+        print(f"GPU compositor unavailable ({reason}); using CPU rendering.")
+        self.gpu_surface_failed = True
+        self.recreate_render_surface()
+
     def recreate_render_surface(self):
         old_pixmap = QPixmap()
         if self.central_widget is not None:
@@ -2280,6 +2985,84 @@ class MagicMirrorApp(QMainWindow):
             return min(60, max(configured_fps, int(round(source_fps))))
         return configured_fps
 
+    def get_display_refresh_rate(self):
+        screen = self.screen()
+        rate = float(screen.refreshRate()) if screen is not None else 0.0
+        return rate if 20.0 <= rate <= 500.0 else 0.0
+
+    def get_paced_render_fps(self):
+        """Target FPS snapped to a whole divisor of the display refresh, so ticks line up with vsync."""
+        target = self.get_target_render_fps()
+        refresh = self.display_refresh_rate
+        if refresh <= 0:
+            return float(target)
+        return refresh / max(1, int(round(refresh / target)))
+
+    def get_frame_interval_ms(self):
+        return max(1, int(round(1000.0 / self.get_paced_render_fps())))
+
+    def record_paint_time(self, seconds):
+        self.paint_time_ms += (seconds * 1000.0 - self.paint_time_ms) * FramePacer.EMA_WEIGHT
+        self.render_profiler.record("paint", seconds)
+
+    def get_circuit_breaker_lines(self):
+        breakers = FETCH_CACHE.get_breaker_states()
+        if not breakers:
+            return ["Circuit Breakers: all closed"]
+        lines = ["Circuit Breakers:"]
+        for breaker in breakers:
+            retry = f", retry in {breaker['retry_in']}s" if breaker["state"] == "open" else ""
+            lines.append(f"  {breaker['host']}: {breaker['state']} ({breaker['failures']} failures{retry}) {breaker['last_error']}".rstrip())
+        return lines
+
+    def get_web_server_lines(self):
+        if self.web_server is None:
+            return []
+        return self.web_server.get_latency_lines()
+
+    def get_render_timing_lines(self, limit=None):
+        """One "name: p50 / p95 / max ms" line per timing, hot-path stages first, then widgets by p95."""
+        summary = self.render_profiler.summary()
+        stages = [name for name in ("capture", "transform", "upload", "paint", "draw_text") if name in summary]
+        widgets = sorted((name for name in summary if name.startswith("widget:")), key=lambda n: summary[n]["p95"], reverse=True)
+        names = stages + widgets
+        if limit is not None:
+            names = names[:limit]
+        return [
+            f"{name}: {summary[name]['p50']:.2f} / {summary[name]['p95']:.2f} / {summary[name]['max']:.2f} ms"
+            for name in names
+        ]
+
+    def record_displayed_frame(self):
+        self.displayed_frame_times.append(time.perf_counter())
+
+    def get_achieved_fps(self):
+        times = self.displayed_frame_times
+        if len(times) < 2 or time.perf_counter() - times[-1] > 1.0:
+            return 0.0
+        return (len(times) - 1) / max(1e-6, times[-1] - times[0])
+
+    def get_frame_pacing_stats(self):
+        stats = {
+            "target_fps": round(self.get_paced_render_fps(), 1),
+            "achieved_fps": round(self.get_achieved_fps(), 1),
+            "display_refresh_hz": round(self.display_refresh_rate, 1),
+            "paint_ms": round(self.paint_time_ms, 2),
+            "decode_ms": 0.0,
+            "process_ms": 0.0,
+            "frames_dropped": 0,
+            "frames_repeated": 0,
+        }
+        worker = self.capture_worker
+        if worker is not None:
+            stats["decode_ms"] = round(worker.pacer.decode_ms, 2)
+            stats["process_ms"] = round(worker.pacer.process_ms, 2)
+            stats["frames_dropped"] = worker.frames_dropped + worker.pacer.frames_skipped
+            stats["frames_repeated"] = worker.pacer.frames_repeated
+        elif self.media_backend_name == "qt" and self.media_backend is not None:
+            stats["frames_dropped"] = self.media_backend.get_frames_skipped()
+        return stats
+
     def configure_capture(self):
         if not self.cap or not self.cap.isOpened():
             self.source_fps = 0.0
@@ -2296,7 +3079,7 @@ class MagicMirrorApp(QMainWindow):
             detected_fps = 0.0
         self.source_fps = detected_fps
         if hasattr(self, "timer") and self.timer:
-            self.timer.start(max(1, int(1000 / self.get_target_render_fps())))
+            self.timer.start(self.get_frame_interval_ms())
 
     def get_preferred_youtube_stream_urls(self, info):
         formats = info.get("formats") or []
@@ -2548,14 +3331,14 @@ class MagicMirrorApp(QMainWindow):
             self.save_config()
 
     def apply_performance_settings(self):
-        fps = self.get_target_render_fps()
         if self.config.get("low_power_mode", False):
             self.config["feed_refresh_interval_ms"] = max(3600000, int(self.config.get("feed_refresh_interval_ms", 3600000)))
-        interval_ms = max(1, int(1000 / max(1, fps)))
+        self.display_refresh_rate = self.get_display_refresh_rate()
+        interval_ms = self.get_frame_interval_ms()
         if hasattr(self, "timer") and self.timer:
             self.timer.start(interval_ms)
         if hasattr(self, "preview_capture_timer") and self.preview_capture_timer:
-            self.preview_capture_timer.start(200 if self.config.get("low_power_mode", False) else 100)
+            self.preview_capture_timer.setInterval(200 if self.config.get("low_power_mode", False) else 100)
         if hasattr(self, "ticker_timer") and self.ticker_timer:
             self.ticker_timer.start(50 if self.config.get("low_power_mode", False) else 30)
 
@@ -2597,6 +3380,7 @@ class MagicMirrorApp(QMainWindow):
             "background_crop_y": 0.5,
             "background_blur": 0,
             "background_brightness": 1.0,
+            "background_downscale": True,
             "background_volume": 0,
             "auto_relaunch_on_crash": False,
             "video_rotation": 0,
@@ -2643,7 +3427,6 @@ class MagicMirrorApp(QMainWindow):
         # keep snapping fine-grained by default
         if current_grid > 0.01:
             self.config["grid_size"] = 0.01
-        self.config["prefer_gpu_acceleration"] = False
         self.config["sharp_text_mode"] = False
         self.migrate_config_schema()
         self.save_config()
@@ -2768,16 +3551,31 @@ class MagicMirrorApp(QMainWindow):
                     except OSError:
                         pass
 
+    def stop_media_capture(self):
+        """Stops the capture worker and releases the capture once nothing can still be reading it."""
+        worker = getattr(self, "capture_worker", None)
+        self.capture_worker = None
+        if worker is not None:
+            worker.stop()
+            if worker.is_alive():
+                # Still inside a blocking read; the worker releases its backend when that returns.
+                print("Capture worker did not stop in time; it will release the capture when it exits.")
+                return
+        if getattr(self, "cap", None) is not None and self.cap.isOpened():
+            self.cap.release()
+        if getattr(self, "media_backend", None) is not None:
+            self.media_backend.stop()
+
     def setup_camera(self):
         mode = self.config.get("background_mode", "Camera")
         had_error = False
         self.source_fps = 0.0
-        if self.media_backend is not None:
-            self.media_backend.stop()
+        self.stop_media_capture()
         self.media_backend = None
         self.media_backend_name = "none"
         self.cap = None
         self.static_image = None
+        self.static_background_key = None
 
         if mode == "None":
             self.central_widget.set_pixmap(QPixmap())
@@ -2873,12 +3671,16 @@ class MagicMirrorApp(QMainWindow):
                 self.show_error("No YouTube URL provided")
                 had_error = True
 
+        if isinstance(self.media_backend, OpenCvMediaBackend):
+            self.capture_worker = OpenCvCaptureWorker(self, self.media_backend)
+            self.capture_worker.start()
+
         # Ensure timer is running
         if not hasattr(self, "timer") or not self.timer.isActive():
             self.timer = QTimer(self)
+            self.timer.setTimerType(Qt.TimerType.PreciseTimer)
             self.timer.timeout.connect(self.update_camera_feed)
-            fps = self.get_target_render_fps()
-            self.timer.start(max(1, int(1000 / fps)))
+            self.timer.start(self.get_frame_interval_ms())
             
         if not had_error:
             self.clear_error_message()
@@ -2924,81 +3726,95 @@ class MagicMirrorApp(QMainWindow):
 
     def update_camera_feed(self):
         mode = self.config.get("background_mode", "Camera")
-        
-        frame = None
+        self.refresh_widget_visibility()
         
         if mode == "None":
-            self.central_widget.update()
+            self.repaint_pending_widgets()
             return
 
+        # Widget geometry is only read here on the GUI thread; the capture worker picks it up.
+        self.background_render_target = self.get_background_render_target()
+
         if mode == "Image":
             if self.static_image is not None:
-                frame = self.static_image.copy()
-        
-        elif mode in ["Camera", "Video", "YouTube"]:
-            if self.media_backend and self.media_backend.is_open():
-                if self.media_backend_name == "qt":
+                # Still images are processed once per source/config/size change; otherwise the tick is a no-op.
+                key = (id(self.static_image), self.get_frame_pipeline().signature)
+                if key != self.static_background_key:
+                    self.static_background_key = key
+                    started = time.perf_counter()
+                    image = self.process_background_frame(self.static_image)
+                    uploaded = time.perf_counter()
+                    self.central_widget.set_pixmap(QPixmap.fromImage(image))
+                    self.render_profiler.record("transform", uploaded - started)
+                    self.render_profiler.record("upload", time.perf_counter() - uploaded)
+                    return
+            self.repaint_pending_widgets()
+            return
+
+        if mode in ["Camera", "Video", "YouTube"]:
+            if self.media_backend and self.media_backend_name == "qt" and self.media_backend.is_open():
+                if self.media_backend.has_new_frame():
+                    started = time.perf_counter()
                     pixmap = self.media_backend.get_pixmap()
                     if not pixmap.isNull():
                         self.central_widget.set_pixmap(pixmap)
-                    else:
-                        self.central_widget.update()
+                        self.render_profiler.record("upload", time.perf_counter() - started)
+                        self.record_displayed_frame()
+                        if not getattr(self.central_widget, "layered", False):
+                            return
+                # Paused or between frames: only widget damage needs painting.
+                self.repaint_pending_widgets()
+                return
+            worker = self.capture_worker
+            if worker is not None:
+                if worker.stream_ended and mode == "YouTube":
+                    # YouTube stream ended and seek failed, try re-opening
+                    self.setup_camera()
                     return
-                if mode == "YouTube" and self.source_fps > self.get_target_render_fps():
-                    extra_grabs = min(4, int(self.source_fps // max(1, self.get_target_render_fps())))
-                    for _ in range(extra_grabs):
-                        if not self.cap or not self.cap.grab():
-                            break
-                frame = self.media_backend.get_frame()
-                if frame is None:
-                    if mode in ["Video", "YouTube"]:
-                        # Loop video
-                        if self.cap:
-                            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-                        frame = self.media_backend.get_frame()
-                        
-                        # If still no frame (e.g. YouTube stream ended and seek failed), try re-opening
-                        if frame is None and mode == "YouTube":
-                             if self.cap:
-                                 self.cap.release()
-                             self.setup_camera()
-                             if self.media_backend and self.media_backend.is_open():
-                                 frame = self.media_backend.get_frame()
-                
-                if frame is None:
-                    # Failed to read
-                    self.central_widget.update()
+                image = worker.take_latest_image()
+                if image is not None:
+                    started = time.perf_counter()
+                    self.central_widget.set_pixmap(QPixmap.fromImage(image))
+                    self.render_profiler.record("upload", time.perf_counter() - started)
+                    self.record_displayed_frame()
+                    if getattr(self.central_widget, "layered", False):
+                        # New frames leave the overlay cache alone; flush widget damage separately.
+                        self.repaint_pending_widgets()
                     return
-            else:
-                self.central_widget.update()
-                return
 
-        if frame is not None:
-            # Apply mirror/rotation
-            if self.config.get("mirror_video", False):
-                frame = cv2.flip(frame, 1)
-            rot = self.config.get("video_rotation", 0)
-            if rot != 0:
-                frame = cv2.rotate(frame, [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_180, cv2.ROTATE_90_COUNTERCLOCKWISE][rot - 1])
-            brightness = float(self.config.get("background_brightness", 1.0) or 1.0)
-            if abs(brightness - 1.0) > 0.01:
-                frame = cv2.convertScaleAbs(frame, alpha=max(0.1, brightness), beta=0)
-            blur = int(self.config.get("background_blur", 0) or 0)
-            if blur > 0:
-                kernel = max(1, blur)
-                if kernel % 2 == 0:
-                    kernel += 1
-                frame = cv2.GaussianBlur(frame, (kernel, kernel), 0)
-
-            h, w, ch = frame.shape
-            q_img = QImage(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB).data, w, h, ch * w, QImage.Format.Format_RGB888)
-            pixmap = QPixmap.fromImage(q_img)
-            self.central_widget.set_pixmap(pixmap)
-        else:
-            self.central_widget.update()
+        self.repaint_pending_widgets()
+
+    def get_background_render_target(self):
+        """Device-pixel size, fit mode and crop the background is shown at, or None."""
+        if not self.config.get("background_downscale", True) or self.central_widget is None:
+            return None
+        dpr = self.central_widget.devicePixelRatioF()
+        width = int(round(self.central_widget.width() * dpr))
+        height = int(round(self.central_widget.height() * dpr))
+        if width <= 0 or height <= 0:
+            return None
+        return (
+            width,
+            height,
+            self.config.get("background_fit_mode", "fill"),
+            float(self.config.get("background_crop_x", 0.5) or 0.5),
+            float(self.config.get("background_crop_y", 0.5) or 0.5),
+        )
+
+    def get_frame_pipeline(self):
+        signature = FrameTransformPipeline.signature_from_config(self.config) + (self.background_render_target,)
+        pipeline = self.frame_pipeline
+        if pipeline is None or pipeline.signature != signature:
+            pipeline = FrameTransformPipeline(*signature)
+            self.frame_pipeline = pipeline
+        return pipeline
+
+    def process_background_frame(self, frame):
+        # Runs on the capture worker thread for live sources, so it must only build a QImage.
+        return self.get_frame_pipeline().process(frame)
 
     def update_tickers(self):
-        needs_update = False
+        scrolled = []
         now_monotonic = time.perf_counter()
         with QMutexLocker(self.config_mutex):
             for widget_name, widget in self.widget_manager.widgets.items():
@@ -3010,17 +3826,17 @@ class MagicMirrorApp(QMainWindow):
                     widget.last_ticker_step_time = now_monotonic
                     pixels_per_second = 45.0 + speed_setting * 18.0
                     widget.ticker_scroll_x -= pixels_per_second * delta_s
-                    needs_update = True
+                    scrolled.append(widget_name)
         
-        if needs_update:
-            self.central_widget.update()
+        for widget_name in scrolled:
+            self.repaint_widget(widget_name, content_changed=False)
 
-    def draw_all_widgets(self, painter):
+    def draw_all_widgets(self, painter, clip_rect=None):
         with QMutexLocker(self.config_mutex):
             self.widget_delete_hitboxes = {}
             self.widget_resize_hitboxes = {}
             self.add_widget_button_rect = None
-            self.widget_manager.draw_all(painter, self)
+            self.widget_manager.draw_all(painter, self, None if self.edit_mode else clip_rect)
             if self.edit_mode:
                 painter.setPen(QColor(0, 255, 0, 200))
                 painter.setBrush(QColor(0, 255, 0, 50))
@@ -3285,13 +4101,114 @@ class MagicMirrorApp(QMainWindow):
         x0, y0 = self._get_top_left_for_anchor(anchor, (anchor_x, anchor_y), text_width, text_height)
         return QRect(int(x0), int(y0), int(text_width) + 2, int(text_height) + 2)
 
+    def get_text_tile_key(self, text, final_font_scale, is_ticker):
+        return (
+            text,
+            self.config.get("font_family", "Helvetica"),
+            round(float(final_font_scale), 4),
+            tuple(self.config.get("text_color", [255, 255, 255])),
+            tuple(self.config.get("text_shadow_color", [0, 0, 0])),
+            bool(self.config.get("sharp_text_mode", False)),
+            is_ticker,
+            float(self.central_widget.devicePixelRatioF()) if self.central_widget else 1.0,
+        )
+
+    def build_text_font(self, final_font_scale):
+        font = QFont(self.config.get("font_family", "Helvetica")); font.setPointSizeF(final_font_scale * 10)
+        font.setHintingPreference(QFont.HintingPreference.PreferFullHinting)
+        font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
+        return font
+
+    def render_text_tile(self, key, text, final_font_scale, is_ticker):
+        font = self.build_text_font(final_font_scale)
+        metrics = QFontMetrics(font)
+        use_sharp_text = key[5]
+        dpr = max(1.0, key[7])
+        c_shadow = self.config.get("text_shadow_color", [0, 0, 0])
+        c_text = self.config.get("text_color", [255, 255, 255])
+
+        if is_ticker:
+            lines = [text]
+            text_width = metrics.horizontalAdvance(text)
+            total_height = metrics.height()
+            # Tiles are painted at their origin; the shadow needs 2px extra on each axis.
+            tile_w = text_width + 4
+            tile_h = total_height + 4
+            offset_x, offset_y = 0, 0
+        else:
+            lines = text.split("\n")
+            text_width = max(metrics.horizontalAdvance(line) for line in lines)
+            total_height = sum(metrics.height() for _ in lines) + (len(lines) - 1) * 5
+            bold_font = QFont(font)
+            bold_font.setBold(True)
+            bold_width = QFontMetrics(bold_font).horizontalAdvance(lines[0]) if len(lines) > 1 else 0
+            # Origin is the top-left of the glassmorphism panel drawn behind the text.
+            offset_x, offset_y = 10, 5
+            tile_w = max(text_width + 20, bold_width + offset_x + 4)
+            tile_h = total_height + 10
+
+        if tile_w * dpr > 16000 or tile_h * dpr > 16000:
+            return None
+
+        pixmap = QPixmap(int(math.ceil(tile_w * dpr)), int(math.ceil(tile_h * dpr)))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+
+        if not is_ticker:
+            # Glassmorphism background
+            painter.setBrush(QBrush(QColor(0, 0, 0, 100)))
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.drawRoundedRect(QRect(0, 0, int(text_width) + 20, int(total_height) + 10), 10, 10)
+
+        for i, line in enumerate(lines):
+            baseline_y = offset_y + i * (metrics.height() + 5) + metrics.ascent()
+            # Visual Hierarchy: Make the first line bold if it's a multi-line widget
+            font.setBold(i == 0 and len(lines) > 1)
+            painter.setFont(font)
+            if not use_sharp_text:
+                painter.setPen(QColor(c_shadow[0], c_shadow[1], c_shadow[2]))
+                painter.drawText(QPoint(offset_x + 2, baseline_y + 2), line)
+            painter.setPen(QColor(c_text[0], c_text[1], c_text[2]))
+            painter.drawText(QPoint(offset_x, baseline_y), line)
+        painter.end()
+
+        return {
+            "key": key,
+            "pixmap": pixmap,
+            "text_width": text_width,
+            "total_height": total_height,
+            "line_height": metrics.height(),
+            "ascent": metrics.ascent(),
+        }
+
+    def get_text_tile(self, widget, text, final_font_scale, is_ticker):
+        key = self.get_text_tile_key(text, final_font_scale, is_ticker)
+        tile = getattr(widget, "text_tile", None) if widget is not None else None
+        if tile is not None and tile["key"] == key:
+            return tile
+        tile = self.render_text_tile(key, text, final_font_scale, is_ticker)
+        if widget is not None:
+            widget.text_tile = tile
+        return tile
+
     def draw_text(self, painter, text, pos, font_scale, **kwargs):
         if not text:
             return
+        started = time.perf_counter()
+        try:
+            self._draw_text(painter, text, pos, font_scale, **kwargs)
+        finally:
+            self.render_profiler.record("draw_text", time.perf_counter() - started)
+
+    def _draw_text(self, painter, text, pos, font_scale, **kwargs):
         
         widget_name = kwargs.get("widget_name")
         settings = self.config.get("widget_settings", {}).get(widget_name, {})
         is_ticker = settings.get("style") == "Ticker"
+        widget = self.widget_manager.widgets.get(widget_name)
         
         # Apply per-widget font scale
         widget_scale = settings.get("font_scale", 1.0)
@@ -3299,17 +4216,13 @@ class MagicMirrorApp(QMainWindow):
         size_scale = max(0.5, float(layout_cfg.get("width", 0.18)) / 0.18)
         final_font_scale = font_scale * widget_scale * size_scale
 
-        font = QFont(self.config.get("font_family", "Helvetica")); font.setPointSizeF(final_font_scale * 10)
-        font.setHintingPreference(QFont.HintingPreference.PreferFullHinting)
-        font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
-        painter.setFont(font)
-        metrics = painter.fontMetrics()
-        use_sharp_text = self.config.get("sharp_text_mode", False)
+        tile = self.get_text_tile(widget, text, final_font_scale, is_ticker)
+        if tile is None:
+            return self.draw_text_uncached(painter, text, pos, final_font_scale, is_ticker, widget, kwargs.get("anchor", "nw"))
 
         if is_ticker:
             # Ticker drawing logic
-            text_width = metrics.horizontalAdvance(text)
-            widget = self.widget_manager.widgets.get(widget_name)
+            text_width = tile["text_width"]
             
             # Initialize scroll if needed (first draw)
             if not getattr(widget, "ticker_initialized", False):
@@ -3320,7 +4233,7 @@ class MagicMirrorApp(QMainWindow):
             y = pos[1] # Use the Y position from the config
             anchor = kwargs.get("anchor", "nw")
             
-            strip_height = metrics.height() + 10
+            strip_height = tile["line_height"] + 10
             
             # Adjust y to be the vertical center of the strip
             if "n" in anchor:
@@ -3329,71 +4242,95 @@ class MagicMirrorApp(QMainWindow):
                 y -= strip_height / 2
             
             # Draw background strip for ticker
-            painter.fillRect(0, int(y - strip_height/2), self.central_widget.width(), int(strip_height), QColor(0, 0, 0, 150))
+            strip_rect = QRect(0, int(y - strip_height/2), self.central_widget.width(), int(strip_height))
+            painter.fillRect(strip_rect, QColor(0, 0, 0, 150))
+            if widget is not None:
+                widget.painted_rect = strip_rect.adjusted(0, 0, 0, 4)
 
-            baseline_y = y + metrics.ascent() - metrics.height()/2
-            
-            c_shadow = self.config.get("text_shadow_color", [0, 0, 0])
-            if not use_sharp_text:
-                painter.setPen(QColor(c_shadow[0], c_shadow[1], c_shadow[2]))
-                painter.drawText(QPointF(float(x) + 2.0, float(baseline_y) + 2.0), text)
-            
-            c_text = self.config.get("text_color", [255, 255, 255])
-            painter.setPen(QColor(c_text[0], c_text[1], c_text[2]))
-            painter.drawText(QPointF(float(x), float(baseline_y)), text)
+            top_y = y - tile["line_height"] / 2
+            painter.drawPixmap(QPointF(float(x), float(top_y)), tile["pixmap"])
             
             # Draw the text again if it's scrolling off the screen to create a seamless loop
             gap = 50
             if x + text_width < self.central_widget.width():
                 x2 = x + text_width + gap
-                if not use_sharp_text:
-                    painter.setPen(QColor(c_shadow[0], c_shadow[1], c_shadow[2]))
-                    painter.drawText(QPointF(float(x2) + 2.0, float(baseline_y) + 2.0), text)
-                painter.setPen(QColor(c_text[0], c_text[1], c_text[2]))
-                painter.drawText(QPointF(float(x2), float(baseline_y)), text)
+                painter.drawPixmap(QPointF(float(x2), float(top_y)), tile["pixmap"])
                 
                 # Reset scroll logic for infinite loop
                 if x < -text_width:
                      widget.ticker_scroll_x += (text_width + gap)
+            return
 
-        else:
-            # Normal multi-line drawing logic
-            lines = text.split("\n")
-            max_width = max(metrics.horizontalAdvance(line) for line in lines)
-            total_height = sum(metrics.height() for _ in lines) + (len(lines) - 1) * 5
-            anchor = kwargs.get("anchor", "nw")
+        anchor = kwargs.get("anchor", "nw")
+        x, y = self._get_top_left_for_anchor(anchor, pos, tile["text_width"], tile["total_height"])
+        painter.drawPixmap(QPoint(int(x) - 10, int(y) - 5), tile["pixmap"])
+        if widget is not None:
+            widget.painted_rect = QRect(QPoint(int(x) - 10, int(y) - 5), tile["pixmap"].deviceIndependentSize().toSize())
 
-            x, y = self._get_top_left_for_anchor(anchor, pos, max_width, total_height)
+    def draw_text_uncached(self, painter, text, pos, final_font_scale, is_ticker, widget, anchor):
+        # Fallback for text too large to keep as a single pixmap tile.
+        font = self.build_text_font(final_font_scale)
+        painter.setFont(font)
+        metrics = painter.fontMetrics()
+        use_sharp_text = self.config.get("sharp_text_mode", False)
+        c_shadow = self.config.get("text_shadow_color", [0, 0, 0])
+        c_text = self.config.get("text_color", [255, 255, 255])
 
-            # Glassmorphism background
-            # We draw a rounded rect behind the text block
-            bg_rect = QRect(int(x) - 10, int(y) - 5, int(max_width) + 20, int(total_height) + 10)
-            painter.setBrush(QBrush(QColor(0, 0, 0, 100))) # Semi-transparent black
-            painter.setPen(Qt.PenStyle.NoPen)
-            painter.drawRoundedRect(bg_rect, 10, 10)
+        if is_ticker:
+            text_width = metrics.horizontalAdvance(text)
+            if not getattr(widget, "ticker_initialized", False):
+                 widget.ticker_scroll_x = self.central_widget.width()
+                 widget.ticker_initialized = True
 
-            for i, line in enumerate(lines):
-                line_y = y + i * (metrics.height() + 5)
-                line_width = metrics.horizontalAdvance(line)
-                line_x = x
-                baseline_y = line_y + metrics.ascent()
-                
-                # Visual Hierarchy: Make the first line bold if it's a multi-line widget
-                if i == 0 and len(lines) > 1:
-                    font.setBold(True)
-                    painter.setFont(font)
-                else:
-                    font.setBold(False)
-                    painter.setFont(font)
+            x = widget.ticker_scroll_x
+            y = pos[1]
+            strip_height = metrics.height() + 10
+            if "n" in anchor:
+                y += strip_height / 2
+            elif "s" in anchor:
+                y -= strip_height / 2
+            strip_rect = QRect(0, int(y - strip_height/2), self.central_widget.width(), int(strip_height))
+            painter.fillRect(strip_rect, QColor(0, 0, 0, 150))
+            if widget is not None:
+                widget.painted_rect = strip_rect.adjusted(0, 0, 0, 4)
+            baseline_y = y + metrics.ascent() - metrics.height()/2
 
-                c_shadow = self.config.get("text_shadow_color", [0, 0, 0])
+            gap = 50
+            positions = [x]
+            if x + text_width < self.central_widget.width():
+                positions.append(x + text_width + gap)
+                if x < -text_width:
+                     widget.ticker_scroll_x += (text_width + gap)
+            for text_x in positions:
                 if not use_sharp_text:
                     painter.setPen(QColor(c_shadow[0], c_shadow[1], c_shadow[2]))
-                    painter.drawText(QPoint(int(line_x) + 2, int(baseline_y) + 2), line)
-                
-                c_text = self.config.get("text_color", [255, 255, 255])
+                    painter.drawText(QPointF(float(text_x) + 2.0, float(baseline_y) + 2.0), text)
                 painter.setPen(QColor(c_text[0], c_text[1], c_text[2]))
-                painter.drawText(QPoint(int(line_x), int(baseline_y)), line)
+                painter.drawText(QPointF(float(text_x), float(baseline_y)), text)
+            return
+
+        lines = text.split("\n")
+        max_width = max(metrics.horizontalAdvance(line) for line in lines)
+        total_height = sum(metrics.height() for _ in lines) + (len(lines) - 1) * 5
+        x, y = self._get_top_left_for_anchor(anchor, pos, max_width, total_height)
+
+        bg_rect = QRect(int(x) - 10, int(y) - 5, int(max_width) + 20, int(total_height) + 10)
+        painter.setBrush(QBrush(QColor(0, 0, 0, 100)))
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.drawRoundedRect(bg_rect, 10, 10)
+        if widget is not None:
+            # Bold first line may run past the measured width.
+            widget.painted_rect = bg_rect.adjusted(0, 0, max(4, int(max_width) // 6), 2)
+
+        for i, line in enumerate(lines):
+            baseline_y = y + i * (metrics.height() + 5) + metrics.ascent()
+            font.setBold(i == 0 and len(lines) > 1)
+            painter.setFont(font)
+            if not use_sharp_text:
+                painter.setPen(QColor(c_shadow[0], c_shadow[1], c_shadow[2]))
+                painter.drawText(QPoint(int(x) + 2, int(baseline_y) + 2), line)
+            painter.setPen(QColor(c_text[0], c_text[1], c_text[2]))
+            painter.drawText(QPoint(int(x), int(baseline_y)), line)
 
     def draw_photo_widget(self, painter, widget_name, photo_path, pos, anchor):
         if not photo_path or not os.path.exists(photo_path):
@@ -3424,6 +4361,9 @@ class MagicMirrorApp(QMainWindow):
         rect = QRect(int(x), int(y), int(target_w), int(target_h))
         scaled = pixmap.scaled(target_w, target_h, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
         painter.drawPixmap(rect, scaled)
+        widget = self.widget_manager.widgets.get(widget_name)
+        if widget is not None:
+            widget.painted_rect = QRect(rect)
 
     def draw_ical_month_widget(self, painter, widget_name, calendar_data):
         pos = self.get_widget_layout(widget_name)
@@ -3446,6 +4386,9 @@ class MagicMirrorApp(QMainWindow):
 
         x0, y0 = self._get_top_left_for_anchor(anchor, (anchor_x, anchor_y), outer_w, outer_h)
         panel_rect = QRect(int(x0), int(y0), int(outer_w), int(outer_h))
+        widget = self.widget_manager.widgets.get(widget_name)
+        if widget is not None:
+            widget.painted_rect = panel_rect.adjusted(-2, -2, 2, 2)
 
         painter.setPen(Qt.PenStyle.NoPen)
         painter.setBrush(QBrush(QColor(0, 0, 0, 120)))
@@ -3658,6 +4601,8 @@ class MagicMirrorApp(QMainWindow):
             self.set_fullscreen(not self.isFullScreen())
         elif event.key() == Qt.Key.Key_E:
             self.edit_button.toggle()
+        elif event.key() == Qt.Key.Key_F3:
+            self.toggle_render_hud()
 
     def open_settings_dialog(self, widget_name=None, widget_tab=False):
         dialog = SettingsDialog(self)
@@ -3701,24 +4646,75 @@ class MagicMirrorApp(QMainWindow):
         t = QTimer(self)
         t.setSingleShot(True)
         t.timeout.connect(func)
+        t.timeout.connect(t.deleteLater)
         t.start(ms)
         return t
 
+    def preview_is_wanted(self):
+        with self.preview_frame_ready:
+            if self.preview_viewers > 0:
+                return True
+            return time.monotonic() - self.preview_last_requested < PREVIEW_DEMAND_SECONDS
+
     def update_preview_image(self):
-        if not self.central_widget:
+        if not self.central_widget or not self.preview_is_wanted():
             return
-        
-        pixmap = self.central_widget.grab()
-        byte_array = QBuffer()
-        byte_array.open(QIODevice.OpenModeFlag.WriteOnly)
-        pixmap.save(byte_array, "JPG")
-        
-        with QMutexLocker(self.preview_image_mutex):
-            self.preview_image_data = byte_array.data().data()
 
-    def get_preview_image(self):
-        with QMutexLocker(self.preview_image_mutex):
-            return self.preview_image_data
+        # Only the grab happens on the UI thread; web server threads scale and encode on demand.
+        image = self.central_widget.grab().toImage()
+        with self.preview_frame_ready:
+            self.preview_frame_image = image
+            self.preview_frame_time = time.monotonic()
+            self.preview_frame_serial += 1
+            self.preview_jpeg_cache.clear()
+            self.preview_frame_ready.notify_all()
+
+    def get_preview_image(self, max_width=None, quality=None):
+        with self.preview_frame_ready:
+            self.preview_last_requested = time.monotonic()
+            if self.preview_frame_image is None or time.monotonic() - self.preview_frame_time > PREVIEW_FRAME_MAX_AGE_SECONDS:
+                # Capture was idle; give the timer a moment to produce a current frame.
+                serial = self.preview_frame_serial
+                self.preview_frame_ready.wait_for(lambda: self.preview_frame_serial != serial, PREVIEW_FIRST_FRAME_WAIT_SECONDS)
+            image, serial = self.preview_frame_image, self.preview_frame_serial
+        return self.encode_preview_frame(image, serial, max_width, quality)
+
+    def encode_preview_frame(self, image, serial, max_width=None, quality=None):
+        if image is None:
+            return None
+        width = min(image.width(), max(PREVIEW_MIN_WIDTH, int(max_width or PREVIEW_DEFAULT_WIDTH)))
+        quality = min(95, max(10, int(quality or PREVIEW_DEFAULT_QUALITY)))
+        key = (width, quality)
+        with self.preview_encode_lock:
+            with self.preview_frame_ready:
+                if serial == self.preview_frame_serial and key in self.preview_jpeg_cache:
+                    return self.preview_jpeg_cache[key]
+            scaled = image if width >= image.width() else image.scaledToWidth(width, Qt.TransformationMode.SmoothTransformation)
+            byte_array = QBuffer()
+            byte_array.open(QIODevice.OpenModeFlag.WriteOnly)
+            scaled.save(byte_array, "JPG", quality)
+            data = byte_array.data().data()
+            with self.preview_frame_ready:
+                if serial == self.preview_frame_serial:
+                    self.preview_jpeg_cache[key] = data
+            return data
+
+    def add_preview_viewer(self):
+        with self.preview_frame_ready:
+            self.preview_viewers += 1
+
+    def remove_preview_viewer(self):
+        with self.preview_frame_ready:
+            self.preview_viewers = max(0, self.preview_viewers - 1)
+
+    def wait_for_preview_frame(self, last_serial, timeout, max_width=None, quality=None):
+        """Blocks a web server thread until a frame newer than last_serial exists; returns (jpeg, serial)."""
+        with self.preview_frame_ready:
+            self.preview_frame_ready.wait_for(lambda: self.preview_frame_serial != last_serial, timeout)
+            image, serial = self.preview_frame_image, self.preview_frame_serial
+        if serial == last_serial:
+            return None, serial
+        return self.encode_preview_frame(image, serial, max_width, quality), serial
 
     def handle_remote_config_update(self):
         # Called from the web server thread; queued signal marshals work to the UI thread.
@@ -3726,6 +4722,7 @@ class MagicMirrorApp(QMainWindow):
 
     def apply_remote_config(self):
         self.migrate_config_schema()
+        self.ensure_render_surface()
         self.set_fullscreen(self.config.get("fullscreen", True))
         self.restart_camera()
         self.widget_manager.config = self.config
@@ -3736,6 +4733,7 @@ class MagicMirrorApp(QMainWindow):
         if self.web_server is None:
             try:
                 self.web_server = web_server.start_server(self, port=815)
+                self.preview_capture_timer.start()
                 print("Web server started on port 815.")
             except Exception as e:
                 print(f"Failed to start web server: {e}")
@@ -3745,6 +4743,7 @@ class MagicMirrorApp(QMainWindow):
         if self.web_server:
             self.web_server.shutdown()
             self.web_server = None
+            self.preview_capture_timer.stop()
             print("Web server stopped.")
 
     def closeEvent(self, event):
@@ -3756,10 +4755,7 @@ class MagicMirrorApp(QMainWindow):
             self.preview_capture_timer.stop()
         if hasattr(self, "timer") and self.timer.isActive():
             self.timer.stop()
-        if hasattr(self, "cap") and self.cap and self.cap.isOpened():
-            self.cap.release()
-        if getattr(self, "media_backend", None) is not None:
-            self.media_backend.stop()
+        self.stop_media_capture()
 
         super().closeEvent(event)
 
@@ -3780,8 +4776,7 @@ if __name__ == "__main__":
         relaunch_on_crash(args.exc_type, args.exc_value, args.exc_traceback)
 
     sys.excepthook = relaunch_on_crash
-    if hasattr(__import__("threading"), "excepthook"):
-        import threading
+    if hasattr(threading, "excepthook"):
         threading.excepthook = thread_relaunch_on_crash
 
     app = QApplication(sys.argv)
@@ -2,8 +2,9 @@
 import os
 import requests
 
+from widget_manager import fetch_stock_quotes
+
 API_KEY = os.environ.get("FMP_API_KEY") 
-BASE_URL = "https://financialmodelingprep.com/api/v3/quote/"
 
 class StockWidget:
     def __init__(self, config, widget_config):
@@ -19,16 +20,12 @@ class StockWidget:
 
         stock_data = []
         try:
+            quotes = fetch_stock_quotes(self.symbols, self.api_key)
             for symbol in self.symbols:
-                if not symbol.strip():
-                    continue
-                url = f"{BASE_URL}{symbol.strip().upper()}?apikey={self.api_key}"
-                response = requests.get(url)
-                response.raise_for_status()
-                data = response.json()
-                if data:
-                    price = data[0].get("price", "N/A")
-                    change = data[0].get("changesPercentage", 0)
+                quote = quotes.get(symbol.strip().upper())
+                if quote:
+                    price = quote.get("price", "N/A")
+                    change = quote.get("changesPercentage", 0)
                     change_str = f"+{change:.2f}%" if change > 0 else f"{change:.2f}%"
                     stock_data.append(f"{symbol.upper()}: ${price:.2f} ({change_str})")
             
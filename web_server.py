@@ -1,12 +1,36 @@
+import bisect
+import gzip
+import hashlib
 import json
 import os
+import socket
 import threading
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from urllib.parse import urlparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
 
 from PySide6.QtGui import QFontDatabase
 
-from widget_manager import WIDGET_CLASSES
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from widget_manager import WIDGET_CLASSES, FETCH_CACHE
+
+STREAM_BOUNDARY = "frame"
+# Stream handlers re-check for shutdown at least this often while no new frame arrives.
+STREAM_FRAME_WAIT_SECONDS = 1.0
+# Upper bound on concurrently handled connections; further connections queue for a free worker.
+WEB_MAX_HANDLERS = 32
+WEB_KEEPALIVE_SECONDS = 15
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+# The page only changes when the app is upgraded, so browsers keep it but revalidate every load.
+STATIC_CACHE_CONTROL = "no-cache"
+KNOWN_ROUTES = {"/", "/api/state", "/api/meta", "/api/preview", "/api/config", "/api/action"}
 
 
 THEME_PRESETS = {
@@ -29,6 +53,7 @@ addField(cg,'Background Rotation',()=>buildSelect(['0','1','2','3'],String(confi
 addField(cg,'Background Fit',()=>buildSelect(['fill','fit'],config.background_fit_mode,e=>{config.background_fit_mode=e.target.value}));
 addField(cg,'Background Blur',()=>buildInput('number',config.background_blur,e=>{config.background_blur=parseInt(e.target.value,10)||0}));
 addField(cg,'Background Brightness',()=>buildInput('number',config.background_brightness,e=>{config.background_brightness=parseFloat(e.target.value)||1.0}));
+addField(cg,'Process at Display Resolution',()=>buildInput('checkbox',config.background_downscale??true,e=>{config.background_downscale=e.target.checked}));
 addField(cg,'Background Volume',()=>buildInput('number',config.background_volume,e=>{config.background_volume=parseInt(e.target.value,10)||0}));
 addField(cg,'Mirror Video',()=>buildInput('checkbox',config.mirror_video,e=>{config.mirror_video=e.target.checked}));
 addField(cg,'Start in Fullscreen',()=>buildInput('checkbox',config.fullscreen,e=>{config.fullscreen=e.target.checked}));
@@ -37,6 +62,7 @@ const system=createSection('System'),sg=document.createElement('div');sg.classNa
 addField(sg,'Feed Refresh',()=>buildSelect(meta.feed_refresh_options,String(config.feed_refresh_interval_ms),e=>{config.feed_refresh_interval_ms=parseInt(e.target.value,10)||3600000}));
 addField(sg,'Render FPS',()=>buildSelect(['15','24','30','60'],String(config.camera_fps||30),e=>{config.camera_fps=parseInt(e.target.value,10)||30}));
 addField(sg,'Enable Web Management',()=>buildInput('checkbox',config.web_server_enabled,e=>{config.web_server_enabled=e.target.checked}));
+addField(sg,'GPU Compositor (OpenGL)',()=>buildInput('checkbox',config.prefer_gpu_acceleration,e=>{config.prefer_gpu_acceleration=e.target.checked}));
 addField(sg,'Low Power Mode',()=>buildInput('checkbox',config.low_power_mode,e=>{config.low_power_mode=e.target.checked}));
 addField(sg,'Auto Relaunch on Crash',()=>buildInput('checkbox',config.auto_relaunch_on_crash,e=>{config.auto_relaunch_on_crash=e.target.checked}));
 addField(sg,'Snap Widgets to Grid',()=>buildInput('checkbox',config.snap_to_grid,e=>{config.snap_to_grid=e.target.checked}));
@@ -114,22 +140,23 @@ input[type=text],input[type=number],select,textarea{width:100%;padding:9px 10px;
 @media(max-width:1100px){#container{grid-template-columns:1fr}#preview-pane{min-height:38vh}}
 </style></head><body>
 <header><div>MagicMirror Web Manager</div><div class="inline-row" style="flex:0 0 auto"><button id="start-stream-btn" class="secondary" onclick="startStream()">Start Stream</button><button id="stop-stream-btn" class="secondary" onclick="stopStream()" style="display:none">Stop Stream</button><button class="secondary" onclick="refreshPreview()">Refresh Preview</button><button class="secondary" onclick="openFullscreen()">Full Preview</button><button onclick="saveConfig()">Save Changes</button></div></header>
-<div id="container"><div id="preview-pane"><img id="preview-img" src="/api/preview"><div id="overlay"></div></div><div id="settings-pane"><div class="tabs"><button class="tab-btn active" data-tab="general" onclick="switchTab('general')">General</button><button class="tab-btn" data-tab="appearance" onclick="switchTab('appearance')">Appearance</button><button class="tab-btn" data-tab="widgets" onclick="switchTab('widgets')">Widgets</button><button class="tab-btn" data-tab="diagnostics" onclick="switchTab('diagnostics')">Diagnostics</button></div><div id="settings-content"><div id="tab-general" class="tab-panel active"></div><div id="tab-appearance" class="tab-panel"></div><div id="tab-widgets" class="tab-panel"></div><div id="tab-diagnostics" class="tab-panel"></div></div><div id="settings-footer"><span id="status" class="muted"></span><button onclick="saveConfig()">Save</button></div></div></div>
+<div id="container"><div id="preview-pane"><img id="preview-img"><div id="overlay"></div></div><div id="settings-pane"><div class="tabs"><button class="tab-btn active" data-tab="general" onclick="switchTab('general')">General</button><button class="tab-btn" data-tab="appearance" onclick="switchTab('appearance')">Appearance</button><button class="tab-btn" data-tab="widgets" onclick="switchTab('widgets')">Widgets</button><button class="tab-btn" data-tab="diagnostics" onclick="switchTab('diagnostics')">Diagnostics</button></div><div id="settings-content"><div id="tab-general" class="tab-panel active"></div><div id="tab-appearance" class="tab-panel"></div><div id="tab-widgets" class="tab-panel"></div><div id="tab-diagnostics" class="tab-panel"></div></div><div id="settings-footer"><span id="status" class="muted"></span><button onclick="saveConfig()">Save</button></div></div></div>
 <div id="fullscreen-modal" onclick="closeFullscreen()" style="display:none;position:fixed;inset:0;background:black;z-index:9999;align-items:center;justify-content:center"><img id="fullscreen-img" style="max-width:100%;max-height:100%;object-fit:contain"></div>
 <script>
 const THEME_PRESETS=__THEME_PRESETS__,ACCESSIBILITY_PRESETS=__ACCESSIBILITY_PRESETS__;
-let state=null,config={},meta={},draggedEl=null,streamInterval=null,fullscreenInterval=null;const img=document.getElementById('preview-img'),overlay=document.getElementById('overlay');
+let state=null,config={},meta={},stateRev=null,stateEpoch=null,metaVersion=null,draggedEl=null,streaming=false;const img=document.getElementById('preview-img'),overlay=document.getElementById('overlay');
 function setStatus(m,e=false){const s=document.getElementById('status');s.textContent=m||'';s.style.color=e?'#ff9f9f':'#b0b0b0'}function rgbToHex(rgb){if(!Array.isArray(rgb)||rgb.length<3)return'#000000';const c=n=>Math.max(0,Math.min(255,Number(n)||0));return'#'+[c(rgb[0]),c(rgb[1]),c(rgb[2])].map(v=>v.toString(16).padStart(2,'0')).join('')}function hexToRgb(hex){const m=/^#?([a-f0-9]{2})([a-f0-9]{2})([a-f0-9]{2})$/i.exec(hex||'');if(!m)return[0,0,0];return[parseInt(m[1],16),parseInt(m[2],16),parseInt(m[3],16)]}
 async function fetchJson(url,options={}){const r=await fetch(url,options);if(!r.ok){throw new Error(await r.text()||(`${r.status} ${r.statusText}`))}return r.json()}
-async function loadState(){try{state=await fetchJson('/api/state');config=state.config;meta=state.meta;renderAll()}catch(err){console.error(err);setStatus(`Load failed: ${err.message}`,true)}}
+async function loadState(){try{const params=new URLSearchParams();if(stateRev!==null){params.set('since',stateRev);params.set('epoch',stateEpoch)}if(document.getElementById('tab-diagnostics').classList.contains('active'))params.set('diagnostics','1');state=await fetchJson(`/api/state?${params}`);if(state.meta_version!==metaVersion){Object.assign(meta,await fetchJson('/api/meta'));metaVersion=state.meta_version}if(state.full){config=state.config;meta.widget_statuses=state.widget_statuses}else{Object.assign(config,state.config);Object.assign(meta.widget_statuses,state.widget_statuses);state.removed.config.forEach(k=>delete config[k]);state.removed.widget_statuses.forEach(k=>delete meta.widget_statuses[k])}meta.current_profile=state.current_profile;meta.layout_pages=state.layout_pages;if(state.diagnostics_lines)meta.diagnostics_lines=state.diagnostics_lines;stateRev=state.rev;stateEpoch=state.epoch;renderAll()}catch(err){console.error(err);setStatus(`Load failed: ${err.message}`,true)}}
 async function saveConfig(){try{setStatus('Saving...');await fetchJson('/api/config',{method:'POST',headers:{'Content-Type':'application/json'},body:JSON.stringify(config)});setStatus('Saved');await loadState();refreshPreview()}catch(err){console.error(err);setStatus(`Save failed: ${err.message}`,true)}}
 async function callAction(action,payload={}){try{setStatus(`${action}...`);const r=await fetchJson('/api/action',{method:'POST',headers:{'Content-Type':'application/json'},body:JSON.stringify({action,payload})});setStatus(r.message||'Done');await loadState();refreshPreview()}catch(err){console.error(err);setStatus(`${action} failed: ${err.message}`,true)}}
-function switchTab(tab){document.querySelectorAll('.tab-btn').forEach(b=>b.classList.toggle('active',b.dataset.tab===tab));document.querySelectorAll('.tab-panel').forEach(p=>p.classList.toggle('active',p.id===`tab-${tab}`))}
-function refreshPreview(){const t=Date.now();img.src=`/api/preview?t=${t}`;if(document.getElementById('fullscreen-modal').style.display==='flex'){document.getElementById('fullscreen-img').src=`/api/preview?t=${t}`}}
-function openFullscreen(){const m=document.getElementById('fullscreen-modal');m.style.display='flex';refreshPreview();fullscreenInterval=setInterval(refreshPreview,1000)}function closeFullscreen(){document.getElementById('fullscreen-modal').style.display='none';if(fullscreenInterval)clearInterval(fullscreenInterval);fullscreenInterval=null}
-function startStream(){if(streamInterval)return;streamInterval=setInterval(refreshPreview,100);document.getElementById('start-stream-btn').style.display='none';document.getElementById('stop-stream-btn').style.display='inline-block';document.getElementById('settings-pane').style.display='none';overlay.innerHTML=''}
-function stopStream(){if(streamInterval)clearInterval(streamInterval);streamInterval=null;document.getElementById('start-stream-btn').style.display='inline-block';document.getElementById('stop-stream-btn').style.display='none';document.getElementById('settings-pane').style.display='flex';resizeOverlay()}
-function resizeOverlay(){if(!img.complete||img.naturalWidth===0)return;const pane=document.getElementById('preview-pane').getBoundingClientRect(),imgRatio=img.naturalWidth/img.naturalHeight,paneRatio=pane.width/pane.height;let width,height,top,left;if(imgRatio>paneRatio){width=pane.width;height=width/imgRatio;left=0;top=(pane.height-height)/2}else{height=pane.height;width=height*imgRatio;top=0;left=(pane.width-width)/2}overlay.style.width=`${width}px`;overlay.style.height=`${height}px`;overlay.style.left=`${left}px`;overlay.style.top=`${top}px`;if(!streamInterval)renderPreviewWidgets()}
+function switchTab(tab){document.querySelectorAll('.tab-btn').forEach(b=>b.classList.toggle('active',b.dataset.tab===tab));document.querySelectorAll('.tab-panel').forEach(p=>p.classList.toggle('active',p.id===`tab-${tab}`));if(tab==='diagnostics')loadState()}
+function previewQuery(el){const w=Math.round((el.clientWidth||window.innerWidth)*(window.devicePixelRatio||1));return `w=${w}&q=70&t=${Date.now()}`}
+function refreshPreview(){if(!streaming)img.src=`/api/preview?${previewQuery(document.getElementById('preview-pane'))}`}
+function openFullscreen(){const m=document.getElementById('fullscreen-modal');m.style.display='flex';document.getElementById('fullscreen-img').src=`/api/preview/stream?${previewQuery(m)}`}function closeFullscreen(){const m=document.getElementById('fullscreen-modal');if(m.style.display==='none')return;m.style.display='none';document.getElementById('fullscreen-img').removeAttribute('src')}
+function startStream(){if(streaming)return;streaming=true;img.src=`/api/preview/stream?${previewQuery(document.getElementById('preview-pane'))}`;document.getElementById('start-stream-btn').style.display='none';document.getElementById('stop-stream-btn').style.display='inline-block';document.getElementById('settings-pane').style.display='none';overlay.innerHTML=''}
+function stopStream(){if(!streaming)return;streaming=false;refreshPreview();document.getElementById('start-stream-btn').style.display='inline-block';document.getElementById('stop-stream-btn').style.display='none';document.getElementById('settings-pane').style.display='flex';resizeOverlay()}
+function resizeOverlay(){if(!img.complete||img.naturalWidth===0)return;const pane=document.getElementById('preview-pane').getBoundingClientRect(),imgRatio=img.naturalWidth/img.naturalHeight,paneRatio=pane.width/pane.height;let width,height,top,left;if(imgRatio>paneRatio){width=pane.width;height=width/imgRatio;left=0;top=(pane.height-height)/2}else{height=pane.height;width=height*imgRatio;top=0;left=(pane.width-width)/2}overlay.style.width=`${width}px`;overlay.style.height=`${height}px`;overlay.style.left=`${left}px`;overlay.style.top=`${top}px`;if(!streaming)renderPreviewWidgets()}
 function sortedWidgetNames(){return Object.keys(config.widget_positions||{}).sort((a,b)=>((config.widget_positions[a]?.z||0)-(config.widget_positions[b]?.z||0))||a.localeCompare(b))}
 function renderPreviewWidgets(){overlay.innerHTML='';if(!config.widget_positions)return;for(const name of sortedWidgetNames()){const pos=config.widget_positions[name];if((pos.page||'default')!==(config.active_page||'default'))continue;const el=document.createElement('div');el.className='widget-box';if(pos.locked)el.classList.add('locked');const status=meta.widget_statuses?.[name]||'';el.textContent=status?`${name} [${status}]`:name;el.dataset.name=name;el.style.left=`${(pos.x||0)*100}%`;el.style.top=`${(pos.y||0)*100}%`;el.style.width=`${(pos.width||0.18)*overlay.clientWidth}px`;el.style.height=`${(pos.height||0.08)*overlay.clientHeight}px`;el.style.zIndex=String(pos.z||0);if(pos.anchor==='center')el.style.transform='translate(-50%, -50%)';else if(pos.anchor==='ne')el.style.transform='translate(-100%, 0)';else if(pos.anchor==='se')el.style.transform='translate(-100%, -100%)';else if(pos.anchor==='sw')el.style.transform='translate(0, -100%)';el.onmousedown=startDrag;overlay.appendChild(el)}}
 function startDrag(e){const name=e.currentTarget.dataset.name;if((config.widget_positions?.[name]||{}).locked)return;draggedEl=e.currentTarget;draggedEl.classList.add('active');e.preventDefault()}
@@ -144,7 +171,7 @@ function renderAppearanceTab(){/*__APPEARANCE__*/}
 function renderWidgetsTab(){/*__WIDGETS__*/}
 function renderDiagnosticsTab(){/*__DIAGNOSTICS__*/}
 function renderAll(){renderGeneralTab();renderAppearanceTab();renderWidgetsTab();renderDiagnosticsTab();renderPreviewWidgets()}
-img.onload=resizeOverlay;window.onresize=resizeOverlay;document.addEventListener('keydown',e=>{if(e.key==='Escape')closeFullscreen()});setInterval(()=>{if(!draggedEl&&!streamInterval)refreshPreview()},5000);loadState();
+img.onload=resizeOverlay;window.onresize=resizeOverlay;document.addEventListener('keydown',e=>{if(e.key==='Escape')closeFullscreen()});setInterval(()=>{if(!draggedEl&&!streaming)refreshPreview()},5000);refreshPreview();loadState();
 </script></body></html>
 """
 
@@ -158,19 +185,28 @@ def _list_profiles():
     return sorted(os.path.splitext(name)[0] for name in os.listdir(_profiles_dir()) if name.lower().endswith(".json"))
 
 
-def _safe_copy_config(app):
-    return json.loads(json.dumps(app.config))
-
-
 def _build_diagnostics(app):
+    pacing = app.get_frame_pacing_stats()
+    refresh = app.widget_manager.scheduler.get_stats()
+    fetches = FETCH_CACHE.get_stats()
     lines = [
         f"Background Mode: {app.config.get('background_mode', 'Camera')}",
         f"Render FPS: {app.config.get('camera_fps', 30)}",
         f"Source FPS: {getattr(app, 'source_fps', 0.0):.1f}",
         f"Low Power Mode: {'ON' if app.config.get('low_power_mode') else 'OFF'}",
         f"Render Path: {getattr(app, 'media_backend_name', 'none').upper()}",
+        f"Render Surface: {getattr(app, 'render_surface_name', 'cpu').upper()}",
+        f"Frame Pacing: {pacing['achieved_fps']:.1f} / {pacing['target_fps']:.1f} fps (display {pacing['display_refresh_hz']:.0f} Hz)",
+        f"Dropped Frames: {pacing['frames_dropped']} (repeated {pacing['frames_repeated']})",
+        f"Widget Refresh: {refresh['in_flight']} in flight, {refresh['queued']} queued, {refresh['workers']} workers",
+        f"HTTP Fetches: {fetches['requests_sent']} sent, {fetches['cache_hits'] + fetches['disk_hits']} cached, {fetches['coalesced']} shared, {fetches['not_modified']} not modified, {fetches['stale_served']} stale",
+        *app.get_circuit_breaker_lines(),
+        *app.get_web_server_lines(),
         f"Active Page: {app.config.get('active_page', 'default')}",
         "",
+        "Render timings (p50 / p95 / max):",
+        *app.get_render_timing_lines(),
+        "",
         "Per-widget diagnostics:",
     ]
     for name in app.get_sorted_widget_names():
@@ -185,24 +221,44 @@ def _build_diagnostics(app):
     return lines
 
 
-def _build_state(app):
-    config = _safe_copy_config(app)
+def _build_meta(app):
+    """Slow-changing page metadata; cached by the server until invalidate_meta() is called."""
     return {
+        "available_fonts": sorted(QFontDatabase.families()),
+        "widget_types": [w for w in sorted(WIDGET_CLASSES.keys()) if w not in {"sunrise"}],
+        "templates": app.get_available_template_names(),
+        "profiles": _list_profiles(),
+        "background_mode_options": ["None"] + [f"Camera {i}" for i in app.get_available_cameras()] + ["Camera", "Image", "Video", "YouTube"],
+        "youtube_quality_options": ["Best Available", "1080p", "720p", "480p"],
+        "feed_refresh_options": ["900000", "1800000", "3600000", "7200000", "21600000", "43200000", "86400000"],
+    }
+
+
+def _build_state(server, since=None, epoch=None, include_diagnostics=False):
+    app = server.app
+    config = dict(app.config)
+    sections = {
         "config": config,
-        "meta": {
-            "available_fonts": sorted(QFontDatabase.families()),
-            "widget_types": [w for w in sorted(WIDGET_CLASSES.keys()) if w not in {"sunrise"}],
-            "templates": app.get_available_template_names(),
-            "profiles": _list_profiles(),
-            "current_profile": config.get("active_profile_name", "default"),
-            "layout_pages": app.get_layout_pages(),
-            "widget_statuses": {name: app.get_widget_status(name) for name in config.get("widget_positions", {})},
-            "diagnostics_lines": _build_diagnostics(app),
-            "background_mode_options": ["None"] + [f"Camera {i}" for i in app.detect_available_cameras()] + ["Camera", "Image", "Video", "YouTube"],
-            "youtube_quality_options": ["Best Available", "1080p", "720p", "480p"],
-            "feed_refresh_options": ["900000", "1800000", "3600000", "7200000", "21600000", "43200000", "86400000"],
-        },
+        "widget_statuses": {name: app.get_widget_status(name) for name in config.get("widget_positions", {})},
+    }
+    rev, full, changed, removed = server.state_tracker.diff(sections, since, epoch)
+    state = {
+        "rev": rev,
+        "epoch": server.state_tracker.epoch,
+        "full": full,
+        "meta_version": server.meta_version,
+        "current_profile": config.get("active_profile_name", "default"),
+        "layout_pages": app.get_layout_pages(),
     }
+    for section, values in sections.items():
+        state[section] = {key: values[key] for key in changed.get(section, ())}
+    if not full:
+        state["removed"] = {section: sorted(keys) for section, keys in removed.items()}
+    if include_diagnostics:
+        state["diagnostics_lines"] = _build_diagnostics(app)
+        state["frame_pacing"] = app.get_frame_pacing_stats()
+        state["render_timings"] = app.render_profiler.summary()
+    return state
 
 
 def _save_profile(app, name):
@@ -276,32 +332,186 @@ def _handle_action(app, action, payload):
     raise ValueError(f"Unknown action: {action}")
 
 
+def _preview_params(query):
+    """Reads the optional ?w=<max width>&q=<jpeg quality> preview parameters."""
+    params = parse_qs(query)
+    values = []
+    for name in ("w", "q"):
+        try:
+            values.append(int(params[name][0]))
+        except (KeyError, ValueError):
+            values.append(None)
+    return values
+
+
+class LatencyHistogram:
+    """Fixed-bucket request latency counts per route, cheap enough to update on every request."""
+
+    def __init__(self, buckets_ms=LATENCY_BUCKETS_MS):
+        self.buckets_ms = buckets_ms
+        self.routes = {}
+        self.lock = threading.Lock()
+
+    def record(self, route, seconds):
+        elapsed_ms = seconds * 1000.0
+        index = bisect.bisect_left(self.buckets_ms, elapsed_ms)
+        with self.lock:
+            entry = self.routes.get(route)
+            if entry is None:
+                entry = self.routes[route] = {"counts": [0] * (len(self.buckets_ms) + 1), "count": 0, "max_ms": 0.0}
+            entry["counts"][index] += 1
+            entry["count"] += 1
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+
+    def _percentile(self, entry, fraction):
+        # Reports the upper bound of the bucket holding the percentile, capped at the observed max.
+        target = entry["count"] * fraction
+        seen = 0
+        for index, count in enumerate(entry["counts"]):
+            seen += count
+            if seen >= target:
+                return min(self.buckets_ms[index], entry["max_ms"]) if index < len(self.buckets_ms) else entry["max_ms"]
+        return entry["max_ms"]
+
+    def summary(self):
+        with self.lock:
+            return {
+                route: {
+                    "count": entry["count"],
+                    "p50": self._percentile(entry, 0.5),
+                    "p95": self._percentile(entry, 0.95),
+                    "max_ms": entry["max_ms"],
+                    "buckets": dict(zip([f"<={b}ms" for b in self.buckets_ms] + [f">{self.buckets_ms[-1]}ms"], entry["counts"])),
+                }
+                for route, entry in sorted(self.routes.items())
+            }
+
+
+class StateTracker:
+    """Fingerprints config keys and widget statuses so /api/state?since=<rev> can send only what changed."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Identifies this server run; a client holding a rev from another run gets a full state.
+        self.epoch = os.urandom(6).hex()
+        self.rev = 0
+        self.fingerprints = {}
+        self.changed_at = {}
+
+    def diff(self, sections, since=None, epoch=None):
+        """Records changes in sections and returns (rev, full, changed, removed) relative to since."""
+        current = {}
+        for section, values in sections.items():
+            for key, value in values.items():
+                current[(section, key)] = json.dumps(value, sort_keys=True)
+        with self.lock:
+            updated = [item for item, text in current.items() if self.fingerprints.get(item) != text]
+            dropped = [item for item in self.fingerprints if item not in current]
+            if updated or dropped:
+                self.rev += 1
+                for item in updated + dropped:
+                    self.changed_at[item] = self.rev
+                self.fingerprints = current
+            rev = self.rev
+            full = since is None or epoch != self.epoch or since > rev
+            changed = {section: [] for section in sections}
+            removed = {section: [] for section in sections}
+            for item in current if full else (item for item, at in self.changed_at.items() if at > since):
+                section, key = item
+                (changed if item in current else removed)[section].append(key)
+            return rev, full, changed, removed
+
+
+class PrecompressedPage:
+    """A response body encoded once up front, with compressed variants and strong ETags per encoding."""
+
+    def __init__(self, body, content_type):
+        digest = hashlib.sha256(body).hexdigest()[:20]
+        self.content_type = content_type
+        self.variants = {
+            "identity": (body, f'"{digest}"'),
+            "gzip": (gzip.compress(body, compresslevel=9), f'"{digest}-gzip"'),
+        }
+        if brotli is not None:
+            self.variants["br"] = (brotli.compress(body, quality=11), f'"{digest}-br"')
+        self.etags = {etag for _, etag in self.variants.values()}
+
+    def select_encoding(self, accept_encoding):
+        accepted = set()
+        for token in accept_encoding.split(","):
+            coding, _, params = token.partition(";")
+            if params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+                accepted.add(coding.strip().lower())
+        for coding in ("br", "gzip"):
+            if coding in self.variants and coding in accepted:
+                return coding
+        return "identity"
+
+    def matches(self, if_none_match):
+        # Every variant carries the same content, so any of its ETags revalidates the page.
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or bool(self.etags & tags)
+
+
+def _render_index_html(server):
+    html = HTML_TEMPLATE.replace("__THEME_PRESETS__", json.dumps(THEME_PRESETS)).replace("__ACCESSIBILITY_PRESETS__", json.dumps(ACCESSIBILITY_PRESETS))
+    html = html.replace("/*__GENERAL__*/", server.general_js)
+    html = html.replace("/*__APPEARANCE__*/", server.appearance_js)
+    html = html.replace("/*__WIDGETS__*/", server.widgets_js)
+    html = html.replace("/*__DIAGNOSTICS__*/", server.diagnostics_js)
+    return html
+
+
 class MagicMirrorHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Idle keep-alive connections are dropped after this long so they do not pin pool workers.
+    timeout = WEB_KEEPALIVE_SECONDS
+
     def do_GET(self):
         parsed = urlparse(self.path)
+        if parsed.path == "/api/preview/stream":
+            # Long-lived; kept out of the latency histogram.
+            self.handle_preview_stream(*_preview_params(parsed.query))
+            return
+        started = time.perf_counter()
+        try:
+            self.route_get(parsed)
+        finally:
+            route = parsed.path if parsed.path in KNOWN_ROUTES else "other"
+            self.server.latency.record(f"GET {route}", time.perf_counter() - started)
+
+    def route_get(self, parsed):
         if parsed.path == "/":
-            html = HTML_TEMPLATE.replace("__THEME_PRESETS__", json.dumps(THEME_PRESETS)).replace("__ACCESSIBILITY_PRESETS__", json.dumps(ACCESSIBILITY_PRESETS))
-            html = html.replace("/*__GENERAL__*/", self.server.general_js)
-            html = html.replace("/*__APPEARANCE__*/", self.server.appearance_js)
-            html = html.replace("/*__WIDGETS__*/", self.server.widgets_js)
-            html = html.replace("/*__DIAGNOSTICS__*/", self.server.diagnostics_js)
-            self.send_response(200)
-            self.send_header("Content-type", "text/html")
-            self.end_headers()
-            self.wfile.write(html.encode("utf-8"))
+            self.send_static(self.server.index_page)
             return
         if parsed.path == "/api/state":
-            self.send_response(200)
-            self.send_header("Content-type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps(_build_state(self.server.app)).encode("utf-8"))
+            params = parse_qs(parsed.query)
+            try:
+                since = int(params["since"][0])
+            except (KeyError, ValueError):
+                since = None
+            epoch = params.get("epoch", [None])[0]
+            self.send_json(_build_state(self.server, since, epoch, params.get("diagnostics", ["0"])[0] == "1"))
+            return
+        if parsed.path == "/api/meta":
+            if parse_qs(parsed.query).get("refresh", ["0"])[0] == "1":
+                self.server.invalidate_meta()
+            self.send_static(self.server.get_meta_page())
             return
         if parsed.path == "/api/preview":
-            self.handle_preview()
+            self.handle_preview(*_preview_params(parsed.query))
             return
         self.send_error(404)
 
     def do_POST(self):
+        started = time.perf_counter()
+        try:
+            self.route_post()
+        finally:
+            route = self.path if self.path in KNOWN_ROUTES else "other"
+            self.server.latency.record(f"POST {route}", time.perf_counter() - started)
+
+    def route_post(self):
         length = int(self.headers.get("Content-Length", 0))
         payload = json.loads(self.rfile.read(length) if length else b"{}")
         if self.path == "/api/config":
@@ -311,47 +521,169 @@ class MagicMirrorHandler(BaseHTTPRequestHandler):
                 self.server.app.migrate_config_schema()
                 self.server.app.save_config()
                 self.server.app.handle_remote_config_update()
-                self.send_response(200)
-                self.send_header("Content-type", "application/json")
-                self.end_headers()
-                self.wfile.write(json.dumps({"status": "ok"}).encode("utf-8"))
+                self.send_json({"status": "ok"})
             except Exception as e:
                 self.send_error(500, str(e))
             return
         if self.path == "/api/action":
             try:
                 message = _handle_action(self.server.app, payload.get("action", ""), payload.get("payload", {}))
-                self.send_response(200)
-                self.send_header("Content-type", "application/json")
-                self.end_headers()
-                self.wfile.write(json.dumps({"status": "ok", "message": message}).encode("utf-8"))
+                # Actions can add or remove profiles and templates listed in the metadata.
+                self.server.invalidate_meta()
+                self.send_json({"status": "ok", "message": message})
             except Exception as e:
                 self.send_error(500, str(e))
             return
         self.send_error(404)
 
-    def handle_preview(self):
-        img_bytes = self.server.app.get_preview_image()
+    def send_static(self, page):
+        coding = page.select_encoding(self.headers.get("Accept-Encoding", ""))
+        body, etag = page.variants[coding]
+        if page.matches(self.headers.get("If-None-Match", "")):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", STATIC_CACHE_CONTROL)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-type", page.content_type)
+        if coding != "identity":
+            self.send_header("Content-Encoding", coding)
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", STATIC_CACHE_CONTROL)
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, data, status=200):
+        self.send_body(json.dumps(data).encode("utf-8"), "application/json", status)
+
+    def send_body(self, body, content_type, status=200):
+        """Sends a complete response with Content-Length so the connection can be reused, gzipped when accepted."""
+        compressed = len(body) >= GZIP_MIN_BYTES and "gzip" in self.headers.get("Accept-Encoding", "")
+        if compressed:
+            body = gzip.compress(body, compresslevel=GZIP_LEVEL)
+        self.send_response(status)
+        self.send_header("Content-type", content_type)
+        if compressed:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_preview(self, max_width=None, quality=None):
+        img_bytes = self.server.app.get_preview_image(max_width, quality)
         if img_bytes:
             self.send_response(200)
             self.send_header("Content-type", "image/jpeg")
+            self.send_header("Cache-Control", "no-store")
+            self.send_header("Content-Length", str(len(img_bytes)))
             self.end_headers()
             self.wfile.write(img_bytes)
         else:
             self.send_error(503, "Preview not available")
 
+    def handle_preview_stream(self, max_width=None, quality=None):
+        """Pushes each newly captured frame as multipart/x-mixed-replace until the client disconnects."""
+        app = self.server.app
+        app.add_preview_viewer()
+        try:
+            self.send_response(200)
+            self.send_header("Content-type", f"multipart/x-mixed-replace; boundary={STREAM_BOUNDARY}")
+            self.send_header("Cache-Control", "no-cache, no-store")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+            # Serial 0 means nothing has been captured yet, so the first wait blocks until a frame exists.
+            serial = 0
+            while not self.server.stopping.is_set():
+                frame, new_serial = app.wait_for_preview_frame(serial, STREAM_FRAME_WAIT_SECONDS, max_width, quality)
+                # Advance even when there is nothing to send, so the next wait blocks instead of returning at once.
+                serial = new_serial
+                if not frame:
+                    continue
+                self.wfile.write(
+                    f"--{STREAM_BOUNDARY}\r\nContent-Type: image/jpeg\r\nContent-Length: {len(frame)}\r\n\r\n".encode("ascii")
+                )
+                self.wfile.write(frame)
+                self.wfile.write(b"\r\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, ConnectionAbortedError):
+            pass
+        finally:
+            app.remove_preview_viewer()
+
     def log_message(self, format, *args):
         pass
 
 
-class MagicMirrorServer(HTTPServer):
-    def __init__(self, server_address, request_handler_class, app):
+class MagicMirrorServer(ThreadingHTTPServer):
+    def __init__(self, server_address, request_handler_class, app, max_handlers=WEB_MAX_HANDLERS):
         super().__init__(server_address, request_handler_class)
         self.app = app
+        self.stopping = threading.Event()
+        self.handler_pool = ThreadPoolExecutor(max_workers=max_handlers, thread_name_prefix="web-handler")
+        self.latency = LatencyHistogram()
+        self.connections = set()
+        self.connections_lock = threading.Lock()
+        self.state_tracker = StateTracker()
+        self.meta_lock = threading.Lock()
+        self.meta_page = None
+        self.meta_version = 0
         self.general_js = GENERAL_JS
         self.appearance_js = APPEARANCE_JS
         self.widgets_js = WIDGETS_JS
         self.diagnostics_js = DIAGNOSTICS_JS
+        # None of the page inputs change at runtime, so it is rendered and compressed once.
+        self.index_page = PrecompressedPage(_render_index_html(self).encode("utf-8"), "text/html; charset=utf-8")
+
+    def get_meta_page(self):
+        # Built under the lock so simultaneous page loads share one font and directory scan.
+        with self.meta_lock:
+            if self.meta_page is None:
+                self.meta_page = PrecompressedPage(json.dumps(_build_meta(self.app)).encode("utf-8"), "application/json")
+            return self.meta_page
+
+    def invalidate_meta(self):
+        with self.meta_lock:
+            self.meta_page = None
+            self.meta_version += 1
+
+    def process_request(self, request, client_address):
+        # Replaces ThreadingMixIn's thread-per-connection with the bounded pool.
+        self.handler_pool.submit(self.process_request_thread, request, client_address)
+
+    def process_request_thread(self, request, client_address):
+        with self.connections_lock:
+            self.connections.add(request)
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            with self.connections_lock:
+                self.connections.discard(request)
+
+    def shutdown(self):
+        self.stopping.set()
+        super().shutdown()
+        self.handler_pool.shutdown(wait=False, cancel_futures=True)
+        # Wake workers parked on idle keep-alive connections so the pool drains promptly.
+        with self.connections_lock:
+            connections = list(self.connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        self.server_close()
+
+    def get_latency_lines(self):
+        lines = ["Web Requests (p50 / p95 / max):"]
+        for route, stats in self.latency.summary().items():
+            lines.append(f"  {route}: {stats['count']} requests, {stats['p50']:.0f} / {stats['p95']:.0f} / {stats['max_ms']:.0f} ms")
+        return lines if len(lines) > 1 else ["Web Requests: none yet"]
 
 
 def start_server(app, port=815):
@@ -15,6 +15,17 @@ import random
 import socket
 import textwrap
 import math
+import heapq
+import bisect
+import queue
+import json
+import hashlib
+import asyncio
+import functools
+import concurrent.futures
+from urllib.parse import urlparse
+from email.utils import parsedate_to_datetime
+from PySide6.QtCore import QObject, QTimer, Qt, Signal
 
 # Try to import psutil for system stats
 try:
@@ -44,6 +55,19 @@ AFTERSHIP_API_BASE = "https://api.aftership.com/tracking/2024-07/trackings"
 FMP_API_KEY = os.environ.get("FMP_API_KEY") 
 FMP_BASE_URL = "https://financialmodelingprep.com/api/v3/quote/"
 
+# Regular NYSE/Nasdaq session; exchange holidays are not modelled.
+MARKET_TZ = pytz.timezone("America/New_York")
+MARKET_OPEN = (9, 30)
+MARKET_CLOSE = (16, 0)
+STOCK_MARKET_REFRESH_MS = 60000
+SPORTS_LIVE_REFRESH_MS = 30000
+SPORTS_IDLE_REFRESH_MS = 3600000
+MIN_ADAPTIVE_REFRESH_MS = 30000
+
+# Failures that should leave a widget's last good content on screen rather than an error.
+STALE_OK_ERRORS = {"error", "fetch", "network"}
+STALE_CONTENT_MAX_AGE = timedelta(hours=6)
+
 WEATHER_EMOJI_MAP = {
     "Sunny": "☀️",
     "Clear": "☀️",
@@ -79,14 +103,16 @@ PHOTO_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".webp", ".gif"}
 def make_session():
     s = requests.Session()
     s.headers.update({"User-Agent": USER_AGENT})
+    # One quick retry for blips; sustained outages are left to the per-host circuit breakers.
     retries = Retry(
-        total=3,
+        total=1,
         backoff_factor=0.4,
         status_forcelist=[429, 500, 502, 503, 504],
         allowed_methods=["GET"],
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retries)
+    # Enough pooled connections per host for the async engine's concurrent fetches.
+    adapter = HTTPAdapter(max_retries=retries, pool_connections=32, pool_maxsize=16)
     s.mount("http://", adapter)
     s.mount("https://", adapter)
     s.verify = certifi.where()
@@ -94,6 +120,621 @@ def make_session():
 
 SESSION = make_session()
 
+# How long a parsed response is reused by other widgets asking for the same request.
+FETCH_TTL_SECONDS = 30
+ICAL_FETCH_TTL_SECONDS = 300
+SUN_FETCH_TTL_SECONDS = 900
+
+HTTP_CACHE_DIR = os.path.join(".cache", "http")
+# The disk cache is pruned to these bounds, least recently used entries first.
+HTTP_CACHE_MAX_ENTRIES = 500
+HTTP_CACHE_MAX_BYTES = 64 * 1024 * 1024
+HTTP_CACHE_MAX_AGE_SECONDS = 7 * 86400
+# Upper bound on how long a server's Cache-Control/Expires may keep us from asking again.
+MAX_HTTP_FRESHNESS_SECONDS = 86400
+
+def http_freshness(headers):
+    """Returns (storable, seconds fresh or None when the server gave no lifetime)."""
+    directives = {}
+    for part in headers.get("Cache-Control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip().strip('"')
+    if "no-store" in directives:
+        return False, None
+    if "no-cache" in directives:
+        return True, 0
+    if "max-age" in directives:
+        try:
+            return True, max(0, min(MAX_HTTP_FRESHNESS_SECONDS, int(directives["max-age"])))
+        except ValueError:
+            pass
+    expires = headers.get("Expires")
+    if expires:
+        try:
+            expires_at = parsedate_to_datetime(expires)
+            date_header = headers.get("Date")
+            served_at = parsedate_to_datetime(date_header) if date_header else datetime.now(expires_at.tzinfo)
+            seconds = (expires_at - served_at).total_seconds()
+            return True, max(0, min(MAX_HTTP_FRESHNESS_SECONDS, int(seconds)))
+        except (TypeError, ValueError):
+            return True, 0
+    return True, None
+
+class CachedResponse:
+    """Just enough of a requests.Response for the parsers to read a stored body."""
+
+    def __init__(self, content, headers=None):
+        self.content = content
+        self.headers = headers or {}
+        self.status_code = 200
+
+    def json(self):
+        return json.loads(self.content)
+
+class HttpDiskCache:
+    """Response bodies and their validators, kept on disk across restarts.
+
+    Each request gets a .json record (ETag, Last-Modified, expiry in wall-clock
+    time) and a .body file named by a hash of the request, so nothing in the
+    directory names the URL or its credentials.
+    """
+
+    # Pruning lists the whole directory, so it runs on the first write and then every this many writes.
+    PRUNE_EVERY_WRITES = 25
+
+    def __init__(self, directory=HTTP_CACHE_DIR, max_entries=HTTP_CACHE_MAX_ENTRIES,
+                 max_bytes=HTTP_CACHE_MAX_BYTES, max_age=HTTP_CACHE_MAX_AGE_SECONDS):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.lock = threading.Lock()
+        self.writes_until_prune = 0
+
+    def _paths(self, request_key):
+        digest = hashlib.sha256(repr(request_key).encode("utf-8")).hexdigest()
+        base = os.path.join(self.directory, digest)
+        return base + ".json", base + ".body"
+
+    def load(self, request_key):
+        meta_path, _ = self._paths(request_key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+            # The record's mtime doubles as its last-use time for pruning.
+            os.utime(meta_path)
+            return record
+        except (OSError, ValueError):
+            return None
+
+    def load_body(self, request_key):
+        _, body_path = self._paths(request_key)
+        try:
+            with open(body_path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def store(self, request_key, record, body=None):
+        meta_path, body_path = self._paths(request_key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            if body is not None:
+                self._write_atomic(body_path, body)
+            self._write_atomic(meta_path, json.dumps(record).encode("utf-8"))
+        except OSError as e:
+            print(f"HTTP cache write error: {e}")
+            return
+        with self.lock:
+            self.writes_until_prune -= 1
+            if self.writes_until_prune > 0:
+                return
+            self.writes_until_prune = self.PRUNE_EVERY_WRITES
+        self.prune()
+
+    def prune(self):
+        """Drops entries older than max_age, then the least recently used until under both size bounds."""
+        entries = {}
+        try:
+            with os.scandir(self.directory) as it:
+                for item in it:
+                    if not item.is_file():
+                        continue
+                    digest = item.name.split(".", 1)[0]
+                    stat = item.stat()
+                    entry = entries.setdefault(digest, {"paths": [], "bytes": 0, "used": 0.0})
+                    entry["paths"].append(item.path)
+                    entry["bytes"] += stat.st_size
+                    if item.name.endswith(".json"):
+                        entry["used"] = stat.st_mtime
+                    elif not entry["used"]:
+                        entry["used"] = stat.st_mtime
+        except OSError as e:
+            print(f"HTTP cache prune error: {e}")
+            return
+        cutoff = time.time() - self.max_age
+        ordered = sorted(entries.values(), key=lambda entry: entry["used"])
+        total_bytes = sum(entry["bytes"] for entry in ordered)
+        remaining = len(ordered)
+        for entry in ordered:
+            if entry["used"] >= cutoff and remaining <= self.max_entries and total_bytes <= self.max_bytes:
+                break
+            for path in entry["paths"]:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            remaining -= 1
+            total_bytes -= entry["bytes"]
+
+    def discard(self, request_key):
+        for path in self._paths(request_key):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _write_atomic(path, data):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+class _PendingFetch:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request to a host whose breaker is open."""
+
+class CircuitBreaker:
+    """Tracks one host's health and stops requests to it while it is failing.
+
+    After FAILURE_THRESHOLD consecutive failures the breaker opens for an
+    exponentially growing, jittered backoff. When that expires a single trial
+    request is let through (half-open); success closes the breaker, failure
+    reopens it for longer.
+    """
+
+    FAILURE_THRESHOLD = 3
+    BASE_BACKOFF_SECONDS = 30
+    MAX_BACKOFF_SECONDS = 1800
+
+    def __init__(self, host):
+        self.host = host
+        self.state = "closed"
+        self.failures = 0
+        self.times_opened = 0
+        self.open_until = 0.0
+        self.last_error = ""
+
+    def allow(self, now):
+        if self.state == "closed":
+            return True
+        if self.state == "open" and now >= self.open_until:
+            self.state = "half-open"
+            return True
+        return False
+
+    def record_success(self):
+        self.state = "closed"
+        self.failures = 0
+        self.times_opened = 0
+        self.last_error = ""
+
+    def record_failure(self, now, error):
+        self.failures += 1
+        self.last_error = str(error)[:200]
+        if self.state == "half-open" or self.failures >= self.FAILURE_THRESHOLD:
+            self.times_opened += 1
+            backoff = min(self.MAX_BACKOFF_SECONDS, self.BASE_BACKOFF_SECONDS * 2 ** (self.times_opened - 1))
+            self.state = "open"
+            self.open_until = now + random.uniform(backoff / 2, backoff)
+
+    def describe(self, now):
+        return {
+            "host": self.host,
+            "state": self.state,
+            "failures": self.failures,
+            "retry_in": max(0, int(self.open_until - now)) if self.state == "open" else 0,
+            "last_error": self.last_error,
+        }
+
+def is_host_failure(error):
+    """Connection problems, timeouts, 429 and 5xx count against a host; other errors do not."""
+    if isinstance(error, requests.exceptions.HTTPError):
+        status = getattr(error.response, "status_code", 0) or 0
+        return status == 429 or status >= 500
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout, TimeoutError))
+
+class FetchCache:
+    """Shares one request and one parsed result between widgets asking for the same thing.
+
+    Entries are keyed on (method, URL, params, headers, parser) and reused until
+    their TTL runs out. A caller that arrives while the same request is already
+    running waits for it instead of sending its own. Failures are not cached.
+    Results are shared objects, so callers must treat them as read-only.
+
+    GET bodies are also kept in an HttpDiskCache. A stored response that is
+    still fresh by its Cache-Control/Expires headers is served without a
+    request, otherwise it is revalidated with If-None-Match/If-Modified-Since
+    and a 304 reuses the parsed result already in memory.
+
+    Each host has a CircuitBreaker. While a host is failing or its breaker is
+    open, the last good result (from memory or disk, up to
+    STALE_IF_ERROR_SECONDS old) is served instead of an error.
+    """
+
+    MAX_ENTRIES = 256
+    WAIT_TIMEOUT_SECONDS = 30
+    STALE_IF_ERROR_SECONDS = 6 * 3600
+
+    def __init__(self, session, disk_cache=None):
+        self.session = session
+        self.disk_cache = disk_cache
+        self.lock = threading.Lock()
+        self.entries = {}
+        self.pending = {}
+        self.requests_sent = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.not_modified = 0
+        self.disk_hits = 0
+        self.stale_served = 0
+        self.breakers = {}
+
+    @staticmethod
+    def make_key(method, url, params, headers, parser):
+        params_key = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        headers_key = tuple(sorted((str(k).lower(), str(v)) for k, v in (headers or {}).items()))
+        return (method.upper(), url, params_key, headers_key, parser)
+
+    def fetch(self, url, parser, params=None, headers=None, ttl=FETCH_TTL_SECONDS, timeout=10, method="GET"):
+        key = self.make_key(method, url, params, headers, parser)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self.cache_hits += 1
+                return entry[1]
+            pending = self.pending.get(key)
+            leader = pending is None
+            if leader:
+                pending = _PendingFetch()
+                self.pending[key] = pending
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            if not pending.done.wait(self.WAIT_TIMEOUT_SECONDS):
+                raise TimeoutError(f"Timed out waiting for shared request to {url}")
+            if pending.error is not None:
+                raise pending.error
+            return pending.result
+
+        try:
+            pending.result = self._fetch_guarded(key, entry, url, parser, params, headers, ttl, timeout, method)
+            return pending.result
+        except Exception as e:
+            pending.error = e
+            raise
+        finally:
+            with self.lock:
+                self.pending.pop(key, None)
+            pending.done.set()
+
+    def _fetch_guarded(self, key, entry, url, parser, params, headers, ttl, timeout, method):
+        host = urlparse(url).netloc.lower()
+        with self.lock:
+            breaker = self.breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(host)
+                self.breakers[host] = breaker
+            allowed = breaker.allow(time.monotonic())
+        if not allowed:
+            stale = self._stale_result(key, entry, parser)
+            if stale is not None:
+                return stale
+            raise CircuitOpenError(f"{host} is backing off after repeated failures")
+
+        try:
+            result, fresh_seconds = self._fetch_uncached(key, entry, url, parser, params, headers, timeout, method)
+        except Exception as e:
+            failed = is_host_failure(e)
+            with self.lock:
+                if failed:
+                    breaker.record_failure(time.monotonic(), e)
+                else:
+                    breaker.record_success()
+            stale = self._stale_result(key, entry, parser) if failed else None
+            if stale is not None:
+                print(f"Serving cached data for {host}: {e}")
+                return stale
+            raise
+        with self.lock:
+            breaker.record_success()
+            self._prune(time.monotonic())
+            self.entries[key] = (time.monotonic() + max(ttl, fresh_seconds or 0), result, time.time())
+        return result
+
+    def _stale_result(self, key, entry, parser):
+        """The last good result for key if it is recent enough to show while the source is down."""
+        now = time.time()
+        if entry is not None and now - entry[2] <= self.STALE_IF_ERROR_SECONDS:
+            with self.lock:
+                self.stale_served += 1
+            return entry[1]
+        disk = self.disk_cache if key[0] == "GET" else None
+        record = disk.load(key[:4]) if disk else None
+        if not record or now - record.get("stored_at", 0) > self.STALE_IF_ERROR_SECONDS:
+            return None
+        result = self._parse_stored(disk, key[:4], parser)
+        if result is None:
+            return None
+        with self.lock:
+            self.stale_served += 1
+            # Expired straight away, so the next caller still tries the source first.
+            self.entries[key] = (time.monotonic(), result, record["stored_at"])
+        return result
+
+    def get_breaker_states(self, include_closed=False):
+        now = time.monotonic()
+        with self.lock:
+            return [
+                breaker.describe(now)
+                for breaker in self.breakers.values()
+                if include_closed or breaker.state != "closed" or breaker.failures
+            ]
+
+    def _fetch_uncached(self, key, entry, url, parser, params, headers, timeout, method):
+        """Returns (parsed result, seconds the server says it stays fresh)."""
+        request_key = key[:4]
+        disk = self.disk_cache if method.upper() == "GET" else None
+        record = disk.load(request_key) if disk else None
+        now = time.time()
+        if record and record.get("expires_at", 0) > now:
+            result = entry[1] if entry else self._parse_stored(disk, request_key, parser)
+            if result is not None:
+                with self.lock:
+                    self.disk_hits += 1
+                return result, record["expires_at"] - now
+
+        request_headers = dict(headers or {})
+        if record:
+            if record.get("etag"):
+                request_headers["If-None-Match"] = record["etag"]
+            if record.get("last_modified"):
+                request_headers["If-Modified-Since"] = record["last_modified"]
+        resp = self.session.request(method, url, params=params, headers=request_headers, timeout=timeout)
+        with self.lock:
+            self.requests_sent += 1
+        storable, fresh_seconds = http_freshness(resp.headers)
+
+        if resp.status_code == 304 and record:
+            # Unchanged upstream: skip the parse whenever this process already has the result.
+            result = entry[1] if entry else self._parse_stored(disk, request_key, parser)
+            if result is not None:
+                with self.lock:
+                    self.not_modified += 1
+                record["expires_at"] = time.time() + (fresh_seconds or 0)
+                record["stored_at"] = time.time()
+                disk.store(request_key, record)
+                return result, fresh_seconds
+            # Body went missing from disk; fetch it again without validators.
+            disk.discard(request_key)
+            resp = self.session.request(method, url, params=params, headers=headers, timeout=timeout)
+            with self.lock:
+                self.requests_sent += 1
+            storable, fresh_seconds = http_freshness(resp.headers)
+
+        resp.raise_for_status()
+        result = parser(resp)
+        if disk:
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+            if storable and (etag or last_modified or fresh_seconds):
+                disk.store(request_key, {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "expires_at": time.time() + (fresh_seconds or 0),
+                    "stored_at": time.time(),
+                }, resp.content)
+            elif record:
+                disk.discard(request_key)
+        return result, fresh_seconds
+
+    @staticmethod
+    def _parse_stored(disk, request_key, parser):
+        body = disk.load_body(request_key)
+        if body is None:
+            return None
+        try:
+            return parser(CachedResponse(body))
+        except Exception as e:
+            print(f"HTTP cache parse error: {e}")
+            return None
+
+    def _prune(self, now):
+        if len(self.entries) < self.MAX_ENTRIES:
+            return
+        for key in [k for k, entry in self.entries.items() if entry[0] <= now]:
+            del self.entries[key]
+        if len(self.entries) >= self.MAX_ENTRIES:
+            oldest = min(self.entries, key=lambda k: self.entries[k][0])
+            del self.entries[oldest]
+
+    def get_stats(self):
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "requests_sent": self.requests_sent,
+                "cache_hits": self.cache_hits,
+                "coalesced": self.coalesced,
+                "not_modified": self.not_modified,
+                "disk_hits": self.disk_hits,
+                "stale_served": self.stale_served,
+                "open_breakers": sum(1 for b in self.breakers.values() if b.state != "closed"),
+            }
+
+FETCH_CACHE = FetchCache(SESSION, HttpDiskCache())
+
+def parse_json_response(resp):
+    return resp.json()
+
+def parse_ical_response(resp):
+    return ParsedCalendar.from_bytes(resp.content)
+
+def parse_feed_response(resp):
+    return feedparser.parse(resp.content)
+
+def fetch_json(url, params=None, headers=None, ttl=FETCH_TTL_SECONDS, timeout=10):
+    return FETCH_CACHE.fetch(url, parse_json_response, params=params, headers=headers, ttl=ttl, timeout=timeout)
+
+class _AsyncResultBridge(QObject):
+    finished = Signal(object, object)
+
+class AsyncFetchEngine:
+    """Runs widget fetches concurrently on one background asyncio loop.
+
+    Each fetch still goes through FETCH_CACHE (single-flight, disk cache,
+    pooled SESSION connections), but requests are issued from a bounded
+    executor so a widget can wait on many of them at once. Concurrency is
+    capped per host, and every fetch has a timeout; none can hang forever.
+
+    Worker threads block on run(); GUI-thread callers use submit() with a
+    callback, which is delivered back on the GUI thread via a queued signal.
+    """
+
+    MAX_CONCURRENT = 16
+    MAX_PER_HOST = 6
+    DEFAULT_TIMEOUT_SECONDS = 10
+
+    def __init__(self, fetch_cache):
+        self.fetch_cache = fetch_cache
+        self.lock = threading.Lock()
+        self.loop = None
+        self.thread = None
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT, thread_name_prefix="fetch")
+        self.host_limits = {}
+        # Created on the importing (GUI) thread so queued deliveries land there.
+        self.bridge = _AsyncResultBridge()
+        self.bridge.finished.connect(self._deliver, Qt.ConnectionType.QueuedConnection)
+
+    def _ensure_loop(self):
+        with self.lock:
+            if self.loop is not None:
+                return self.loop
+            ready = threading.Event()
+
+            def run_loop():
+                self.loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(self.loop)
+                ready.set()
+                self.loop.run_forever()
+
+            self.thread = threading.Thread(target=run_loop, name="async-fetch")
+            self.thread.daemon = True
+            self.thread.start()
+            ready.wait()
+            return self.loop
+
+    def _host_limit(self, url):
+        # Only touched from the loop thread, so the dict needs no lock.
+        host = urlparse(url).netloc.lower()
+        limit = self.host_limits.get(host)
+        if limit is None:
+            limit = asyncio.Semaphore(self.MAX_PER_HOST)
+            self.host_limits[host] = limit
+        return limit
+
+    async def fetch(self, url, parser=parse_json_response, params=None, headers=None, ttl=FETCH_TTL_SECONDS, timeout=DEFAULT_TIMEOUT_SECONDS):
+        if not timeout or timeout <= 0:
+            raise ValueError("A positive timeout is required for every fetch")
+        call = functools.partial(self.fetch_cache.fetch, url, parser, params=params, headers=headers, ttl=ttl, timeout=timeout)
+        async with self._host_limit(url):
+            # requests applies the timeout per connect/read; this bounds the whole call.
+            return await asyncio.wait_for(asyncio.get_running_loop().run_in_executor(self.executor, call), timeout * 2)
+
+    async def fetch_many(self, urls, **kwargs):
+        """Results in the order of urls; a failed fetch yields its exception instead."""
+        return await asyncio.gather(*(self.fetch(url, **kwargs) for url in urls), return_exceptions=True)
+
+    def run(self, coro, timeout=None):
+        """Blocks the calling (non-GUI) thread until coro finishes on the loop."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result(timeout)
+
+    def submit(self, coro, on_done=None):
+        """Schedules coro; on_done(result, error) is later called on the GUI thread."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+        if on_done is not None:
+            future.add_done_callback(lambda f: self.bridge.finished.emit(on_done, f))
+        return future
+
+    @staticmethod
+    def _deliver(on_done, future):
+        try:
+            result = future.result()
+        except Exception as e:
+            on_done(None, e)
+            return
+        on_done(result, None)
+
+ASYNC_FETCH = AsyncFetchEngine(FETCH_CACHE)
+
+STOCK_QUOTE_TTL_SECONDS = 60
+# FMP accepts comma-separated symbols; long watchlists are split so URLs stay reasonable.
+STOCK_QUOTE_BATCH_SIZE = 25
+_STOCK_QUOTES = {}
+_STOCK_QUOTES_LOCK = threading.Lock()
+
+def _plan_stock_quotes(symbols, api_key):
+    """Returns (cached quotes, batch URLs still to fetch) for the given symbols."""
+    wanted = list(dict.fromkeys(symbol.strip().upper() for symbol in symbols if symbol.strip()))
+    now = time.monotonic()
+    quotes = {}
+    with _STOCK_QUOTES_LOCK:
+        for symbol in wanted:
+            cached = _STOCK_QUOTES.get(symbol)
+            if cached and cached[0] > now:
+                quotes[symbol] = cached[1]
+    missing = [symbol for symbol in wanted if symbol not in quotes]
+    chunks = [missing[i:i + STOCK_QUOTE_BATCH_SIZE] for i in range(0, len(missing), STOCK_QUOTE_BATCH_SIZE)]
+    urls = [f"{FMP_BASE_URL}{','.join(chunk)}?apikey={api_key}" for chunk in chunks]
+    return quotes, urls
+
+def _merge_stock_quotes(quotes, results):
+    """Caches fetched batches into quotes; raises the first error only when no quote is available."""
+    first_error = None
+    for result in results:
+        if isinstance(result, Exception):
+            first_error = first_error or result
+            continue
+        expires = time.monotonic() + STOCK_QUOTE_TTL_SECONDS
+        with _STOCK_QUOTES_LOCK:
+            for quote in result or []:
+                symbol = str(quote.get("symbol", "")).upper()
+                if symbol:
+                    _STOCK_QUOTES[symbol] = (expires, quote)
+                    quotes[symbol] = quote
+    if first_error is not None and not quotes:
+        raise first_error
+    return quotes
+
+def fetch_stock_quotes(symbols, api_key):
+    """Returns {SYMBOL: quote dict} from FMP, batched and shared across stock widgets.
+
+    Quotes younger than STOCK_QUOTE_TTL_SECONDS are reused; only the rest are
+    requested, in concurrent chunks. Blocks until they arrive, so it is meant for
+    worker threads; StockWidget uses the non-blocking path instead.
+    """
+    quotes, urls = _plan_stock_quotes(symbols, api_key)
+    if not urls:
+        return quotes
+    return _merge_stock_quotes(quotes, ASYNC_FETCH.run(ASYNC_FETCH.fetch_many(urls, ttl=STOCK_QUOTE_TTL_SECONDS)))
+
 def collect_ical_urls(config, widget_name):
     widget_settings = config.get("widget_settings", {}).get(widget_name, {})
     urls = widget_settings.get("urls", [])
@@ -155,118 +796,441 @@ def _extract_exdates(component):
                 exdates.add(ex_dt)
     return exdates
 
-def fetch_ical_events(urls, window_start=None, window_end=None):
-    all_events = []
-    had_errors = False
+class RecurrenceSeries:
+    def __init__(self, rule):
+        self.rule = rule
+        # bucket index -> occurrences inside that bucket, in order
+        self.buckets = {}
+
+class RecurrenceCache:
+    """Compiled RRULEs and their occurrences, memoized per fixed time bucket.
+
+    Series are keyed on (uid, rrule text, dtstart), so re-parsing a calendar
+    because some other event changed still reuses every unchanged series, and a
+    window that slides forward only expands the buckets it newly touches.
+    """
+
+    BUCKET = timedelta(days=28)
+    EPOCH = datetime(2000, 1, 1, tzinfo=pytz.utc)
+    MAX_SERIES = 4096
+    MAX_BUCKETS_PER_SERIES = 32
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.series = {}
+
+    def get_series(self, uid, rrule_text, dtstart):
+        key = (uid, rrule_text, dtstart)
+        with self.lock:
+            series = self.series.pop(key, None)
+            if series is not None:
+                self.series[key] = series
+                return series
+        # cache=True lets dateutil keep what it has generated between bucket expansions.
+        series = RecurrenceSeries(rrulestr(rrule_text, dtstart=dtstart, cache=True))
+        with self.lock:
+            self.series[key] = series
+            while len(self.series) > self.MAX_SERIES:
+                self.series.pop(next(iter(self.series)))
+        return series
+
+    def _bucket_index(self, moment):
+        return (moment - self.EPOCH) // self.BUCKET
+
+    def _bucket(self, series, index):
+        occurrences = series.buckets.get(index)
+        if occurrences is None:
+            bucket_start = self.EPOCH + index * self.BUCKET
+            bucket_end = bucket_start + self.BUCKET
+            occurrences = [o for o in series.rule.between(bucket_start, bucket_end, inc=True) if o < bucket_end]
+            with self.lock:
+                series.buckets[index] = occurrences
+                if len(series.buckets) > self.MAX_BUCKETS_PER_SERIES:
+                    series.buckets.pop(min(series.buckets))
+        return occurrences
+
+    def iter_from(self, series, start, end):
+        """Lazily yields occurrences in [start, end), expanding one bucket at a time."""
+        for index in range(self._bucket_index(start), self._bucket_index(end) + 1):
+            for occurrence in self._bucket(series, index):
+                if occurrence >= end:
+                    return
+                if occurrence >= start:
+                    yield occurrence
+
+    def contains(self, series, moment):
+        return moment in self._bucket(series, self._bucket_index(moment))
+
+RECURRENCE_CACHE = RecurrenceCache()
+
+class ParsedCalendar:
+    """VEVENT tables for one calendar body, parsed once per distinct content.
+
+    Masters keep their RecurrenceCache series and overrides are indexed by
+    (uid, recurrence-id), so a window query never touches the iCal text again.
+    Calendar names are left as None when the feed has none; iter_events() fills in
+    the source URL.
+    """
+
+    CACHE_SIZE = 16
+    _cache = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, content):
+        cal = Calendar.from_ical(content)
+        self.masters = []
+        self.overrides = {}
+        self.overrides_by_uid = {}
+        calendar_name = str(cal.get("x-wr-calname")) if cal.get("x-wr-calname") else None
+        calendar_color = str(cal.get("x-apple-calendar-color") or "#7dd3fc")
+        for component in cal.walk():
+            if component.name != "VEVENT":
+                continue
+            recurrence_id_prop = component.get("recurrence-id")
+            if recurrence_id_prop:
+                recurrence_id, _ = _normalize_ical_datetime(recurrence_id_prop.dt)
+                event_dt, is_dt = _normalize_ical_datetime(component.get("dtstart").dt if component.get("dtstart") else None)
+                if recurrence_id is None or event_dt is None:
+                    continue
+                end_dt = _get_event_end(component, event_dt, is_dt)
+                override = self.overrides[(str(component.get("uid", "")), recurrence_id)] = {
+                    "uid": str(component.get("uid", "")),
+                    "start": event_dt,
+                    "end": end_dt,
+                    "summary": str(component.get("summary", "(No title)")),
+                    "location": str(component.get("location", "")).strip(),
+                    "is_all_day": not is_dt,
+                    "calendar_name": str(component.get("x-wr-calname")) if component.get("x-wr-calname") else None,
+                    "calendar_color": str(component.get("x-apple-calendar-color") or "#7dd3fc"),
+                    "status": str(component.get("status", "CONFIRMED")),
+                    "recurrence_id": recurrence_id,
+                }
+                self.overrides_by_uid.setdefault(override["uid"], []).append(override)
+                continue
+            self._add_master(component, calendar_name, calendar_color)
+
+    def _add_master(self, component, calendar_name, calendar_color):
+        dtstart_prop = component.get("dtstart")
+        if not dtstart_prop:
+            return
+        summary = str(component.get("summary", "(No title)"))
+        location = str(component.get("location", "")).strip()
+        event_dt, is_dt = _normalize_ical_datetime(dtstart_prop.dt)
+        if event_dt is None:
+            return
+        event_end = _get_event_end(component, event_dt, is_dt)
+        uid = str(component.get("uid", f"{summary}|{location}"))
+        series = None
+        rrule_value = component.get("rrule")
+        if rrule_value:
+            try:
+                series = RECURRENCE_CACHE.get_series(uid, rrule_value.to_ical().decode("utf-8"), event_dt)
+            except Exception:
+                series = None
+        self.masters.append({
+            "uid": uid,
+            "summary": summary,
+            "location": location,
+            "start": event_dt,
+            "is_dt": is_dt,
+            "duration": max(timedelta(minutes=1), event_end - event_dt),
+            "exdates": _extract_exdates(component),
+            "status": str(component.get("status", "CONFIRMED")),
+            "calendar_name": calendar_name,
+            "calendar_color": calendar_color,
+            "series": series,
+        })
+
+    @classmethod
+    def from_bytes(cls, content):
+        digest = hashlib.sha256(content).hexdigest()
+        with cls._cache_lock:
+            parsed = cls._cache.pop(digest, None)
+            if parsed is not None:
+                # Re-insert so the dict stays in least-recently-used order.
+                cls._cache[digest] = parsed
+                return parsed
+        parsed = cls(content)
+        with cls._cache_lock:
+            cls._cache[digest] = parsed
+            while len(cls._cache) > cls.CACHE_SIZE:
+                cls._cache.pop(next(iter(cls._cache)))
+        return parsed
+
+    def iter_events(self, url, window_start, window_end, now, seen):
+        """Yields events by start, expanding recurrences only as far as they are consumed."""
+        streams = [self._master_events(url, master, window_start, window_end, now, seen) for master in self.masters]
+        return heapq.merge(*streams, key=lambda event: event["start"])
+
+    def _master_events(self, url, master, window_start, window_end, now, seen):
+        series = master["series"]
+        overrides = self.overrides_by_uid.get(master["uid"]) if series is not None else None
+        if not overrides:
+            for occurrence_dt in self._occurrences(master, window_start, window_end):
+                event = self._occurrence_event(url, master, occurrence_dt, now, seen)
+                if event:
+                    yield event
+            return
+        # An override can move its occurrence anywhere, so overridden occurrences are
+        # buffered and merged back in by their own start rather than the rule's.
+        overridden = {override["recurrence_id"] for override in overrides}
+        moved = sorted(
+            (
+                override for override in overrides
+                if window_start <= override["recurrence_id"] < window_end and RECURRENCE_CACHE.contains(series, override["recurrence_id"])
+            ),
+            key=lambda override: override["start"],
+        )
+        plain = (
+            self._occurrence_event(url, master, occurrence_dt, now, seen)
+            for occurrence_dt in self._occurrences(master, window_start, window_end)
+            if occurrence_dt not in overridden
+        )
+        replaced = (self._occurrence_event(url, master, override["recurrence_id"], now, seen) for override in moved)
+        yield from heapq.merge(filter(None, plain), filter(None, replaced), key=lambda event: event["start"])
+
+    @staticmethod
+    def _occurrences(master, window_start, window_end):
+        event_dt = master["start"]
+        series = master["series"]
+        if series is not None:
+            try:
+                return RECURRENCE_CACHE.iter_from(series, window_start, window_end)
+            except Exception:
+                pass
+        return [event_dt] if window_start <= event_dt < window_end else []
+
+    def _occurrence_event(self, url, master, occurrence_dt, now, seen):
+        if occurrence_dt in master["exdates"]:
+            return None
+        uid = master["uid"]
+        override = self.overrides.get((uid, occurrence_dt))
+        source = override or master
+        effective_start = override["start"] if override else occurrence_dt
+        effective_end = override["end"] if override else occurrence_dt + master["duration"]
+        effective_summary = source["summary"]
+        effective_location = source["location"]
+        dedupe_key = (uid, effective_start, effective_summary, effective_location)
+        if dedupe_key in seen:
+            return None
+        seen.add(dedupe_key)
+        return {
+            "uid": uid,
+            "start": effective_start,
+            "end": effective_end,
+            "summary": effective_summary,
+            "location": effective_location,
+            "is_all_day": override["is_all_day"] if override else (not master["is_dt"]),
+            "is_ongoing": effective_start <= now < effective_end,
+            "is_multi_day": effective_end.date() > effective_start.date(),
+            "source_url": url,
+            "calendar_name": source["calendar_name"] or url,
+            "calendar_color": source["calendar_color"],
+            "status": source["status"],
+            "recurrence_id": override["recurrence_id"] if override else None,
+        }
+
+def fetch_ical_events(urls, window_start=None, window_end=None, limit=None):
+    """Events starting in [window_start, window_end), sorted by start, read from the shared index.
+
+    The index only covers ICAL_INDEX_LOOKBACK_DAYS back to ICAL_INDEX_HORIZON_DAYS
+    ahead of today, so windows reaching past that are clipped. With a limit,
+    only the first `limit` events are expanded.
+    """
     now = datetime.now(pytz.utc)
     if window_start is None:
         window_start = now
     if window_end is None:
         window_end = window_start + timedelta(days=180)
-    seen = set()
-
+    index, had_errors = get_ical_event_index(urls)
+    events = [
+        # Index events are shared; is_ongoing is recomputed for this call's now.
+        dict(event, is_ongoing=event["start"] <= now < event["end"])
+        for event in index.starting_between(window_start, window_end, limit)
+        if event["start"] < window_end
+    ]
+    return events, had_errors
+
+def load_ical_calendars(urls):
+    calendars = []
+    had_errors = False
     for url in urls:
         if not url or "YOUR_ICAL_URL_HERE" in url:
             continue
         try:
-            r = SESSION.get(url, timeout=10)
-            r.raise_for_status()
-            cal = Calendar.from_ical(r.content)
-            overrides = {}
-            masters = []
-            for component in cal.walk():
-                if component.name != "VEVENT":
-                    continue
-                recurrence_id_prop = component.get("recurrence-id")
-                if recurrence_id_prop:
-                    recurrence_id, _ = _normalize_ical_datetime(recurrence_id_prop.dt)
-                    event_dt, is_dt = _normalize_ical_datetime(component.get("dtstart").dt if component.get("dtstart") else None)
-                    if recurrence_id is None or event_dt is None:
-                        continue
-                    end_dt = _get_event_end(component, event_dt, is_dt)
-                    overrides[(str(component.get("uid", "")), recurrence_id)] = {
-                        "uid": str(component.get("uid", "")),
-                        "start": event_dt,
-                        "end": end_dt,
-                        "summary": str(component.get("summary", "(No title)")),
-                        "location": str(component.get("location", "")).strip(),
-                        "is_all_day": not is_dt,
-                        "source_url": url,
-                        "calendar_name": str(component.get("x-wr-calname") or url),
-                        "calendar_color": str(component.get("x-apple-calendar-color") or "#7dd3fc"),
-                        "status": str(component.get("status", "CONFIRMED")),
-                        "recurrence_id": recurrence_id,
-                    }
-                    continue
-                masters.append(component)
-
-            for component in masters:
-                dtstart_prop = component.get("dtstart")
-                if not dtstart_prop:
-                    continue
-
-                dtstart_raw = dtstart_prop.dt
-                summary = str(component.get("summary", "(No title)"))
-                location = str(component.get("location", "")).strip()
-                uid = str(component.get("uid", f"{summary}|{location}"))
-                event_dt, is_dt = _normalize_ical_datetime(dtstart_raw)
-                if event_dt is None:
-                    continue
-                event_end = _get_event_end(component, event_dt, is_dt)
-                exdates = _extract_exdates(component)
-                calendar_name = str(cal.get("x-wr-calname") or url)
-                calendar_color = str(cal.get("x-apple-calendar-color") or "#7dd3fc")
-
-                rrule_value = component.get("rrule")
-                if rrule_value:
-                    try:
-                        rule = rrulestr(rrule_value.to_ical().decode("utf-8"), dtstart=event_dt)
-                        occurrences = rule.between(window_start, window_end, inc=True)
-                    except Exception:
-                        occurrences = [event_dt]
-                else:
-                    occurrences = [event_dt]
-
-                duration = max(timedelta(minutes=1), event_end - event_dt)
-                for occurrence_dt in occurrences:
-                    if occurrence_dt in exdates:
-                        continue
-                    if occurrence_dt < window_start or occurrence_dt >= window_end:
-                        continue
-                    override = overrides.get((uid, occurrence_dt))
-                    effective_start = override["start"] if override else occurrence_dt
-                    effective_end = override["end"] if override else occurrence_dt + duration
-                    effective_summary = override["summary"] if override else summary
-                    effective_location = override["location"] if override else location
-                    effective_is_all_day = override["is_all_day"] if override else (not is_dt)
-                    effective_status = override["status"] if override else str(component.get("status", "CONFIRMED"))
-                    effective_calendar_name = override["calendar_name"] if override else calendar_name
-                    effective_calendar_color = override["calendar_color"] if override else calendar_color
-                    dedupe_key = (uid, effective_start, effective_summary, effective_location)
-                    if dedupe_key in seen:
-                        continue
-                    seen.add(dedupe_key)
-                    all_events.append({
-                        "uid": uid,
-                        "start": effective_start,
-                        "end": effective_end,
-                        "summary": effective_summary,
-                        "location": effective_location,
-                        "is_all_day": effective_is_all_day,
-                        "is_ongoing": effective_start <= now < effective_end,
-                        "is_multi_day": effective_end.date() > effective_start.date(),
-                        "source_url": url,
-                        "calendar_name": effective_calendar_name,
-                        "calendar_color": effective_calendar_color,
-                        "status": effective_status,
-                        "recurrence_id": override["recurrence_id"] if override else None,
-                    })
+            calendars.append((url, FETCH_CACHE.fetch(url, parse_ical_response, ttl=ICAL_FETCH_TTL_SECONDS)))
         except Exception as e:
             print(f"iCal fetch parse error {url}: {e}")
             had_errors = True
+    return calendars, had_errors
+
+class EventIndex:
+    """Calendar events sorted by start, pulled lazily from per-calendar streams.
+
+    Queries only expand recurrences as far forward as they need: an agenda
+    asking for the next few events stops after those, a month view pulls
+    through the end of its month. Events up to LONG_EVENT long are found by
+    bisecting starts back by the longest such duration; the few longer
+    (multi-day) events are kept apart and checked directly, so one year-long
+    event does not widen every query.
+    """
+
+    LONG_EVENT = timedelta(days=1)
+
+    def __init__(self, streams):
+        """streams is a list of (url, iterator of events ordered by start)."""
+        self.had_errors = False
+        self.stream = heapq.merge(*(self._guarded(url, stream) for url, stream in streams), key=lambda e: e["start"])
+        self.exhausted = False
+        self.events = []
+        self.starts = []
+        self.ends = []
+        self.short_starts = []
+        self.short_events = []
+        self.long_events = []
+        self.max_short_duration = timedelta(0)
+        self.day_cache = {}
+        # Queries extend the shared lists, so every read and pull happens under the lock.
+        self.lock = threading.RLock()
+
+    def _guarded(self, url, stream):
+        # One broken calendar ends its own stream, not the merged one.
+        try:
+            yield from stream
+        except Exception as e:
+            print(f"iCal expand error {url}: {e}")
+            self.had_errors = True
+
+    def _pull(self):
+        if self.exhausted:
+            return False
+        event = next(self.stream, None)
+        if event is None:
+            self.exhausted = True
+            return False
+        self.events.append(event)
+        self.starts.append(event["start"])
+        bisect.insort(self.ends, event["end"])
+        duration = event["end"] - event["start"]
+        if duration > self.LONG_EVENT:
+            self.long_events.append(event)
+        else:
+            self.short_events.append(event)
+            self.short_starts.append(event["start"])
+            self.max_short_duration = max(self.max_short_duration, duration)
+        return True
+
+    def _extend_past(self, moment):
+        """Pulls until every event starting at or before moment is in the lists."""
+        while (not self.starts or self.starts[-1] <= moment) and self._pull():
+            pass
 
-    all_events.sort(key=lambda x: x["start"])
-    return all_events, had_errors
+    def overlapping(self, start, end):
+        """Events with start < end and end > start, ordered by start."""
+        with self.lock:
+            self._extend_past(end)
+            lo = bisect.bisect_right(self.short_starts, start - self.max_short_duration)
+            hi = bisect.bisect_left(self.short_starts, end)
+            found = [e for e in self.short_events[lo:hi] if e["end"] > start]
+            found.extend(e for e in self.long_events if e["start"] < end and e["end"] > start)
+        found.sort(key=lambda e: e["start"])
+        return found
+
+    def ongoing_at(self, moment):
+        return self.overlapping(moment, moment + timedelta(microseconds=1))
+
+    def starting_between(self, start, end, limit=None):
+        with self.lock:
+            if limit is None:
+                self._extend_past(end)
+            else:
+                while (
+                    (not self.starts or self.starts[-1] <= end)
+                    and len(self.starts) - bisect.bisect_left(self.starts, start) < limit
+                    and self._pull()
+                ):
+                    pass
+            lo = bisect.bisect_left(self.starts, start)
+            hi = bisect.bisect_right(self.starts, end)
+            if limit is not None:
+                hi = min(hi, lo + limit)
+            return self.events[lo:hi]
+
+    def next_change_after(self, moment):
+        """The first start or end strictly after moment, when what is live or upcoming changes."""
+        with self.lock:
+            # Anything not pulled yet starts, and so ends, after the next start pulled here.
+            self._extend_past(moment)
+            candidates = []
+            i = bisect.bisect_right(self.starts, moment)
+            if i < len(self.starts):
+                candidates.append(self.starts[i])
+            i = bisect.bisect_right(self.ends, moment)
+            if i < len(self.ends):
+                candidates.append(self.ends[i])
+        return min(candidates) if candidates else None
+
+    def next_matching(self, moment, predicate, until=None):
+        with self.lock:
+            self._extend_past(moment)
+            i = bisect.bisect_left(self.starts, moment)
+            while i < len(self.events) or self._pull():
+                event = self.events[i]
+                if until is not None and event["start"] > until:
+                    break
+                if predicate(event):
+                    return event
+                i += 1
+        return None
+
+    def by_local_day(self, tz, start, end):
+        """Events starting in [start, end) grouped by their local date in tz."""
+        key = (str(tz), start, end)
+        with self.lock:
+            cached = self.day_cache.get(key)
+            if cached is not None:
+                return cached
+            self._extend_past(end)
+            days = {}
+            lo = bisect.bisect_left(self.starts, start)
+            hi = bisect.bisect_left(self.starts, end)
+            for event in self.events[lo:hi]:
+                days.setdefault(event["start"].astimezone(tz).date(), []).append(event)
+            self.day_cache[key] = days
+        return days
+
+ICAL_INDEX_LOOKBACK_DAYS = 32
+ICAL_INDEX_HORIZON_DAYS = 181
+_ICAL_INDEX_CACHE = {}
+_ICAL_INDEX_LOCK = threading.Lock()
+
+def get_ical_event_index(urls):
+    """Returns (EventIndex, had_errors) shared by every widget showing these calendars.
+
+    The index covers a window anchored on the current UTC day, and is rebuilt
+    only when the day rolls over or a calendar's content changes.
+    """
+    calendars, had_errors = load_ical_calendars(urls)
+    anchor = datetime.now(pytz.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    # Parsed calendars are reused while their bytes are unchanged, so their identity tracks content.
+    key = (tuple(urls), anchor, tuple((url, id(parsed)) for url, parsed in calendars))
+    with _ICAL_INDEX_LOCK:
+        cached = _ICAL_INDEX_CACHE.get(key)
+    if cached is not None:
+        return cached[0], had_errors or cached[0].had_errors
+
+    window_start = anchor - timedelta(days=ICAL_INDEX_LOOKBACK_DAYS)
+    window_end = anchor + timedelta(days=ICAL_INDEX_HORIZON_DAYS)
+    now = datetime.now(pytz.utc)
+    seen = set()
+    # Nothing is expanded here; the index pulls events as queries reach them.
+    index = EventIndex([(url, parsed.iter_events(url, window_start, window_end, now, seen)) for url, parsed in calendars])
+    with _ICAL_INDEX_LOCK:
+        for stale_key in [k for k in _ICAL_INDEX_CACHE if k[0] == key[0]]:
+            del _ICAL_INDEX_CACHE[stale_key]
+        # Keep the calendars referenced so their ids cannot be reused while the key is live.
+        _ICAL_INDEX_CACHE[key] = (index, calendars)
+    return index, had_errors
 
 def get_nws_forecast_url(location):
     if location in NWS_CACHE and (time.time() - NWS_CACHE[location]["time"]) < 3600:
@@ -299,19 +1263,56 @@ def get_nws_forecast_url(location):
         print(f"NWS Helper Error: {e}")
     return None
 
+def market_is_open(now_utc=None):
+    local = (now_utc or datetime.now(pytz.utc)).astimezone(MARKET_TZ)
+    if local.weekday() >= 5:
+        return False
+    minutes = local.hour * 60 + local.minute
+    return MARKET_OPEN[0] * 60 + MARKET_OPEN[1] <= minutes < MARKET_CLOSE[0] * 60 + MARKET_CLOSE[1]
+
+def next_market_open(now_utc=None):
+    local = (now_utc or datetime.now(pytz.utc)).astimezone(MARKET_TZ)
+    day = local.date()
+    while True:
+        if day.weekday() < 5:
+            opening = MARKET_TZ.localize(datetime(day.year, day.month, day.day, *MARKET_OPEN))
+            if opening > local:
+                return opening.astimezone(pytz.utc)
+        day += timedelta(days=1)
+
 class BaseWidget:
     def __init__(self, config, widget_name):
         self.config = config
         self.widget_name = widget_name
+        # Area drawn on the last paint, and what is still on screen from before a text change.
+        self.painted_rect = None
+        self.stale_rect = None
+        self.repaint_pending = False
         self.text = ""
         self.params = self.get_draw_params()
-        self.update_timer = None
         self.last_error = ""
         self.last_updated = None
         self.last_refresh_started = None
         self.refresh_failures = 0
         self.ticker_scroll_x = 0
         self.last_ticker_step_time = None
+        # Rendered text tile reused by app.draw_text while the key is unchanged.
+        self.text_tile = None
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        # Widgets assign text from worker threads; remember what is on screen so the GUI can repaint just that.
+        if value == getattr(self, "_text", None):
+            return
+        painted = self.painted_rect
+        if painted is not None:
+            self.stale_rect = painted if self.stale_rect is None else self.stale_rect.united(painted)
+        self._text = value
+        self.repaint_pending = True
 
     def get_position(self, win_width, win_height):
         pos_data = self.config["widget_positions"].get(self.widget_name)
@@ -345,12 +1346,17 @@ class BaseWidget:
         else:
             self.text = decorated_text
 
+        self.invalidate_render_cache()
         if app and hasattr(app, 'central_widget') and app.central_widget:
-            app.central_widget.update()
+            # Queued to the GUI thread, which repaints just this widget's area when it can.
+            app.widget_repaint_requested.emit(self.widget_name, True)
 
     def set_error(self, err, app, prefix):
         self.last_error = err
         self.refresh_failures += 1
+        if err in STALE_OK_ERRORS and self.last_updated and datetime.now() - self.last_updated < STALE_CONTENT_MAX_AGE:
+            # A source failure keeps the last good content up; the error stays visible in diagnostics.
+            return
         self.set_text(prefix, app)
 
     def mark_updated(self):
@@ -358,6 +1364,9 @@ class BaseWidget:
         self.last_refresh_started = self.last_updated
         self.last_error = ""
 
+    def invalidate_render_cache(self):
+        self.text_tile = None
+
     def begin_refresh(self):
         self.last_refresh_started = datetime.now()
 
@@ -366,16 +1375,37 @@ class BaseWidget:
             "last_updated": self.last_updated,
             "last_error": self.last_error,
             "refresh_failures": self.refresh_failures,
+            "circuit_breakers": FETCH_CACHE.get_breaker_states(),
         }
 
-    def update(self, app):
-        self._update_text()
-        refresh_interval_ms = self.get_refresh_interval()
-        self.update_timer = app.after(refresh_interval_ms, lambda: self.update(app))
+    def runs_in_background(self):
+        # Network widgets implement _update_text_worker; the rest are cheap enough for the GUI thread.
+        return hasattr(self, "_update_text_worker")
+
+    def refreshes_asynchronously(self):
+        # _update_text_async(app, done) starts non-blocking fetches on the GUI thread and calls done() when finished.
+        return hasattr(self, "_update_text_async")
+
+    def refresh(self, app):
+        if self.runs_in_background():
+            self._update_text_worker(app)
+        else:
+            self._update_text()
 
     def get_refresh_interval(self):
         return self.config.get("feed_refresh_interval_ms", 3600000)
 
+    def adaptive_refresh_enabled(self):
+        # Low-power mode keeps every widget on its plain interval.
+        return not self.config.get("low_power_mode", False)
+
+    def refresh_interval_until(self, moment, base_ms):
+        """Shortens base_ms so the next refresh lands just after moment, but never below the floor."""
+        if moment is None or not self.adaptive_refresh_enabled():
+            return base_ms
+        delay_ms = int((moment - datetime.now(pytz.utc)).total_seconds() * 1000) + 1000
+        return max(MIN_ADAPTIVE_REFRESH_MS, min(base_ms, delay_ms))
+
     def draw(self, painter, app):
         if not hasattr(app, 'central_widget') or not app.central_widget:
             return
@@ -430,9 +1460,8 @@ class TimeWidget(BaseWidget):
         time_format = widget_settings.get("format", "24h")
         self.mark_updated()
         self.text = self._decorate_text(time.strftime("%I:%M %p" if time_format == "12h" else "%H:%M"))
-    def update(self, app):
-        self._update_text()
-        self.update_timer = app.after(1000, lambda: self.update(app))
+    def get_refresh_interval(self):
+        return 1000
 
 class DateWidget(BaseWidget):
     def _update_text(self):
@@ -440,9 +1469,8 @@ class DateWidget(BaseWidget):
         date_format = widget_settings.get("format", "%A, %B %d, %Y")
         self.mark_updated()
         self.text = self._decorate_text(time.strftime(date_format))
-    def update(self, app):
-        self._update_text()
-        self.update_timer = app.after(1000, lambda: self.update(app))
+    def get_refresh_interval(self):
+        return 1000
 
 class WorldClockWidget(BaseWidget):
     def _update_text(self):
@@ -459,9 +1487,8 @@ class WorldClockWidget(BaseWidget):
         except Exception as e:
             print(f"WorldClock update error: {e}")
             self.set_error("clock error", None, "Clock Error")
-    def update(self, app):
-        self._update_text()
-        self.update_timer = app.after(1000, lambda: self.update(app))
+    def get_refresh_interval(self):
+        return 1000
 
 class WeatherForecastWidget(BaseWidget):
     @staticmethod
@@ -482,9 +1509,7 @@ class WeatherForecastWidget(BaseWidget):
                 self.set_error("nws location", app, f"Invalid NWS Location:\n{location}")
                 return
 
-            resp = SESSION.get(forecast_url, headers={"Accept": "application/geo+json"}, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
+            data = fetch_json(forecast_url, headers={"Accept": "application/geo+json"})
             periods = data.get("properties", {}).get("periods", [])
             if not periods:
                 self.set_error("no periods", app, f"No forecast data for {location}")
@@ -539,12 +1564,6 @@ class WeatherForecastWidget(BaseWidget):
             print(f"WeatherForecast update error: {e}")
             self.set_error("error", app, "Weather  Error")
 
-    def update(self, app):
-        thread = threading.Thread(target=self._update_text_worker, args=(app,))
-        thread.daemon = True
-        thread.start()
-        self.update_timer = app.after(self.get_refresh_interval(), lambda: self.update(app))
-
 class CalendarWidget(BaseWidget):
     def _update_text(self):
         now = datetime.now()
@@ -557,9 +1576,8 @@ class CalendarWidget(BaseWidget):
         self.text = self._decorate_text(cal_str)
         self.mark_updated()
 
-    def update(self, app):
-        self._update_text()
-        self.update_timer = app.after(3600000, lambda: self.update(app)) # Update every hour
+    def get_refresh_interval(self):
+        return 3600000
 
 class ICalWidget(BaseWidget):
     def _update_text_worker(self, app):
@@ -580,29 +1598,25 @@ class ICalWidget(BaseWidget):
             if style == "Month Calendar":
                 month_start = datetime.now(display_tz).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
                 next_month = (month_start + timedelta(days=32)).replace(day=1)
-                all_events, had_errors = fetch_ical_events(
-                    ical_urls,
-                    window_start=month_start.astimezone(pytz.utc),
-                    window_end=next_month.astimezone(pytz.utc),
-                )
-                if not all_events and had_errors:
+                index, had_errors = get_ical_event_index(ical_urls)
+                now_utc = datetime.now(pytz.utc)
+                days = index.by_local_day(display_tz, month_start.astimezone(pytz.utc), next_month.astimezone(pytz.utc))
+                if not days and had_errors:
                     self.set_error("fetch", app, "iCal  Error")
                     return
                 month_events = {}
-                for event in all_events:
-                    local = event["start"].astimezone(display_tz)
-                    if local < month_start or local >= next_month:
-                        continue
-                    day_key = local.date().isoformat()
-                    if day_key not in month_events:
-                        month_events[day_key] = []
-                    label = f"{local.strftime('%I:%M %p').lstrip('0')} {event['summary']}" if not event["is_all_day"] else event["summary"]
-                    month_events[day_key].append({
-                        "text": label.strip(),
-                        "color": event.get("calendar_color", "#7dd3fc"),
-                        "ongoing": event.get("is_ongoing", False),
-                    })
-
+                for day, events in days.items():
+                    day_items = month_events.setdefault(day.isoformat(), [])
+                    for event in events:
+                        local = event["start"].astimezone(display_tz)
+                        label = f"{local.strftime('%I:%M %p').lstrip('0')} {event['summary']}" if not event["is_all_day"] else event["summary"]
+                        day_items.append({
+                            "text": label.strip(),
+                            "color": event.get("calendar_color", "#7dd3fc"),
+                            "ongoing": event["start"] <= now_utc < event["end"],
+                        })
+
+                self.next_calendar_change = index.next_change_after(now_utc)
                 self.month_calendar_data = {
                     "year": month_start.year,
                     "month": month_start.month,
@@ -613,16 +1627,19 @@ class ICalWidget(BaseWidget):
                 self.set_text(self.month_calendar_data["month_name"], app)
                 return
 
-            all_events, had_errors = fetch_ical_events(ical_urls)
+            index, had_errors = get_ical_event_index(ical_urls)
+            now_utc = datetime.now(pytz.utc)
+            upcoming = index.starting_between(now_utc, now_utc + timedelta(days=180), limit=5)
+            self.next_calendar_change = index.next_change_after(now_utc)
 
-            if not all_events and had_errors:
+            if not upcoming and had_errors:
                 self.set_error("fetch", app, "iCal  Error")
                 return
 
             lines = []
-            for event in all_events[:5]:
+            for event in upcoming:
                 local = event["start"].astimezone(display_tz)
-                prefix = "LIVE " if event.get("is_ongoing") else ""
+                prefix = "LIVE " if event["start"] <= now_utc < event["end"] else ""
                 if not event["is_all_day"]:
                     lines.append(f"{prefix}{local.strftime('%a %m/%d %I:%M %p')}: {event['summary']}")
                 else:
@@ -636,11 +1653,9 @@ class ICalWidget(BaseWidget):
             print(f"iCal update error: {e}")
             self.set_error("error", app, "iCal  Error")
 
-    def update(self, app):
-        thread = threading.Thread(target=self._update_text_worker, args=(app,))
-        thread.daemon = True
-        thread.start()
-        self.update_timer = app.after(self.get_refresh_interval(), lambda: self.update(app))
+    def get_refresh_interval(self):
+        # Come back when an event starts or ends so LIVE markers and the list roll over on time.
+        return self.refresh_interval_until(getattr(self, "next_calendar_change", None), super().get_refresh_interval())
 
     def draw(self, painter, app):
         widget_settings = self.config.get("widget_settings", {}).get(self.widget_name, {})
@@ -672,20 +1687,15 @@ class CommuteWidget(BaseWidget):
                 self.set_error("no urls", app, "Set iCal URLs in widget settings")
                 return
 
-            all_events, had_errors = fetch_ical_events(ical_urls)
+            index, had_errors = get_ical_event_index(ical_urls)
             now_utc = datetime.now(pytz.utc)
             cutoff = now_utc + timedelta(hours=lookahead_hours)
 
-            commute_event = None
-            for event in all_events:
-                if event["is_all_day"]:
-                    continue
-                if not event["location"]:
-                    continue
-                if event["start"] > cutoff:
-                    continue
-                commute_event = event
-                break
+            commute_event = index.next_matching(
+                now_utc,
+                lambda event: not event["is_all_day"] and event["location"],
+                until=cutoff,
+            )
 
             if not commute_event and had_errors:
                 self.set_error("fetch", app, "Commute  Error")
@@ -722,12 +1732,9 @@ class CommuteWidget(BaseWidget):
             print(f"Commute widget update error: {e}")
             self.set_error("error", app, "Commute  Error")
 
-    def update(self, app):
-        thread = threading.Thread(target=self._update_text_worker, args=(app,))
-        thread.daemon = True
-        thread.start()
+    def get_refresh_interval(self):
         # Keep this fresher than normal feeds so leave-time countdown feels live.
-        self.update_timer = app.after(60000, lambda: self.update(app))
+        return 60000
 
 class DailyAgendaWidget(BaseWidget):
     def _update_text_worker(self, app):
@@ -749,16 +1756,15 @@ class DailyAgendaWidget(BaseWidget):
                 self.set_error("no urls", app, "Set iCal URLs in widget settings")
                 return
 
-            all_events, had_errors = fetch_ical_events(ical_urls)
+            index, had_errors = get_ical_event_index(ical_urls)
             now = datetime.now(pytz.utc)
             cutoff = now + timedelta(days=days_ahead)
+            self.next_calendar_change = index.next_change_after(now)
             items = []
 
-            for event in all_events:
-                if event["start"] > cutoff:
-                    continue
+            for event in index.starting_between(now, cutoff, limit=max_events):
                 local = event["start"].astimezone(display_tz)
-                ongoing = "LIVE  " if event.get("is_ongoing") else ""
+                ongoing = "LIVE  " if event["start"] <= now < event["end"] else ""
                 if not event["is_all_day"]:
                     line = f"{ongoing}{local.strftime('%a %m/%d %I:%M %p')}  {event['summary']}"
                 else:
@@ -767,8 +1773,6 @@ class DailyAgendaWidget(BaseWidget):
                 if event["location"]:
                     line += f" @ {event['location']}"
                 items.append(line)
-                if len(items) >= max_events:
-                    break
 
             if not items and had_errors:
                 self.set_error("fetch", app, "Agenda  Error")
@@ -782,11 +1786,8 @@ class DailyAgendaWidget(BaseWidget):
             print(f"Daily agenda update error: {e}")
             self.set_error("error", app, "Agenda  Error")
 
-    def update(self, app):
-        thread = threading.Thread(target=self._update_text_worker, args=(app,))
-        thread.daemon = True
-        thread.start()
-        self.update_timer = app.after(self.get_refresh_interval(), lambda: self.update(app))
+    def get_refresh_interval(self):
+        return self.refresh_interval_until(getattr(self, "next_calendar_change", None), super().get_refresh_interval())
 
 class PhotoMemoriesWidget(BaseWidget):
     def __init__(self, config, widget_name):
@@ -911,20 +1912,17 @@ class PhotoMemoriesWidget(BaseWidget):
             return
         super().draw(painter, app)
 
-    def update(self, app):
-        self._update_text()
+    def get_refresh_interval(self):
         widget_settings = self.config.get("widget_settings", {}).get(self.widget_name, {})
         source_mode = widget_settings.get("source_mode", "folder")
         if source_mode == "single":
-            refresh_ms = 3600000
-        else:
-            try:
-                refresh_minutes = int(widget_settings.get("refresh_minutes", 60))
-            except (TypeError, ValueError):
-                refresh_minutes = 60
-            refresh_minutes = max(1, min(1440, refresh_minutes))
-            refresh_ms = refresh_minutes * 60000
-        self.update_timer = app.after(refresh_ms, lambda: self.update(app))
+            return 3600000
+        try:
+            refresh_minutes = int(widget_settings.get("refresh_minutes", 60))
+        except (TypeError, ValueError):
+            refresh_minutes = 60
+        refresh_minutes = max(1, min(1440, refresh_minutes))
+        return refresh_minutes * 60000
 
 class RssWidget(BaseWidget):
     def _update_text_worker(self, app):
@@ -946,9 +1944,7 @@ class RssWidget(BaseWidget):
                 if not url or "YOUR_RSS_FEED_URL_HERE" in url:
                     continue
                 try:
-                    r = SESSION.get(url, timeout=10)
-                    r.raise_for_status()
-                    fp = feedparser.parse(r.content)
+                    fp = FETCH_CACHE.fetch(url, parse_feed_response)
                     if getattr(fp, "bozo", False):
                         print(f"RSS parse warning {url}: {getattr(fp, 'bozo_exception', '')}")
                     entries.extend(fp.entries)
@@ -991,14 +1987,9 @@ class RssWidget(BaseWidget):
             print(f"RSS update error: {e}")
             self.set_error("error", app, "RSS  Error")
 
-    def update(self, app):
-        thread = threading.Thread(target=self._update_text_worker, args=(app,))
-        thread.daemon = True
-        thread.start()
-        self.update_timer = app.after(self.get_refresh_interval(), lambda: self.update(app))
-
 class SportsWidget(BaseWidget):
-    def _update_text_worker(self, app):
+    def _update_text_async(self, app, done):
+        """Starts every league fetch at once; the results are formatted on the GUI thread when they land."""
         try:
             widget_settings = self.config.get("widget_settings", {}).get(self.widget_name, {})
             league_configs = widget_settings.get("configs", [])
@@ -1010,82 +2001,141 @@ class SportsWidget(BaseWidget):
             except pytz.exceptions.UnknownTimeZoneError:
                 display_tz = pytz.utc
                 self.set_error("unknown timezone", app, f"Unknown Zone:\n{display_tz_str}")
+                done()
                 return
 
             if not league_configs:
                 self.set_text("No leagues configured for this widget.", app)
+                done()
                 return
 
-            all_scores_text = []
-            ticker_items = []
-            had_errors = False
+            league_urls = [SPORTS_API_URLS.get(config.get("league", "").lower()) for config in league_configs]
+            fetch_urls = list(dict.fromkeys(url for url in league_urls if url))
+        except Exception as e:
+            print(f"Sports widget update error: {e}")
+            self.set_error("error", app, "Sports Error")
+            done()
+            return
 
-            for config in league_configs:
-                league = config.get("league", "").lower()
-                teams = [team.lower() for team in config.get("teams", [])]
-                
-                url = SPORTS_API_URLS.get(league)
-                if not url:
-                    all_scores_text.append(f"Unknown league: {league.upper()}")
-                    had_errors = True
-                    continue
+        def on_done(results, error):
+            try:
+                if error is not None:
+                    raise error
+                self._show_league_data(app, league_configs, style, display_tz, dict(zip(fetch_urls, results)))
+            except Exception as e:
+                print(f"Sports widget update error: {e}")
+                self.set_error("error", app, "Sports Error")
+            finally:
+                done()
+
+        ASYNC_FETCH.submit(ASYNC_FETCH.fetch_many(fetch_urls), on_done=on_done)
+
+    def _show_league_data(self, app, league_configs, style, display_tz, league_data):
+        all_scores_text = []
+        ticker_items = []
+        had_errors = False
+        self.has_live_games, self.next_game_start = self._game_schedule(league_configs, league_data)
+
+        for config in league_configs:
+            league = config.get("league", "").lower()
+            teams = [team.lower() for team in config.get("teams", [])]
+            
+            url = SPORTS_API_URLS.get(league)
+            if not url:
+                all_scores_text.append(f"Unknown league: {league.upper()}")
+                had_errors = True
+                continue
 
-                try:
-                    response = SESSION.get(url)
-                    response.raise_for_status()
-                    data = response.json()
-                    
-                    header = league.upper()
-                    
-                    if style == "Ticker":
-                        events = data.get("events", [])
-                        if teams and teams != ['']:
-                            filtered_events = []
-                            for event in events:
-                                for competition in event.get("competitions", []):
-                                    for competitor in competition.get("competitors", []):
-                                        if competitor.get("team", {}).get("abbreviation", "").lower() in teams:
-                                            filtered_events.append(event)
-                                            break
-                                    else:
-                                        continue
-                                    break
-                            events = filtered_events
-                        
+            try:
+                data = league_data[url]
+                if isinstance(data, Exception):
+                    raise data
+                
+                header = league.upper()
+                
+                if style == "Ticker":
+                    events = data.get("events", [])
+                    if teams and teams != ['']:
+                        filtered_events = []
                         for event in events:
-                            game_info = self.parse_event(event, display_tz)
-                            if game_info:
-                                ticker_items.append(f"{header}: {game_info}")
-                    else:
-                        formatted_scores = self.format_scores(data, league, teams, display_tz)
-                        if formatted_scores and "No " not in formatted_scores:
-                            all_scores_text.append(f"--- {header} ---")
-                            all_scores_text.append(formatted_scores)
+                            for competition in event.get("competitions", []):
+                                for competitor in competition.get("competitors", []):
+                                    if competitor.get("team", {}).get("abbreviation", "").lower() in teams:
+                                        filtered_events.append(event)
+                                        break
+                                else:
+                                    continue
+                                break
+                        events = filtered_events
+                    
+                    for event in events:
+                        game_info = self.parse_event(event, display_tz)
+                        if game_info:
+                            ticker_items.append(f"{header}: {game_info}")
+                else:
+                    formatted_scores = self.format_scores(data, league, teams, display_tz)
+                    if formatted_scores and "No " not in formatted_scores:
+                        all_scores_text.append(f"--- {header} ---")
+                        all_scores_text.append(formatted_scores)
+
+            except requests.exceptions.RequestException:
+                had_errors = True
+                print(f"Sports widget network error for {league}")
+            except Exception as e:
+                had_errors = True
+                print(f"Sports widget update error for {league}: {e}")
 
-                except requests.exceptions.RequestException:
-                    had_errors = True
-                    print(f"Sports widget network error for {league}")
-                except Exception as e:
-                    had_errors = True
-                    print(f"Sports widget update error for {league}: {e}")
+        if style == "Ticker":
+            if not ticker_items and had_errors:
+                 self.set_error("network", app, "Sports Error")
+            else:
+                self.mark_updated()
+                self.set_text("\n".join(ticker_items) or "No games.", app)
+            return
 
-            if style == "Ticker":
-                if not ticker_items and had_errors:
-                     self.set_error("network", app, "Sports Error")
-                else:
-                    self.mark_updated()
-                    self.set_text("\n".join(ticker_items) or "No games.", app)
-                return
+        if not all_scores_text and had_errors:
+            self.set_error("network", app, "Sports Error")
+        
+        self.mark_updated()
+        self.set_text("\n".join(all_scores_text) or "No games for selected leagues/teams.", app)
 
-            if not all_scores_text and had_errors:
-                self.set_error("network", app, "Sports Error")
-            
-            self.mark_updated()
-            self.set_text("\n".join(all_scores_text) or "No games for selected leagues/teams.", app)
+    def get_refresh_interval(self):
+        if getattr(self, "has_live_games", False) and self.adaptive_refresh_enabled():
+            return SPORTS_LIVE_REFRESH_MS
+        # Idle polling never runs less often than the configured feed interval.
+        idle_ms = min(SPORTS_IDLE_REFRESH_MS, super().get_refresh_interval())
+        return self.refresh_interval_until(getattr(self, "next_game_start", None), idle_ms)
 
-        except Exception as e:
-            print(f"Sports widget update error: {e}")
-            self.set_error("error", app, "Sports Error")
+    @staticmethod
+    def _game_schedule(league_configs, league_data):
+        """Returns (a shown game is in progress, earliest shown game still to start)."""
+        now = datetime.now(pytz.utc)
+        live = False
+        next_start = None
+        for config in league_configs:
+            data = league_data.get(SPORTS_API_URLS.get(config.get("league", "").lower()))
+            if not isinstance(data, dict):
+                continue
+            teams = {team.lower() for team in config.get("teams", []) if team}
+            for event in data.get("events", []):
+                competitions = event.get("competitions", [])
+                if not competitions:
+                    continue
+                competition = competitions[0]
+                abbreviations = {c.get("team", {}).get("abbreviation", "").lower() for c in competition.get("competitors", [])}
+                if teams and not teams & abbreviations:
+                    continue
+                status = competition.get("status", {}).get("type", {}).get("name")
+                if status == "STATUS_IN_PROGRESS":
+                    live = True
+                elif status == "STATUS_SCHEDULED" and competition.get("date"):
+                    try:
+                        start = datetime.fromisoformat(competition["date"].replace("Z", "+00:00"))
+                    except ValueError:
+                        continue
+                    if start > now and (next_start is None or start < next_start):
+                        next_start = start
+        return live, next_start
 
     def format_scores(self, data, league, teams, display_tz):
         output = []
@@ -1148,60 +2198,72 @@ class SportsWidget(BaseWidget):
         
         return None
 
-    def update(self, app):
-        thread = threading.Thread(target=self._update_text_worker, args=(app,))
-        thread.daemon = True
-        thread.start()
-        self.update_timer = app.after(self.get_refresh_interval(), lambda: self.update(app))
-
 class StockWidget(BaseWidget):
-    def _update_text_worker(self, app):
+    def _update_text_async(self, app, done):
+        """Requests only the uncached quote batches; the lines are formatted on the GUI thread."""
         try:
             widget_settings = self.config.get("widget_settings", {}).get(self.widget_name, {})
             symbols = widget_settings.get("symbols", ["AAPL", "GOOG"])
             # Check widget settings for API key first, then global config
             api_key = widget_settings.get("api_key") or self.config.get("FMP_API_KEY", FMP_API_KEY)
-            style = widget_settings.get("style", "Normal")
 
             if not api_key or api_key == "YOUR_FMP_API_KEY":
                 self.set_error("api_key", app, "Stock Widget: API Key Needed")
+                done()
                 return
 
-            stock_data = []
-            for symbol in symbols:
-                if not symbol.strip():
-                    continue
-                url = f"{FMP_BASE_URL}{symbol.strip().upper()}?apikey={api_key}"
-                response = SESSION.get(url)
-                response.raise_for_status()
-                data = response.json()
-                if data:
-                    price = data[0].get("price", 0)
-                    change = data[0].get("changesPercentage", 0)
-                    change_str = f"+{change:.2f}%" if change > 0 else f"{change:.2f}%"
-                    stock_data.append(f"{symbol.upper()}: ${price:.2f} ({change_str})")
-            
-            if stock_data:
-                self.mark_updated()
-                if style == "Ticker":
-                    self.set_text("\n".join(stock_data), app) # Ticker logic handles joining with separators
-                else:
-                    self.set_text("\n".join(stock_data), app)
-            else:
-                self.set_error("no_data", app, "No stock data found.")
-
-        except requests.exceptions.RequestException as e:
-            print(f"Stock widget error: {e}")
-            self.set_error("network", app, "Stocks  No Connection")
+            quotes, urls = _plan_stock_quotes(symbols, api_key)
         except Exception as e:
             print(f"Stock widget update error: {e}")
             self.set_error("error", app, "Stocks  Error")
+            done()
+            return
 
-    def update(self, app):
-        thread = threading.Thread(target=self._update_text_worker, args=(app,))
-        thread.daemon = True
-        thread.start()
-        self.update_timer = app.after(self.get_refresh_interval(), lambda: self.update(app))
+        def on_done(results, error):
+            try:
+                if error is not None:
+                    raise error
+                self._show_quotes(app, symbols, _merge_stock_quotes(quotes, results))
+            except requests.exceptions.RequestException as e:
+                print(f"Stock widget error: {e}")
+                self.set_error("network", app, "Stocks  No Connection")
+            except Exception as e:
+                print(f"Stock widget update error: {e}")
+                self.set_error("error", app, "Stocks  Error")
+            finally:
+                done()
+
+        ASYNC_FETCH.submit(ASYNC_FETCH.fetch_many(urls, ttl=STOCK_QUOTE_TTL_SECONDS), on_done=on_done)
+
+    def _show_quotes(self, app, symbols, quotes):
+        stock_data = []
+        for symbol in symbols:
+            quote = quotes.get(symbol.strip().upper())
+            if quote:
+                price = quote.get("price", 0)
+                change = quote.get("changesPercentage", 0)
+                change_str = f"+{change:.2f}%" if change > 0 else f"{change:.2f}%"
+                stock_data.append(f"{symbol.upper()}: ${price:.2f} ({change_str})")
+
+        if stock_data:
+            self.mark_updated()
+            # Ticker style joins the same lines with its own separators when it renders.
+            self.set_text("\n".join(stock_data), app)
+        else:
+            self.set_error("no_data", app, "No stock data found.")
+
+    def get_refresh_interval(self):
+        if not market_is_open():
+            # Quotes do not move overnight or at weekends; sleep until the next session opens.
+            delay_ms = int((next_market_open() - datetime.now(pytz.utc)).total_seconds() * 1000) + 60000
+            return max(MIN_ADAPTIVE_REFRESH_MS, delay_ms)
+        if not self.adaptive_refresh_enabled():
+            return super().get_refresh_interval()
+        widget_settings = self.config.get("widget_settings", {}).get(self.widget_name, {})
+        try:
+            return max(MIN_ADAPTIVE_REFRESH_MS, int(widget_settings.get("market_refresh_ms", STOCK_MARKET_REFRESH_MS)))
+        except (TypeError, ValueError):
+            return STOCK_MARKET_REFRESH_MS
 
 class HistoryWidget(BaseWidget):
     def _update_text_worker(self, app):
@@ -1209,9 +2271,7 @@ class HistoryWidget(BaseWidget):
             widget_settings = self.config.get("widget_settings", {}).get(self.widget_name, {})
             max_width_chars = int(widget_settings.get("max_width_chars", 50))
 
-            response = SESSION.get(HISTORY_API_URL)
-            response.raise_for_status()
-            data = response.json()
+            data = fetch_json(HISTORY_API_URL)
 
             events = data.get("data", {}).get("Events", [])
             if events:
@@ -1222,7 +2282,7 @@ class HistoryWidget(BaseWidget):
                     except ValueError:
                         return 0
                 
-                events.sort(key=get_year, reverse=True)
+                events = sorted(events, key=get_year, reverse=True)
                 
                 # Take the first 10 items
                 event_texts = []
@@ -1245,12 +2305,6 @@ class HistoryWidget(BaseWidget):
             print(f"History widget update error: {e}")
             self.set_error("error", app, "History  Error")
 
-    def update(self, app):
-        thread = threading.Thread(target=self._update_text_worker, args=(app,))
-        thread.daemon = True
-        thread.start()
-        self.update_timer = app.after(self.get_refresh_interval(), lambda: self.update(app))
-
 class CountdownWidget(BaseWidget):
     def _update_text(self):
         widget_settings = self.config.get("widget_settings", {}).get(self.widget_name, {})
@@ -1281,19 +2335,16 @@ class CountdownWidget(BaseWidget):
         except Exception as e:
             self.text = f"{name}\nError: {e}"
 
-    def update(self, app):
-        self._update_text()
-        self.update_timer = app.after(1000, lambda: self.update(app)) # Update every second
+    def get_refresh_interval(self):
+        return 1000
 
 class QuotesWidget(BaseWidget):
     def _update_text(self):
         self.mark_updated()
         self.text = random.choice(DEFAULT_QUOTES)
 
-    def update(self, app):
-        self._update_text()
-        # Update every 4 hours
-        self.update_timer = app.after(14400000, lambda: self.update(app))
+    def get_refresh_interval(self):
+        return 14400000
 
 class SystemStatsWidget(BaseWidget):
     def _update_text(self):
@@ -1305,9 +2356,8 @@ class SystemStatsWidget(BaseWidget):
         mem = psutil.virtual_memory().percent
         self.text = f"CPU: {cpu}%\nRAM: {mem}%"
 
-    def update(self, app):
-        self._update_text()
-        self.update_timer = app.after(2000, lambda: self.update(app))
+    def get_refresh_interval(self):
+        return 2000
 
 class IPWidget(BaseWidget):
     def _update_text(self):
@@ -1321,10 +2371,8 @@ class IPWidget(BaseWidget):
         except Exception:
             self.text = "IP: Unavailable"
 
-    def update(self, app):
-        self._update_text()
-        # Update every minute
-        self.update_timer = app.after(60000, lambda: self.update(app))
+    def get_refresh_interval(self):
+        return 60000
 
 class MoonWidget(BaseWidget):
     def _update_text(self):
@@ -1369,10 +2417,8 @@ class MoonWidget(BaseWidget):
             print(f"Moon widget error: {e}")
             self.text = "Moon: Error"
 
-    def update(self, app):
-        self._update_text()
-        # Update every 4 hours
-        self.update_timer = app.after(14400000, lambda: self.update(app))
+    def get_refresh_interval(self):
+        return 14400000
 
 class FlightBoardWidget(BaseWidget):
     def _update_text_worker(self, app):
@@ -1388,13 +2434,10 @@ class FlightBoardWidget(BaseWidget):
                 return
 
             url = "http://api.aviationstack.com/v1/flights"
-            resp = SESSION.get(
+            data = fetch_json(
                 url,
                 params={"access_key": api_key, "flight_iata": flight_number, "limit": 1},
-                timeout=10,
-            )
-            resp.raise_for_status()
-            data = resp.json().get("data", [])
+            ).get("data", [])
             if not data:
                 self.set_text(f"Flight Board\n{flight_number}: No data", app)
                 return
@@ -1424,12 +2467,6 @@ class FlightBoardWidget(BaseWidget):
             print(f"Flight board error: {e}")
             self.set_error("error", app, "Flight Board  Error")
 
-    def update(self, app):
-        thread = threading.Thread(target=self._update_text_worker, args=(app,))
-        thread.daemon = True
-        thread.start()
-        self.update_timer = app.after(self.get_refresh_interval(), lambda: self.update(app))
-
 class EnergyPriceWidget(BaseWidget):
     def _update_text_worker(self, app):
         try:
@@ -1453,9 +2490,7 @@ class EnergyPriceWidget(BaseWidget):
                 self.set_error("config", app, "Energy Price\nSet URL + JSON key")
                 return
 
-            resp = SESSION.get(url, timeout=10)
-            resp.raise_for_status()
-            payload = resp.json()
+            payload = fetch_json(url)
             value = payload
             for part in json_key.split("."):
                 if isinstance(value, list):
@@ -1469,12 +2504,6 @@ class EnergyPriceWidget(BaseWidget):
             print(f"Energy price error: {e}")
             self.set_error("error", app, "Energy Price  Error")
 
-    def update(self, app):
-        thread = threading.Thread(target=self._update_text_worker, args=(app,))
-        thread.daemon = True
-        thread.start()
-        self.update_timer = app.after(self.get_refresh_interval(), lambda: self.update(app))
-
 class PackageWidget(BaseWidget):
     def _update_text_worker(self, app):
         try:
@@ -1491,9 +2520,7 @@ class PackageWidget(BaseWidget):
                 return
 
             url = f"{AFTERSHIP_API_BASE}/{slug}/{tracking_number}"
-            resp = SESSION.get(url, headers={"aftership-api-key": api_key}, timeout=10)
-            resp.raise_for_status()
-            tracking = resp.json().get("data", {}).get("tracking", {})
+            tracking = fetch_json(url, headers={"aftership-api-key": api_key}).get("data", {}).get("tracking", {})
             tag = tracking.get("tag", "Unknown")
             checkpoints = tracking.get("checkpoints", [])
             last_msg = checkpoints[0].get("message", "") if checkpoints else "No status updates"
@@ -1503,12 +2530,6 @@ class PackageWidget(BaseWidget):
             print(f"Package widget error: {e}")
             self.set_error("error", app, "Package  Error")
 
-    def update(self, app):
-        thread = threading.Thread(target=self._update_text_worker, args=(app,))
-        thread.daemon = True
-        thread.start()
-        self.update_timer = app.after(self.get_refresh_interval(), lambda: self.update(app))
-
 class SunriseWidget(BaseWidget):
     @staticmethod
     def _format_day_length(day_length_raw):
@@ -1532,9 +2553,9 @@ class SunriseWidget(BaseWidget):
             settings = self.config.get("widget_settings", {}).get(self.widget_name, {})
             lat = float(settings.get("lat", 38.624))
             lon = float(settings.get("lon", -90.184))
-            resp = SESSION.get(SUN_API_URL, params={"lat": lat, "lng": lon, "formatted": 0}, timeout=10)
-            resp.raise_for_status()
-            results = resp.json().get("results", {})
+            results = fetch_json(
+                SUN_API_URL, params={"lat": lat, "lng": lon, "formatted": 0}, ttl=SUN_FETCH_TTL_SECONDS
+            ).get("results", {})
             sunrise = datetime.fromisoformat(results.get("sunrise").replace("Z", "+00:00")).astimezone()
             sunset = datetime.fromisoformat(results.get("sunset").replace("Z", "+00:00")).astimezone()
             day_len = self._format_day_length(results.get("day_length", ""))
@@ -1547,11 +2568,8 @@ class SunriseWidget(BaseWidget):
             print(f"Sunrise widget error: {e}")
             self.set_error("error", app, "Sunrise  Error")
 
-    def update(self, app):
-        thread = threading.Thread(target=self._update_text_worker, args=(app,))
-        thread.daemon = True
-        thread.start()
-        self.update_timer = app.after(900000, lambda: self.update(app))
+    def get_refresh_interval(self):
+        return 900000
 
 class AstronomyWidget(BaseWidget):
     @staticmethod
@@ -1571,9 +2589,9 @@ class AstronomyWidget(BaseWidget):
             now = datetime.now()
             illum = self._moon_illumination_fraction(now) * 100.0
 
-            resp = SESSION.get(SUN_API_URL, params={"lat": lat, "lng": lon, "formatted": 0}, timeout=10)
-            resp.raise_for_status()
-            results = resp.json().get("results", {})
+            results = fetch_json(
+                SUN_API_URL, params={"lat": lat, "lng": lon, "formatted": 0}, ttl=SUN_FETCH_TTL_SECONDS
+            ).get("results", {})
             civil_twilight_end = datetime.fromisoformat(
                 results.get("civil_twilight_end").replace("Z", "+00:00")
             ).astimezone()
@@ -1584,13 +2602,10 @@ class AstronomyWidget(BaseWidget):
             # ISS pass times from Open Notify (best-effort; service can be intermittently unavailable).
             iss_line = "ISS Next Pass: unavailable"
             try:
-                iss_resp = SESSION.get(
+                iss_data = fetch_json(
                     "http://api.open-notify.org/iss-pass.json",
                     params={"lat": lat, "lon": lon, "n": 1},
-                    timeout=10
                 )
-                iss_resp.raise_for_status()
-                iss_data = iss_resp.json()
                 passes = iss_data.get("response", [])
                 if passes:
                     next_pass = passes[0]
@@ -1613,11 +2628,8 @@ class AstronomyWidget(BaseWidget):
             print(f"Astronomy widget error: {e}")
             self.set_error("error", app, "Astronomy  Error")
 
-    def update(self, app):
-        thread = threading.Thread(target=self._update_text_worker, args=(app,))
-        thread.daemon = True
-        thread.start()
-        self.update_timer = app.after(3600000, lambda: self.update(app))
+    def get_refresh_interval(self):
+        return 3600000
 
 WIDGET_CLASSES = {
     "time": TimeWidget,
@@ -1646,14 +2658,183 @@ WIDGET_CLASSES = {
     "astronomy": AstronomyWidget,
 }
 
+class RefreshScheduler:
+    """Refreshes every widget from one timer.
+
+    Due refreshes sit in a heap ordered by next-due time. Cheap local widgets
+    run inline on the GUI thread; network widgets go to a small fixed pool of
+    worker threads, or start non-blocking fetches and report back through a
+    callback. A widget is never queued again while its previous refresh is
+    still running.
+    """
+
+    MAX_WORKERS = 4
+    # Completions on worker threads only push onto the heap, so the timer never sleeps longer than this.
+    MAX_SLEEP_MS = 1000
+
+    def __init__(self, app, max_workers=MAX_WORKERS):
+        self.app = app
+        self.max_workers = max(1, int(max_workers))
+        self.lock = threading.Lock()
+        self.heap = []
+        self.sequence = 0
+        # widget_name -> [widget, sequence of its live heap entry]
+        self.entries = {}
+        self.in_flight = set()
+        self.rerun_requested = set()
+        self.jobs = queue.Queue()
+        self.workers = []
+        self.timer = QTimer(app)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self.run_due)
+
+    def _push(self, widget_name, due):
+        # Called with the lock held; a newer push supersedes any entry still in the heap.
+        entry = self.entries.get(widget_name)
+        if entry is None:
+            return
+        self.sequence += 1
+        entry[1] = self.sequence
+        heapq.heappush(self.heap, (due, self.sequence, widget_name))
+
+    def register(self, widget):
+        with self.lock:
+            self.entries[widget.widget_name] = [widget, 0]
+            if widget.widget_name in self.in_flight:
+                self.rerun_requested.add(widget.widget_name)
+            else:
+                self._push(widget.widget_name, time.monotonic())
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.heap.clear()
+            self.rerun_requested.clear()
+        self.timer.stop()
+
+    def request_refresh(self, widget_name=None):
+        """Refresh one widget (or all of them) on the next tick, unless it is already refreshing."""
+        now = time.monotonic()
+        with self.lock:
+            names = [widget_name] if widget_name else list(self.entries)
+            for name in names:
+                if name in self.in_flight:
+                    self.rerun_requested.add(name)
+                else:
+                    self._push(name, now)
+        self._arm()
+
+    def run_due(self):
+        now = time.monotonic()
+        ready = []
+        with self.lock:
+            while self.heap and self.heap[0][0] <= now:
+                due, sequence, name = heapq.heappop(self.heap)
+                entry = self.entries.get(name)
+                if entry is None or entry[1] != sequence or name in self.in_flight:
+                    continue
+                ready.append((entry[0], due))
+        for widget, due in ready:
+            if widget.runs_in_background():
+                self._submit(widget)
+                continue
+            if widget.refreshes_asynchronously():
+                self._start_async(widget)
+                continue
+            try:
+                widget.refresh(self.app)
+            except Exception as e:
+                print(f"{widget.widget_name} refresh error: {e}")
+            interval = widget.get_refresh_interval() / 1000.0
+            with self.lock:
+                # Keep a steady cadence from the due time, but never try to catch up missed ticks.
+                self._push(widget.widget_name, max(due + interval, time.monotonic()))
+        self._arm()
+
+    def _arm(self):
+        with self.lock:
+            next_due = self.heap[0][0] if self.heap else None
+        if next_due is None:
+            delay_ms = self.MAX_SLEEP_MS
+        else:
+            delay_ms = int(max(0.0, next_due - time.monotonic()) * 1000)
+        self.timer.start(min(delay_ms, self.MAX_SLEEP_MS))
+
+    def _submit(self, widget):
+        with self.lock:
+            self.in_flight.add(widget.widget_name)
+            # In-flight counts queued and running jobs, so more of them than workers means one is waiting.
+            if len(self.workers) < self.max_workers and len(self.in_flight) > len(self.workers):
+                thread = threading.Thread(target=self._worker_loop, name=f"widget-refresh-{len(self.workers)}")
+                thread.daemon = True
+                self.workers.append(thread)
+                thread.start()
+        self.jobs.put(widget)
+
+    def _start_async(self, widget):
+        with self.lock:
+            self.in_flight.add(widget.widget_name)
+        started = time.monotonic()
+        finished = []
+
+        def done():
+            # Tolerates a second call so a widget's error path cannot reschedule it twice.
+            if not finished:
+                finished.append(True)
+                self._finish(widget, started)
+
+        try:
+            widget._update_text_async(self.app, done)
+        except Exception as e:
+            print(f"{widget.widget_name} refresh error: {e}")
+            done()
+
+    def _worker_loop(self):
+        while True:
+            widget = self.jobs.get()
+            started = time.monotonic()
+            try:
+                widget.refresh(self.app)
+            except Exception as e:
+                print(f"{widget.widget_name} refresh error: {e}")
+            self._finish(widget, started)
+
+    def _finish(self, widget, started):
+        name = widget.widget_name
+        interval = widget.get_refresh_interval() / 1000.0
+        with self.lock:
+            self.in_flight.discard(name)
+            rerun = name in self.rerun_requested
+            self.rerun_requested.discard(name)
+            entry = self.entries.get(name)
+            if entry is None:
+                return
+            if rerun or entry[0] is not widget:
+                # Widgets were reloaded or a refresh was asked for mid-flight.
+                self._push(name, time.monotonic())
+            else:
+                self._push(name, max(started + interval, time.monotonic()))
+
+    def get_stats(self):
+        with self.lock:
+            return {
+                "scheduled": len(self.entries),
+                "in_flight": len(self.in_flight),
+                "queued": self.jobs.qsize(),
+                "workers": len(self.workers),
+            }
+
 class WidgetManager:
     def __init__(self, app, config):
         self.app = app
         self.config = config
         self.widgets = {}
+        self.scheduler = RefreshScheduler(app)
         self.load_widgets()
 
     def load_widgets(self):
+        self.stop_updates()
         self.widgets = {}
         active = list(self.config.get("widget_positions", {}).keys())
 
@@ -1674,24 +2855,31 @@ class WidgetManager:
 
     def start_updates(self, app):
         for widget in self.widgets.values():
-            widget.update(app)
+            self.scheduler.register(widget)
+        # Local widgets get their first text before the next paint, as they always have.
+        self.scheduler.run_due()
 
     def stop_updates(self):
-        for widget in self.widgets.values():
-            try:
-                if widget.update_timer and hasattr(widget.update_timer, "stop"):
-                    widget.update_timer.stop()
-            except Exception as e:
-                print("stop_updates error:", e)
+        self.scheduler.clear()
 
     def restart_updates(self):
-        self.stop_updates()
-        self.start_updates(self.app)
+        # Widgets still refreshing are rerun as soon as they finish instead of being queued twice.
+        self.scheduler.request_refresh()
+
+    def invalidate_render_caches(self):
+        for widget in self.widgets.values():
+            widget.invalidate_render_cache()
 
-    def draw_all(self, painter, app):
+    def draw_all(self, painter, app, clip_rect=None):
         for widget_name in app.get_sorted_widget_names():
             if not app.widget_is_visible(widget_name):
                 continue
             w = self.widgets.get(widget_name)
             if w:
+                if clip_rect is not None and w.painted_rect is not None and not w.painted_rect.adjusted(-2, -2, 2, 2).intersects(clip_rect):
+                    # Outside the damaged area; its last painted pixels are still on screen.
+                    continue
+                w.painted_rect = None
+                started = time.perf_counter()
                 w.draw(painter, app)
+                app.render_profiler.record(f"widget:{widget_name}", time.perf_counter() - started)